@@ -0,0 +1,38 @@
+"""Float kernels for Uniswap V3 price math.
+
+Decimal arithmetic on sqrtPriceX96 values is orders of magnitude slower than
+native floats. A uint160 sqrtPriceX96 squares to at most 2**128 once scaled by
+2**-192, well inside the double range, so these kernels trade the exact
+Decimal result for a 53-bit mantissa that is ample for analytics.
+"""
+
+from math import ldexp
+from typing import List, Sequence
+
+
+def price_from_sqrt_x96(sqrt_price_x96: int) -> float:
+    """Convert a sqrtPriceX96 value into a token1/token0 price."""
+    # ldexp scales by a power of two exactly, so only the int -> float
+    # conversion rounds
+    return ldexp(float(sqrt_price_x96), -96) ** 2
+
+
+def price_impact(current_price: float, amount_in: float, amount_out: float) -> float:
+    """Relative difference between a swap's execution price and the pool price."""
+    if amount_in == 0 or current_price == 0:
+        return 0.0
+    return abs((amount_out / amount_in - current_price) / current_price)
+
+
+def price_impact_batch(
+    sqrt_prices_x96: Sequence[int],
+    amounts_in: Sequence[float],
+    amounts_out: Sequence[float],
+) -> List[float]:
+    """Calculate price_impact for parallel arrays of pool prices and swaps."""
+    return [
+        price_impact(price_from_sqrt_x96(sqrt_price_x96), amount_in, amount_out)
+        for sqrt_price_x96, amount_in, amount_out in zip(
+            sqrt_prices_x96, amounts_in, amounts_out
+        )
+    ]
@@ -3,6 +3,7 @@ from typing import List, Dict, Any, Optional, Tuple
 from decimal import Decimal
 from eth_typing import HexStr
 from web3 import Web3
+from web3.exceptions import Web3Exception
 from web3.types import LogReceipt
 
 from mev_tools_py.dex.models import SwapEvent, LiquidityPool, LiquidityEvent
@@ -13,6 +14,10 @@ class BaseDexReader(ABC):
 
     protocol: str
 
+    # Errors that mean a matched log could not be decoded, e.g. malformed data
+    # or an emitter that is not a real pool. Log scans skip such logs.
+    DECODE_ERRORS = (ValueError, KeyError, Web3Exception)
+
     def __init__(self, w3: Web3, router_address: Optional[str] = None):
         self.w3 = w3
         self.router_address = router_address
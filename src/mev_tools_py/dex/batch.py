@@ -0,0 +1,187 @@
+"""Batched analytics helpers operating on whole blocks of swaps at once."""
+
+from array import array
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+from mev_tools_py.dex.models import SwapEvent, LiquidityPool
+
+
+class SwapBatch:
+    """Columnar (struct of arrays) view of a list of swaps.
+
+    Each column is a typed array holding one value per swap, so block level
+    scans walk contiguous machine values instead of chasing SwapEvent objects.
+    Pool, trader and token addresses are lowercased and interned into
+    address_table; the *_idx columns hold positions in that table. The source
+    events are kept so to_events() round-trips without loss.
+    """
+
+    def __init__(self) -> None:
+        self.block_number = array("q")
+        self.log_index = array("q")
+        self.amount_in = array("d")
+        self.amount_out = array("d")
+        self.pool_idx = array("i")
+        self.trader_idx = array("i")
+        self.token_in_idx = array("i")
+        self.token_out_idx = array("i")
+        self.address_table: List[str] = []
+        self.address_ids: Dict[str, int] = {}
+        self.events: List[SwapEvent] = []
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    @classmethod
+    def from_events(cls, events: Sequence[SwapEvent]) -> "SwapBatch":
+        """Build a batch from swap events, preserving their order."""
+        batch = cls()
+        for event in events:
+            batch.append(event)
+        return batch
+
+    def to_events(self) -> List[SwapEvent]:
+        """Return the swaps as SwapEvent objects in batch order."""
+        return list(self.events)
+
+    def append(self, event: SwapEvent) -> None:
+        """Add a swap to the end of the batch."""
+        self.block_number.append(event.block_number)
+        self.log_index.append(event.log_index)
+        self.amount_in.append(float(event.amount_in))
+        self.amount_out.append(float(event.amount_out))
+        self.pool_idx.append(self.intern(event.pool_address))
+        self.trader_idx.append(self.intern(event.trader))
+        self.token_in_idx.append(self.intern(event.token_in.address))
+        self.token_out_idx.append(self.intern(event.token_out.address))
+        self.events.append(event)
+
+    def token_pair(self, k: int) -> Tuple[str, str]:
+        """Return swap k's lowercased token pair in sorted order, like
+        sandwich.utils.identify_token_pair but without lowercasing again."""
+        token_in = self.address_table[self.token_in_idx[k]]
+        token_out = self.address_table[self.token_out_idx[k]]
+        return (token_in, token_out) if token_in < token_out else (token_out, token_in)
+
+    def intern(self, address: str) -> int:
+        """Return the address table id for an address, adding it if unseen."""
+        address = address.lower()
+        address_id = self.address_ids.get(address)
+        if address_id is None:
+            address_id = self.address_ids[address] = len(self.address_table)
+            self.address_table.append(address)
+        return address_id
+
+
+class SwapLogColumns:
+    """Columnar view of the raw Uniswap V3 Swap logs of a block.
+
+    Unlike SwapBatch this keeps the undecimalized event values, including the
+    pool price and liquidity after each swap, for analytics that work directly
+    on amounts and sqrtPriceX96. Amounts, sqrt_price_x96 and liquidity can
+    exceed 64 bits, so they are plain int lists; log_index and tick are typed
+    arrays.
+    """
+
+    def __init__(self, block_number: int) -> None:
+        self.block_number = block_number
+        self.pool: List[str] = []
+        self.tx_hash: List[str] = []
+        self.log_index = array("q")
+        self.amount0: List[int] = []
+        self.amount1: List[int] = []
+        self.sqrt_price_x96: List[int] = []
+        self.liquidity: List[int] = []
+        self.tick = array("i")
+
+    def __len__(self) -> int:
+        return len(self.log_index)
+
+    def append(
+        self,
+        pool: str,
+        tx_hash: str,
+        log_index: int,
+        amount0: int,
+        amount1: int,
+        sqrt_price_x96: int,
+        liquidity: int,
+        tick: int,
+    ) -> None:
+        """Add a decoded Swap log to the end of the columns."""
+        self.pool.append(pool)
+        self.tx_hash.append(tx_hash)
+        self.log_index.append(log_index)
+        self.amount0.append(amount0)
+        self.amount1.append(amount1)
+        self.sqrt_price_x96.append(sqrt_price_x96)
+        self.liquidity.append(liquidity)
+        self.tick.append(tick)
+
+    def to_rows(self) -> List[Tuple[str, str, int, int, int, int, int, int]]:
+        """Return one (pool, tx_hash, log_index, amount0, amount1,
+        sqrt_price_x96, liquidity, tick) tuple per swap in column order."""
+        return list(
+            zip(
+                self.pool,
+                self.tx_hash,
+                self.log_index,
+                self.amount0,
+                self.amount1,
+                self.sqrt_price_x96,
+                self.liquidity,
+                self.tick,
+            )
+        )
+
+
+def price_impact_batch(
+    reserve_in: Sequence[float],
+    reserve_out: Sequence[float],
+    amount_in: Sequence[float],
+) -> List[float]:
+    """Calculate constant product price impact for parallel arrays of swaps.
+
+    Equivalent to UniswapV2Reader.calculate_price_impact per element. For a
+    constant product pool the execution price is y / (x + dx), so the impact
+    relative to the spot price y / x reduces to dx / (x + dx).
+    """
+    return [
+        dx / (x + dx) if x > 0 and y > 0 and dx > 0 else 0.0
+        for x, y, dx in zip(reserve_in, reserve_out, amount_in)
+    ]
+
+
+def extract_price_impact_inputs(
+    swaps: Sequence[SwapEvent], pools: Mapping[str, LiquidityPool]
+) -> Tuple[List[float], List[float], List[float]]:
+    """Build (reserve_in, reserve_out, amount_in) float arrays for a list of swaps.
+
+    Pools are looked up by the swap's pool_address; swaps whose pool is missing
+    get zero reserves, which price_impact_batch maps to a zero impact.
+    """
+    reserve_in = []
+    reserve_out = []
+    amount_in = []
+
+    for swap in swaps:
+        pool = pools.get(swap.pool_address)
+        if pool is None:
+            reserve_in.append(0.0)
+            reserve_out.append(0.0)
+        elif swap.token_in.address == pool.token0.address:
+            reserve_in.append(float(pool.reserve0))
+            reserve_out.append(float(pool.reserve1))
+        else:
+            reserve_in.append(float(pool.reserve1))
+            reserve_out.append(float(pool.reserve0))
+        amount_in.append(float(swap.amount_in))
+
+    return reserve_in, reserve_out, amount_in
+
+
+def calculate_price_impacts(
+    swaps: Sequence[SwapEvent], pools: Mapping[str, LiquidityPool]
+) -> List[float]:
+    """Calculate the constant product price impact of every swap in a block."""
+    return price_impact_batch(*extract_price_impact_inputs(swaps, pools))
@@ -0,0 +1,158 @@
+"""Caches for immutable on-chain reads."""
+
+import sqlite3
+from collections import OrderedDict
+from threading import Lock
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+from weakref import WeakSet
+
+from web3 import Web3
+
+from mev_tools_py.dex.models import TokenInfo
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TwoLevelCache(Generic[K, V]):
+    """Cache with a small FIFO tip in front of a large LRU history.
+
+    New entries land in the tip, which holds the most recently fetched
+    results (typically blocks near the chain head). When the tip is full its
+    oldest entry is promoted into the LRU history, so repeated historical
+    lookups stay cached while recent, reorg-sensitive entries remain cheap
+    to find and drop.
+    """
+
+    def __init__(self, tip_size: int = 128, history_size: int = 65536):
+        self.tip_size = tip_size
+        self.history_size = history_size
+        self._tip: OrderedDict[K, V] = OrderedDict()
+        self._history: OrderedDict[K, V] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._tip) + len(self._history)
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the cached value for key, or None on a miss."""
+        value = self._tip.get(key)
+        if value is not None:
+            return value
+
+        value = self._history.get(key)
+        if value is not None:
+            self._history.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Store a value in the tip, promoting the oldest tip entry if full."""
+        self._history.pop(key, None)
+        self._tip[key] = value
+
+        if len(self._tip) > self.tip_size:
+            old_key, old_value = self._tip.popitem(last=False)
+            self._history[old_key] = old_value
+            if len(self._history) > self.history_size:
+                self._history.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._tip.clear()
+        self._history.clear()
+
+
+class TokenCache:
+    """SQLite backed store for token metadata and pool tokens across runs.
+
+    ERC20 symbol/decimals/name and a pool's token0/token1/fee never change,
+    so entries never expire. Rows are keyed by (chain_id, lowercased address)
+    so one database file can serve several chains; call check_chain before
+    serving a client so rows are never mixed across networks. Only
+    successful lookups should be stored; UNKNOWN placeholders are left to be
+    retried.
+    """
+
+    def __init__(self, path: str = ":memory:", *, chain_id: int):
+        self.chain_id = chain_id
+        self._lock = Lock()
+        # Clients already confirmed to be on chain_id
+        self._checked_clients: WeakSet[Web3] = WeakSet()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tokens ("
+                "chain_id INTEGER, address TEXT, checksum_address TEXT, "
+                "symbol TEXT, decimals INTEGER, name TEXT, "
+                "PRIMARY KEY (chain_id, address))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pools ("
+                "chain_id INTEGER, address TEXT, token0 TEXT, token1 TEXT, "
+                "fee INTEGER, PRIMARY KEY (chain_id, address))"
+            )
+
+    def check_chain(self, w3: Web3) -> None:
+        """Raise ValueError unless w3 is connected to this cache's chain.
+
+        The chain id is queried once per client.
+        """
+        if w3 in self._checked_clients:
+            return
+        chain_id = w3.eth.chain_id
+        if chain_id != self.chain_id:
+            raise ValueError(
+                f"TokenCache for chain {self.chain_id} used with a client "
+                f"on chain {chain_id}"
+            )
+        self._checked_clients.add(w3)
+
+    def get_token(self, address: str) -> Optional[TokenInfo]:
+        """Return the stored metadata for a token, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT checksum_address, symbol, decimals, name FROM tokens "
+                "WHERE chain_id = ? AND address = ?",
+                (self.chain_id, address.lower()),
+            ).fetchone()
+        return TokenInfo(*row) if row is not None else None
+
+    def put_token(self, token_info: TokenInfo) -> None:
+        """Store the metadata of a token."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tokens VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    self.chain_id,
+                    token_info.address.lower(),
+                    token_info.address,
+                    token_info.symbol,
+                    token_info.decimals,
+                    token_info.name,
+                ),
+            )
+
+    def get_pool(self, address: str) -> Optional[Tuple[str, str, Optional[int]]]:
+        """Return the stored (token0, token1, fee) of a pool, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT token0, token1, fee FROM pools "
+                "WHERE chain_id = ? AND address = ?",
+                (self.chain_id, address.lower()),
+            ).fetchone()
+        return (row[0], row[1], row[2]) if row is not None else None
+
+    def put_pool(
+        self, address: str, token0: str, token1: str, fee: Optional[int] = None
+    ) -> None:
+        """Store the token addresses, and the fee tier if any, of a pool."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pools VALUES (?, ?, ?, ?, ?)",
+                (self.chain_id, address.lower(), token0, token1, fee),
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -4,7 +4,7 @@ from decimal import Decimal
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TokenInfo:
     address: str
     symbol: str
@@ -12,7 +12,7 @@ class TokenInfo:
     name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SwapEvent:
     tx_hash: str
     block_number: int
@@ -29,7 +29,7 @@ class SwapEvent:
     timestamp: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LiquidityPool:
     address: str
     dex_protocol: str
@@ -43,7 +43,7 @@ class LiquidityPool:
     sqrt_price_x96: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LiquidityEvent:
     tx_hash: str
     block_number: int
@@ -58,7 +58,7 @@ class LiquidityEvent:
     timestamp: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ArbitrageOpportunity:
     token_pair: tuple[str, str]
     dex_protocols: List[str]
@@ -68,7 +68,7 @@ class ArbitrageOpportunity:
     gas_cost_estimate: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VolumeStatistics:
     pool_address: str
     dex_protocol: str
@@ -0,0 +1,113 @@
+"""Multicall3 helpers for batching read-only contract calls into a single eth_call."""
+
+from typing import List, Optional, Sequence, Tuple
+
+from eth_abi import decode, encode
+from eth_abi.exceptions import DecodingError, EncodingError
+from web3 import Web3
+from web3.exceptions import Web3Exception
+from web3.types import BlockIdentifier
+
+# Multicall3 is deployed at the same address on mainnet and most EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# aggregate3((address target, bool allowFailure, bytes callData)[])
+AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")
+
+# Uniswap pair/pool selectors
+TOKEN0_SELECTOR = bytes.fromhex("0dfe1681")
+TOKEN1_SELECTOR = bytes.fromhex("d21220a7")
+GET_RESERVES_SELECTOR = bytes.fromhex("0902f1ac")
+FEE_SELECTOR = bytes.fromhex("ddca3f43")
+
+# ERC20 metadata selectors
+NAME_SELECTOR = bytes.fromhex("06fdde03")
+SYMBOL_SELECTOR = bytes.fromhex("95d89b41")
+DECIMALS_SELECTOR = bytes.fromhex("313ce567")
+TOTAL_SUPPLY_SELECTOR = bytes.fromhex("18160ddd")
+
+# Keep individual eth_call payloads well below common node gas/size limits
+DEFAULT_BATCH_SIZE = 500
+
+# What multicall can raise: RPC and transport failures, an unencodable call,
+# or return data that is not a valid aggregate3 result
+MULTICALL_ERRORS = (Web3Exception, OSError, ValueError, EncodingError, DecodingError)
+
+Call = Tuple[str, bytes]
+CallResult = Tuple[bool, bytes]
+
+
+def encode_aggregate3(calls: Sequence[Call]) -> bytes:
+    """Encode (target, calldata) pairs as an aggregate3 call that tolerates failures."""
+    return AGGREGATE3_SELECTOR + encode(
+        ["(address,bool,bytes)[]"],
+        [[(target, True, call_data) for target, call_data in calls]],
+    )
+
+
+def decode_aggregate3(data: bytes) -> List[CallResult]:
+    """Decode the (success, returnData) tuples returned by aggregate3."""
+    (results,) = decode(["(bool,bytes)[]"], data)
+    return [(bool(success), bytes(return_data)) for success, return_data in results]
+
+
+def call(
+    w3: Web3,
+    target: str,
+    call_data: bytes,
+    block_identifier: Optional[BlockIdentifier] = None,
+) -> bytes:
+    """Execute a single raw eth_call, bypassing web3 contract ABI handling."""
+    return bytes(
+        w3.eth.call(
+            {"to": target, "data": call_data},
+            block_identifier if block_identifier is not None else "latest",
+        )
+    )
+
+
+def multicall(
+    w3: Web3,
+    calls: Sequence[Call],
+    block_identifier: Optional[BlockIdentifier] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> List[CallResult]:
+    """Execute calls through Multicall3, one eth_call per batch_size calls.
+
+    Results are returned in the same order as calls. Individual call failures
+    are reported as (False, revert_data) instead of raising.
+    """
+    results: List[CallResult] = []
+
+    for start in range(0, len(calls), batch_size):
+        batch = calls[start : start + batch_size]
+        raw = w3.eth.call(
+            {"to": MULTICALL3_ADDRESS, "data": encode_aggregate3(batch)},
+            block_identifier if block_identifier is not None else "latest",
+        )
+        results.extend(decode_aggregate3(raw))
+
+    return results
+
+
+def decode_address_result(data: bytes) -> str:
+    """Decode an ABI-encoded address return value into a checksum address."""
+    if len(data) < 32:
+        raise ValueError("Return data too short for an address")
+    return Web3.to_checksum_address(data[12:32])
+
+
+def decode_uint_result(data: bytes) -> int:
+    """Decode an ABI-encoded unsigned integer return value."""
+    if len(data) < 32:
+        raise ValueError("Return data too short for a uint")
+    return int.from_bytes(data[:32], "big")
+
+
+def decode_string_result(data: bytes) -> str:
+    """Decode a string return value, accepting legacy bytes32 tokens (e.g. MKR)."""
+    if len(data) == 32:
+        return data.rstrip(b"\x00").decode("utf-8", errors="replace")
+
+    (value,) = decode(["string"], data)
+    return value
@@ -1,15 +1,33 @@
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Literal, Optional, Tuple, Union, overload
 from decimal import Decimal
 from web3 import Web3
-from web3.types import LogReceipt
+from web3.types import BlockIdentifier, FilterParams, LogReceipt
 from eth_typing import HexStr
 
 from mev_tools_py.dex.base import BaseDexReader
-from mev_tools_py.dex.models import SwapEvent, LiquidityPool, LiquidityEvent
+from mev_tools_py.dex.batch import SwapBatch
+from mev_tools_py.dex.cache import TokenCache, TwoLevelCache
+from mev_tools_py.dex.models import (
+    SwapEvent,
+    LiquidityPool,
+    LiquidityEvent,
+    TokenInfo,
+)
+from mev_tools_py.dex.multicall import (
+    GET_RESERVES_SELECTOR,
+    MULTICALL_ERRORS,
+    TOTAL_SUPPLY_SELECTOR,
+    call,
+    decode_uint_result,
+)
 from mev_tools_py.dex.utils import (
     wei_to_decimal,
     get_token_info,
+    get_pools_token_infos,
+    get_pool_tokens,
     sort_tokens,
+    intern_address,
+    WETH_ADDRESS,
 )
 
 
@@ -28,10 +46,34 @@ class UniswapV2Reader(BaseDexReader):
         "0xdccd412f0b1252819cb1fd330b93224ca42612892bb3f4f789976e6d81936496"
     )
 
+    # Raw topic0 values so logs are matched with a 32-byte compare instead of
+    # hex encoding every topic
+    SWAP_SIG_BYTES = bytes.fromhex(SWAP_EVENT_SIGNATURE[2:])
+    MINT_SIG_BYTES = bytes.fromhex(MINT_EVENT_SIGNATURE[2:])
+    BURN_SIG_BYTES = bytes.fromhex(BURN_EVENT_SIGNATURE[2:])
+
     FACTORY_ADDRESS = "0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f"
 
-    def __init__(self, w3: Web3, factory_address: Optional[str] = None):
+    def __init__(
+        self,
+        w3: Web3,
+        factory_address: Optional[str] = None,
+        token_cache: Optional[TokenCache] = None,
+    ):
         super().__init__(w3, factory_address or self.FACTORY_ADDRESS)
+        # Optional persistent store so pool and token metadata survive restarts
+        if token_cache is not None:
+            token_cache.check_chain(w3)
+        self._token_cache = token_cache
+        # Pool token metadata is immutable, so it is resolved once per pool,
+        # keyed by lowercased pool address
+        self._pool_token_cache: Dict[str, Tuple[TokenInfo, TokenInfo]] = {}
+        # A deployed pair's address never changes, keyed by sorted token pair
+        self._pair_address_cache: Dict[Tuple[str, str], str] = {}
+        # Reserves at a given block never change once the block is final
+        self._reserves_cache: TwoLevelCache[
+            Tuple[str, int], Tuple[Decimal, Decimal]
+        ] = TwoLevelCache()
         self._factory_abi = [
             {
                 "constant": True,
@@ -45,61 +87,22 @@ class UniswapV2Reader(BaseDexReader):
             }
         ]
 
-        self._pair_abi = [
-            {
-                "constant": True,
-                "inputs": [],
-                "name": "getReserves",
-                "outputs": [
-                    {"name": "_reserve0", "type": "uint112"},
-                    {"name": "_reserve1", "type": "uint112"},
-                    {"name": "_blockTimestampLast", "type": "uint32"},
-                ],
-                "type": "function",
-            },
-            {
-                "constant": True,
-                "inputs": [],
-                "name": "token0",
-                "outputs": [{"name": "", "type": "address"}],
-                "type": "function",
-            },
-            {
-                "constant": True,
-                "inputs": [],
-                "name": "token1",
-                "outputs": [{"name": "", "type": "address"}],
-                "type": "function",
-            },
-            {
-                "constant": True,
-                "inputs": [],
-                "name": "totalSupply",
-                "outputs": [{"name": "", "type": "uint256"}],
-                "type": "function",
-            },
-        ]
-
     def decode_swap_event(self, log: LogReceipt) -> SwapEvent:
         """Decode Uniswap V2 Swap event."""
-        if log["topics"][0].hex() != self.SWAP_EVENT_SIGNATURE:
+        if log["topics"][0] != self.SWAP_SIG_BYTES:
             raise ValueError("Not a Swap event")
 
-        to = "0x" + log["topics"][2].hex()[-40:]
-        pool_address = log["address"]
+        to = intern_address("0x" + log["topics"][2][-20:].hex())
+        pool_address = intern_address(log["address"])
 
-        data = log["data"]
+        # Slice a memoryview so each 32-byte word is read without copying
+        data = memoryview(log["data"])
         amount0_in = int.from_bytes(data[0:32], "big")
         amount1_in = int.from_bytes(data[32:64], "big")
         amount0_out = int.from_bytes(data[64:96], "big")
         amount1_out = int.from_bytes(data[96:128], "big")
 
-        pair_contract = self.w3.eth.contract(address=pool_address, abi=self._pair_abi)
-        token0_address = pair_contract.functions.token0().call()
-        token1_address = pair_contract.functions.token1().call()
-
-        token0_info = get_token_info(self.w3, token0_address)
-        token1_info = get_token_info(self.w3, token1_address)
+        token0_info, token1_info = self._pool_tokens(pool_address)
 
         if amount0_in > 0:
             token_in = token0_info
@@ -113,7 +116,7 @@ class UniswapV2Reader(BaseDexReader):
             amount_out = wei_to_decimal(amount0_out, token0_info.decimals)
 
         return SwapEvent(
-            tx_hash=log["transactionHash"].hex(),
+            tx_hash="0x" + log["transactionHash"].hex(),
             block_number=log["blockNumber"],
             log_index=log["logIndex"],
             dex_protocol=self.protocol,
@@ -128,46 +131,118 @@ class UniswapV2Reader(BaseDexReader):
     def get_swaps_from_transaction(self, tx_hash: HexStr) -> List[SwapEvent]:
         """Extract all Uniswap V2 swap events from a transaction."""
         receipt = self.w3.eth.get_transaction_receipt(tx_hash)
-        swaps = []
+        return self._decode_swap_logs(receipt["logs"])
+
+    @overload
+    def get_swaps_from_block(
+        self, block_number: int, as_batch: Literal[False] = ...
+    ) -> List[SwapEvent]: ...
+
+    @overload
+    def get_swaps_from_block(
+        self, block_number: int, as_batch: Literal[True]
+    ) -> SwapBatch: ...
+
+    def get_swaps_from_block(
+        self, block_number: int, as_batch: bool = False
+    ) -> Union[List[SwapEvent], SwapBatch]:
+        """Extract all Uniswap V2 swap events from a block.
+
+        With as_batch=True the swaps are returned as a columnar SwapBatch.
+        """
+        # A topic filter returns exactly the block's Swap logs in one request
+        logs = self.w3.eth.get_logs(
+            {
+                "fromBlock": block_number,
+                "toBlock": block_number,
+                "topics": [self.SWAP_EVENT_SIGNATURE],
+            }
+        )
+
+        swaps = self._decode_swap_logs(logs)
+        return SwapBatch.from_events(swaps) if as_batch else swaps
+
+    def _decode_swap_logs(self, logs: Iterable[LogReceipt]) -> List[SwapEvent]:
+        """Decode swap logs, resolving all of their pools in one batch first."""
+        swap_logs = [
+            log
+            for log in logs
+            if log["topics"] and log["topics"][0] == self.SWAP_SIG_BYTES
+        ]
+
+        self._prefetch_pools(log["address"] for log in swap_logs)
 
-        for log in receipt["logs"]:
+        swaps = []
+        for log in swap_logs:
             try:
-                if log["topics"][0].hex() == self.SWAP_EVENT_SIGNATURE:
-                    swap = self.decode_swap_event(log)
-                    swaps.append(swap)
-            except Exception:
+                swaps.append(self.decode_swap_event(log))
+            except self.DECODE_ERRORS:
                 continue
 
         return swaps
 
-    def get_swaps_from_block(self, block_number: int) -> List[SwapEvent]:
-        """Extract all Uniswap V2 swap events from a block."""
-        block = self.w3.eth.get_block(block_number, full_transactions=True)
-        swaps = []
-
-        if not block or "transactions" not in block:
-            return swaps
+    def _prefetch_pools(self, pool_addresses: Iterable[str]) -> None:
+        """Resolve token0/token1 metadata for unseen pools via Multicall3.
+
+        Issues one multicall for the pools' token0()/token1() and one for the
+        ERC20 metadata of the returned tokens, regardless of the pool count.
+        Pools that cannot be resolved this way are left uncached so that
+        _pool_tokens falls back to direct contract calls.
+        """
+        pools = {
+            pool.lower(): pool
+            for pool in pool_addresses
+            if pool.lower() not in self._pool_token_cache
+        }
+        if not pools:
+            return
 
-        for tx in block["transactions"]:
-            tx_swaps = self.get_swaps_from_transaction(tx["hash"].hex())
-            swaps.extend(tx_swaps)
+        try:
+            pool_tokens = get_pools_token_infos(
+                self.w3, pools.values(), self._token_cache
+            )
+        except MULTICALL_ERRORS:
+            return
+        for pool, tokens in pool_tokens.items():
+            self._pool_token_cache[pool.lower()] = tokens
+
+    def _pool_tokens(self, pool_address: str) -> Tuple[TokenInfo, TokenInfo]:
+        """Get (token0, token1) info for a pool, fetching and caching on a miss."""
+        key = pool_address.lower()
+        cached = self._pool_token_cache.get(key)
+        if cached is not None:
+            return cached
+
+        self._prefetch_pools([pool_address])
+        cached = self._pool_token_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Multicall3 unavailable for this pool, query the pair directly
+        token0_address, token1_address = get_pool_tokens(self.w3, pool_address)
+
+        pool_tokens = (
+            get_token_info(self.w3, token0_address, self._token_cache),
+            get_token_info(self.w3, token1_address, self._token_cache),
+        )
+        self._pool_token_cache[key] = pool_tokens
 
-        return swaps
+        return pool_tokens
 
     def get_pool_info(self, pool_address: str) -> LiquidityPool:
         """Get Uniswap V2 pool information."""
-        pair_contract = self.w3.eth.contract(
-            address=Web3.to_checksum_address(pool_address),
-            abi=self._pair_abi,
-        )
+        pair_address = Web3.to_checksum_address(pool_address)
 
-        token0_address = pair_contract.functions.token0().call()
-        token1_address = pair_contract.functions.token1().call()
-        reserves = pair_contract.functions.getReserves().call()
-        total_supply = pair_contract.functions.totalSupply().call()
+        token0_address, token1_address = get_pool_tokens(self.w3, pool_address)
+        reserves = self._decode_reserves(
+            call(self.w3, pair_address, GET_RESERVES_SELECTOR)
+        )
+        total_supply = decode_uint_result(
+            call(self.w3, pair_address, TOTAL_SUPPLY_SELECTOR)
+        )
 
-        token0_info = get_token_info(self.w3, token0_address)
-        token1_info = get_token_info(self.w3, token1_address)
+        token0_info = get_token_info(self.w3, token0_address, self._token_cache)
+        token1_info = get_token_info(self.w3, token1_address, self._token_cache)
 
         return LiquidityPool(
             address=pool_address,
@@ -183,20 +258,36 @@ class UniswapV2Reader(BaseDexReader):
     def get_pool_reserves_at_block(
         self, pool_address: str, block_number: int
     ) -> Tuple[Decimal, Decimal]:
-        """Get pool reserves at a specific block."""
-        pair_contract = self.w3.eth.contract(
-            address=Web3.to_checksum_address(pool_address),
-            abi=self._pair_abi,
-        )
+        """Get pool reserves at a specific block.
 
-        token0_address = pair_contract.functions.token0().call()
-        token1_address = pair_contract.functions.token1().call()
+        Results are cached per (pool, block); see clear_reserves_cache.
+        """
+        cache_key = (pool_address.lower(), block_number)
+        cached = self._reserves_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        token0_info = get_token_info(self.w3, token0_address)
-        token1_info = get_token_info(self.w3, token1_address)
+        result = self._fetch_reserves(pool_address, block_number)
+        self._reserves_cache.put(cache_key, result)
 
-        reserves = pair_contract.functions.getReserves().call(
-            block_identifier=block_number
+        return result
+
+    def _fetch_reserves(
+        self, pool_address: str, block_identifier: BlockIdentifier
+    ) -> Tuple[Decimal, Decimal]:
+        """Read getReserves() and scale both reserves by their token decimals."""
+        token0_address, token1_address = get_pool_tokens(self.w3, pool_address)
+
+        token0_info = get_token_info(self.w3, token0_address, self._token_cache)
+        token1_info = get_token_info(self.w3, token1_address, self._token_cache)
+
+        reserves = self._decode_reserves(
+            call(
+                self.w3,
+                Web3.to_checksum_address(pool_address),
+                GET_RESERVES_SELECTOR,
+                block_identifier,
+            )
         )
 
         return (
@@ -204,55 +295,68 @@ class UniswapV2Reader(BaseDexReader):
             wei_to_decimal(reserves[1], token1_info.decimals),
         )
 
+    def clear_reserves_cache(self) -> None:
+        """Forget cached historical reserves, e.g. after a chain reorg."""
+        self._reserves_cache.clear()
+
+    @staticmethod
+    def _decode_reserves(data: bytes) -> Tuple[int, int]:
+        """Decode (reserve0, reserve1) from getReserves() return data."""
+        if len(data) < 64:
+            raise ValueError("Return data too short for getReserves")
+        return int.from_bytes(data[0:32], "big"), int.from_bytes(data[32:64], "big")
+
     def find_pool_address(
         self, token0: str, token1: str, fee_tier: Optional[int] = None
     ) -> Optional[str]:
         """Find Uniswap V2 pool address for token pair."""
+        token0, token1 = sort_tokens(token0, token1)
+        pair = (token0.lower(), token1.lower())
+
+        # Only deployed pairs are cached, a missing one may be created later
+        cached = self._pair_address_cache.get(pair)
+        if cached is not None:
+            return cached
+
         # TODO: is this needed?
         factory_contract = self.w3.eth.contract(
             address=Web3.to_checksum_address(self.router_address),
             abi=self._factory_abi,
         )
 
-        token0, token1 = sort_tokens(token0, token1)
-
         try:
             pair_address = factory_contract.functions.getPair(token0, token1).call()
-            return (
-                pair_address
-                if not pair_address == "0x0000000000000000000000000000000000000000"
-                else None
-            )
         except Exception:
             return None
 
+        if pair_address == "0x0000000000000000000000000000000000000000":
+            return None
+
+        self._pair_address_cache[pair] = pair_address
+        return pair_address
+
     def decode_liquidity_event(self, log: LogReceipt) -> LiquidityEvent:
         """Decode Uniswap V2 Mint/Burn event."""
-        topic = log["topics"][0].hex()
+        topic = log["topics"][0]
 
-        if topic == self.MINT_EVENT_SIGNATURE:
+        if topic == self.MINT_SIG_BYTES:
             event_type = "mint"
-            sender = "0x" + log["topics"][1].hex()[-40:]
-        elif topic == self.BURN_EVENT_SIGNATURE:
+            sender = intern_address("0x" + log["topics"][1][-20:].hex())
+        elif topic == self.BURN_SIG_BYTES:
             event_type = "burn"
-            sender = "0x" + log["topics"][1].hex()[-40:]
+            sender = intern_address("0x" + log["topics"][1][-20:].hex())
         else:
             raise ValueError("Not a liquidity event")
 
-        pool_address = log["address"]
-        data = log["data"]
+        pool_address = intern_address(log["address"])
+        data = memoryview(log["data"])
         amount0 = int.from_bytes(data[0:32], "big")
         amount1 = int.from_bytes(data[32:64], "big")
 
-        pair_contract = self.w3.eth.contract(address=pool_address, abi=self._pair_abi)
-        token0_address = pair_contract.functions.token0().call()
-        token1_address = pair_contract.functions.token1().call()
-
-        token0_info = get_token_info(self.w3, token0_address)
-        token1_info = get_token_info(self.w3, token1_address)
+        token0_info, token1_info = self._pool_tokens(pool_address)
 
         return LiquidityEvent(
-            tx_hash=log["transactionHash"].hex(),
+            tx_hash="0x" + log["transactionHash"].hex(),
             block_number=log["blockNumber"],
             log_index=log["logIndex"],
             dex_protocol=self.protocol,
@@ -269,31 +373,65 @@ class UniswapV2Reader(BaseDexReader):
     ) -> List[LiquidityEvent]:
         """Extract all liquidity events from a transaction."""
         receipt = self.w3.eth.get_transaction_receipt(tx_hash)
-        events = []
+        return self._decode_liquidity_logs(receipt["logs"])
+
+    def get_liquidity_events_from_block(
+        self, block_number: int, pool_address: Optional[str] = None
+    ) -> List[LiquidityEvent]:
+        """Extract all Uniswap V2 liquidity events from a block.
+
+        Mint and Burn are matched with a single OR topic filter, optionally
+        restricted to one pool, so the node can skip unrelated logs.
+        """
+        log_filter: FilterParams = {
+            "fromBlock": block_number,
+            "toBlock": block_number,
+            "topics": [[self.MINT_EVENT_SIGNATURE, self.BURN_EVENT_SIGNATURE]],
+        }
+        if pool_address is not None:
+            log_filter["address"] = Web3.to_checksum_address(pool_address)
+
+        return self._decode_liquidity_logs(self.w3.eth.get_logs(log_filter))
+
+    def _decode_liquidity_logs(
+        self, logs: Iterable[LogReceipt]
+    ) -> List[LiquidityEvent]:
+        """Decode Mint/Burn logs, resolving all of their pools in one batch first."""
+        liquidity_logs = [
+            log
+            for log in logs
+            if log["topics"]
+            and (
+                log["topics"][0] == self.MINT_SIG_BYTES
+                or log["topics"][0] == self.BURN_SIG_BYTES
+            )
+        ]
+
+        self._prefetch_pools(log["address"] for log in liquidity_logs)
 
-        for log in receipt["logs"]:
+        events = []
+        for log in liquidity_logs:
             try:
-                topic = log["topics"][0].to_0x_hex()
-                if topic in [self.MINT_EVENT_SIGNATURE, self.BURN_EVENT_SIGNATURE]:
-                    event = self.decode_liquidity_event(log)
-                    events.append(event)
-            except Exception:
+                events.append(self.decode_liquidity_event(log))
+            except self.DECODE_ERRORS:
                 continue
 
         return events
 
     def calculate_price_impact(self, swap: SwapEvent, pool: LiquidityPool) -> Decimal:
         """Calculate price impact using constant product formula."""
+        # The impact is a heuristic ratio, so native floats are precise enough
+        # and avoid Decimal's per-operation allocation cost
         if swap.token_in.address == pool.token0.address:
-            x = pool.reserve0
-            y = pool.reserve1
-            dx = swap.amount_in
+            x = float(pool.reserve0)
+            y = float(pool.reserve1)
+            dx = float(swap.amount_in)
         else:
-            x = pool.reserve1
-            y = pool.reserve0
-            dx = swap.amount_in
+            x = float(pool.reserve1)
+            y = float(pool.reserve0)
+            dx = float(swap.amount_in)
 
-        if x == 0 or y == 0:
+        if x == 0 or y == 0 or dx == 0:
             return Decimal(0)
 
         price_before = y / x
@@ -308,32 +446,33 @@ class UniswapV2Reader(BaseDexReader):
         if price_before == 0:
             return Decimal(0)
 
-        return abs((price_after - price_before) / price_before)
+        return Decimal(repr(abs((price_after - price_before) / price_before)))
 
     def get_token_price(
         self, token_address: str, block_number: Optional[int] = None
     ) -> Optional[Decimal]:
         """Get token price in ETH."""
-        weth_address = "0xC02aaA39b223FE8d0A0e5C4F27eAD9083C756Cc2"
-
-        pool_address = self.find_pool_address(token_address, weth_address)
+        pool_address = self.find_pool_address(token_address, WETH_ADDRESS)
         if not pool_address:
             return None
 
         try:
+            # Only token0 and the reserves are needed, so skip the total
+            # supply read get_pool_info would issue
+            token0_address, _ = get_pool_tokens(self.w3, pool_address)
             if block_number:
                 reserve0, reserve1 = self.get_pool_reserves_at_block(
                     pool_address, block_number
                 )
-                pool = self.get_pool_info(pool_address)
             else:
-                pool = self.get_pool_info(pool_address)
-                reserve0, reserve1 = pool.reserve0, pool.reserve1
+                reserve0, reserve1 = self._fetch_reserves(pool_address, "latest")
 
-            if pool.token0.address.lower() == token_address.lower():
-                return reserve1 / reserve0 if reserve0 > 0 else Decimal(0)
+            if token0_address.lower() == token_address.lower():
+                base, quote = float(reserve0), float(reserve1)
             else:
-                return reserve0 / reserve1 if reserve1 > 0 else Decimal(0)
+                base, quote = float(reserve1), float(reserve0)
+
+            return Decimal(repr(quote / base)) if base > 0 else Decimal(0)
         except Exception:
             return None
 
@@ -341,12 +480,9 @@ class UniswapV2Reader(BaseDexReader):
         self, transaction: Dict[str, Any], logs: List[Dict[str, Any]]
     ) -> Tuple[bool, int]:
         """Detect if transaction contains Uniswap V2 swaps."""
-        swap_count = 0
-
-        for log in logs:
-            if len(log.get("topics", [])) > 0:
-                if log["topics"][0].hex() == self.SWAP_EVENT_SIGNATURE:
-                    swap_count += 1
+        # Gather topic0s once and let list.count compare them in a C loop
+        topic0s = [topics[0] for log in logs if (topics := log.get("topics"))]
+        swap_count = topic0s.count(self.SWAP_SIG_BYTES)
 
         return swap_count > 0, swap_count
 
@@ -354,12 +490,9 @@ class UniswapV2Reader(BaseDexReader):
         self, transaction: Dict[str, Any], logs: List[Dict[str, Any]]
     ) -> Tuple[bool, int]:
         """Detect if transaction contains Uniswap V2 liquidity operations."""
-        liquidity_count = 0
-
-        for log in logs:
-            if len(log.get("topics", [])) > 0:
-                topic = log["topics"][0].hex()
-                if topic in [self.MINT_EVENT_SIGNATURE, self.BURN_EVENT_SIGNATURE]:
-                    liquidity_count += 1
+        topic0s = [topics[0] for log in logs if (topics := log.get("topics"))]
+        liquidity_count = topic0s.count(self.MINT_SIG_BYTES) + topic0s.count(
+            self.BURN_SIG_BYTES
+        )
 
         return liquidity_count > 0, liquidity_count
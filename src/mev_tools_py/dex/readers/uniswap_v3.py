@@ -1,11 +1,25 @@
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from decimal import Decimal
 from web3 import Web3
-from web3.types import LogReceipt
+from web3.types import FilterParams, LogReceipt
 
+from .._kernels import price_from_sqrt_x96, price_impact
 from ..base import BaseDexReader
-from ..models import SwapEvent, LiquidityPool, LiquidityEvent
-from ..utils import wei_to_decimal, get_token_info, sort_tokens
+from ..batch import SwapLogColumns
+from ..cache import TokenCache
+from ..models import SwapEvent, LiquidityPool, LiquidityEvent, TokenInfo
+from ..multicall import MULTICALL_ERRORS
+from ..utils import (
+    wei_to_decimal,
+    get_token_info,
+    get_pools_token_infos,
+    sort_tokens,
+    intern_address,
+    WETH_ADDRESS,
+)
+
+# Pool fees are expressed in hundredths of a basis point
+_FEE_DENOM = Decimal(1000000)
 
 
 class UniswapV3Reader(BaseDexReader):
@@ -23,10 +37,30 @@ class UniswapV3Reader(BaseDexReader):
         "0x0c396cd989a39f4459b5fa1aed6a9a8dcdbc45908acfd67e028cd568da98982c"
     )
 
+    # Raw topic0 values so logs are matched with a 32-byte compare instead of
+    # hex encoding every topic
+    SWAP_SIG_BYTES = bytes.fromhex(SWAP_EVENT_SIGNATURE[2:])
+    MINT_SIG_BYTES = bytes.fromhex(MINT_EVENT_SIGNATURE[2:])
+    BURN_SIG_BYTES = bytes.fromhex(BURN_EVENT_SIGNATURE[2:])
+
     FACTORY_ADDRESS = "0x1F98431c8aD98523631AE4a59f267346ea31F984"
 
-    def __init__(self, w3: Web3, factory_address: Optional[str] = None):
+    def __init__(
+        self,
+        w3: Web3,
+        factory_address: Optional[str] = None,
+        token_cache: Optional[TokenCache] = None,
+    ):
         super().__init__(w3, factory_address or self.FACTORY_ADDRESS)
+        # Optional persistent store so pool and token metadata survive restarts
+        if token_cache is not None:
+            token_cache.check_chain(w3)
+        self._token_cache = token_cache
+        # token0, token1 and fee never change for a pool, so resolve them once,
+        # keyed by lowercased pool address
+        self._pool_immutables: Dict[str, Tuple[TokenInfo, TokenInfo, int]] = {}
+        # A deployed pool's address never changes, keyed by (token0, token1, fee)
+        self._pool_address_cache: Dict[Tuple[str, str, int], str] = {}
         self._factory_abi = [
             {
                 "inputs": [
@@ -87,28 +121,28 @@ class UniswapV3Reader(BaseDexReader):
             },
         ]
 
-    def decode_swap_event(self, log: LogReceipt) -> SwapEvent:
-        """Decode Uniswap V3 Swap event."""
-        if log["topics"][0].hex() != self.SWAP_EVENT_SIGNATURE:
+    def decode_swap_event(
+        self,
+        log: LogReceipt,
+        token0_info: Optional[TokenInfo] = None,
+        token1_info: Optional[TokenInfo] = None,
+    ) -> SwapEvent:
+        """Decode Uniswap V3 Swap event.
+
+        token0_info/token1_info may be passed when the pool's tokens were
+        already resolved, e.g. by a batched lookup; otherwise they are queried.
+        """
+        if log["topics"][0] != self.SWAP_SIG_BYTES:
             raise ValueError("Not a Swap event")
 
-        sender = "0x" + log["topics"][1].hex()[-40:]  # noqa
-        recipient = "0x" + log["topics"][2].hex()[-40:]
-        pool_address = log["address"]
+        sender = "0x" + log["topics"][1][-20:].hex()  # noqa
+        recipient = intern_address("0x" + log["topics"][2][-20:].hex())
+        pool_address = intern_address(log["address"])
 
-        data = log["data"]
-        amount0 = int.from_bytes(data[0:32], "big", signed=True)
-        amount1 = int.from_bytes(data[32:64], "big", signed=True)
-        sqrt_price_x96 = int.from_bytes(data[64:96], "big")  # noqa
-        liquidity = int.from_bytes(data[96:128], "big")  # noqa
-        tick = int.from_bytes(data[128:160], "big", signed=True)  # noqa
-
-        pool_contract = self.w3.eth.contract(address=pool_address, abi=self._pool_abi)
-        token0_address = pool_contract.functions.token0().call()
-        token1_address = pool_contract.functions.token1().call()
+        amount0, amount1, _, _, _ = self._decode_swap_data(log["data"])
 
-        token0_info = get_token_info(self.w3, token0_address)
-        token1_info = get_token_info(self.w3, token1_address)
+        if token0_info is None or token1_info is None:
+            token0_info, token1_info, _ = self._pool_tokens(pool_address)
 
         if amount0 > 0:
             token_in = token0_info
@@ -122,7 +156,7 @@ class UniswapV3Reader(BaseDexReader):
             amount_out = wei_to_decimal(abs(amount0), token0_info.decimals)
 
         return SwapEvent(
-            tx_hash=log["transactionHash"].hex(),
+            tx_hash="0x" + log["transactionHash"].hex(),
             block_number=log["blockNumber"],
             log_index=log["logIndex"],
             dex_protocol=self.protocol,
@@ -134,29 +168,95 @@ class UniswapV3Reader(BaseDexReader):
             amount_out=amount_out,
         )
 
+    @staticmethod
+    def _decode_swap_data(data: bytes) -> Tuple[int, int, int, int, int]:
+        """Decode Swap data into (amount0, amount1, sqrtPriceX96, liquidity, tick)."""
+        # Slicing a memoryview is O(1), so no word is copied before decoding
+        mv = memoryview(data)
+        return (
+            int.from_bytes(mv[0:32], "big", signed=True),
+            int.from_bytes(mv[32:64], "big", signed=True),
+            int.from_bytes(mv[64:96], "big"),
+            int.from_bytes(mv[96:128], "big"),
+            int.from_bytes(mv[128:160], "big", signed=True),
+        )
+
+    @staticmethod
+    def _decode_liquidity_data(data: bytes, is_mint: bool) -> Tuple[int, int, int]:
+        """Decode Mint/Burn data into (amount, amount0, amount1).
+
+        Mint data is (sender, amount, amount0, amount1) and Burn data is
+        (amount, amount0, amount1); the owner and ticks are indexed topics.
+        """
+        mv = memoryview(data)
+        start = 32 if is_mint else 0
+        return (
+            int.from_bytes(mv[start : start + 32], "big"),
+            int.from_bytes(mv[start + 32 : start + 64], "big"),
+            int.from_bytes(mv[start + 64 : start + 96], "big"),
+        )
+
     def get_swaps_from_transaction(self, tx_hash: str) -> List[SwapEvent]:
         """Extract all Uniswap V3 swap events from a transaction."""
         receipt = self.w3.eth.get_transaction_receipt(tx_hash)
-        swaps = []
+        return self._decode_swap_logs(receipt["logs"])
 
-        for log in receipt["logs"]:
-            try:
-                if log["topics"][0].hex() == self.SWAP_EVENT_SIGNATURE:
-                    swap = self.decode_swap_event(log)
-                    swaps.append(swap)
-            except Exception:
+    def get_swaps_from_block(self, block_number: int) -> List[SwapEvent]:
+        """Extract all Uniswap V3 swap events from a block."""
+        # The node answers a topic filter from its log index, so one request
+        # replaces a receipt lookup per transaction
+        logs = self.w3.eth.get_logs(
+            {
+                "fromBlock": block_number,
+                "toBlock": block_number,
+                "topics": [self.SWAP_EVENT_SIGNATURE],
+            }
+        )
+
+        return self._decode_swap_logs(logs)
+
+    def get_swaps_from_block_columnar(self, block_number: int) -> SwapLogColumns:
+        """Extract the raw Uniswap V3 swap log values of a block as columns.
+
+        No token metadata is resolved, so this costs a single eth_getLogs.
+        """
+        logs = self.w3.eth.get_logs(
+            {
+                "fromBlock": block_number,
+                "toBlock": block_number,
+                "topics": [self.SWAP_EVENT_SIGNATURE],
+            }
+        )
+
+        columns = SwapLogColumns(block_number)
+        for log in logs:
+            if not log["topics"] or log["topics"][0] != self.SWAP_SIG_BYTES:
                 continue
+            columns.append(
+                intern_address(log["address"]),
+                "0x" + log["transactionHash"].hex(),
+                log["logIndex"],
+                *self._decode_swap_data(log["data"]),
+            )
 
-        return swaps
+        return columns
 
-    def get_swaps_from_block(self, block_number: int) -> List[SwapEvent]:
-        """Extract all Uniswap V3 swap events from a block."""
-        block = self.w3.eth.get_block(block_number, full_transactions=True)
-        swaps = []
+    def _decode_swap_logs(self, logs: Iterable[LogReceipt]) -> List[SwapEvent]:
+        """Decode swap logs, resolving all of their pools in one batch first."""
+        swap_logs = [
+            log
+            for log in logs
+            if log["topics"] and log["topics"][0] == self.SWAP_SIG_BYTES
+        ]
 
-        for tx in block["transactions"]:
-            tx_swaps = self.get_swaps_from_transaction(tx["hash"].hex())
-            swaps.extend(tx_swaps)
+        self._prefetch_pools(log["address"] for log in swap_logs)
+
+        swaps = []
+        for log in swap_logs:
+            try:
+                swaps.append(self.decode_swap_event(log))
+            except self.DECODE_ERRORS:
+                continue
 
         return swaps
 
@@ -164,15 +264,10 @@ class UniswapV3Reader(BaseDexReader):
         """Get Uniswap V3 pool information."""
         pool_contract = self.w3.eth.contract(address=pool_address, abi=self._pool_abi)
 
-        token0_address = pool_contract.functions.token0().call()
-        token1_address = pool_contract.functions.token1().call()
-        fee = pool_contract.functions.fee().call()
+        token0_info, token1_info, fee = self._pool_tokens(pool_address)
         liquidity = pool_contract.functions.liquidity().call()
         slot0 = pool_contract.functions.slot0().call()
 
-        token0_info = get_token_info(self.w3, token0_address)
-        token1_info = get_token_info(self.w3, token1_address)
-
         sqrt_price_x96 = slot0[0]
         tick = slot0[1]
 
@@ -187,7 +282,7 @@ class UniswapV3Reader(BaseDexReader):
             reserve0=reserve0,
             reserve1=reserve1,
             total_supply=wei_to_decimal(liquidity, 18),
-            fee_tier=Decimal(fee) / Decimal(1000000),
+            fee_tier=Decimal(fee) / _FEE_DENOM,
             tick=tick,
             sqrt_price_x96=sqrt_price_x96,
         )
@@ -223,57 +318,65 @@ class UniswapV3Reader(BaseDexReader):
         else:
             fee_tiers = [fee_tier]
 
-        factory_contract = self.w3.eth.contract(
-            address=self.router_address, abi=self._factory_abi
-        )
-
         token0, token1 = sort_tokens(token0, token1)
+        pair = (token0.lower(), token1.lower())
+        factory_contract = None
 
         for fee in fee_tiers:
+            # Only deployed pools are cached, a missing one may be created later
+            cached = self._pool_address_cache.get((*pair, fee))
+            if cached is not None:
+                return cached
+
+            if factory_contract is None:
+                factory_contract = self.w3.eth.contract(
+                    address=self.router_address, abi=self._factory_abi
+                )
+
             try:
                 pool_address = factory_contract.functions.getPool(
                     token0, token1, fee
                 ).call()
                 if not pool_address == "0x0000000000000000000000000000000000000000":
+                    self._pool_address_cache[(*pair, fee)] = pool_address
                     return pool_address
             except Exception:
                 continue
 
         return None
 
-    def decode_liquidity_event(self, log: LogReceipt) -> LiquidityEvent:
-        """Decode Uniswap V3 Mint/Burn event."""
-        topic = log["topics"][0].hex()
-
-        if topic == self.MINT_EVENT_SIGNATURE:
+    def decode_liquidity_event(
+        self,
+        log: LogReceipt,
+        token0_info: Optional[TokenInfo] = None,
+        token1_info: Optional[TokenInfo] = None,
+    ) -> LiquidityEvent:
+        """Decode Uniswap V3 Mint/Burn event.
+
+        Accepts pre-resolved pool token info like decode_swap_event.
+        """
+        topic = log["topics"][0]
+
+        is_mint = topic == self.MINT_SIG_BYTES
+        if is_mint:
             event_type = "mint"
-            sender = "0x" + log["topics"][1].hex()[-40:]
-            owner = "0x" + log["topics"][2].hex()[-40:]
-        elif topic == self.BURN_EVENT_SIGNATURE:
+            # The minting sender is the first data word, not a topic
+            sender = intern_address("0x" + bytes(log["data"][12:32]).hex())
+        elif topic == self.BURN_SIG_BYTES:
             event_type = "burn"
-            owner = "0x" + log["topics"][1].hex()[-40:]
-            sender = owner
+            # Burn has no sender, so the indexed position owner is used
+            sender = intern_address("0x" + log["topics"][1][-20:].hex())
         else:
             raise ValueError("Not a liquidity event")
 
-        pool_address = log["address"]
-        data = log["data"]
+        pool_address = intern_address(log["address"])
+        amount, amount0, amount1 = self._decode_liquidity_data(log["data"], is_mint)
 
-        tick_lower = int.from_bytes(data[0:32], "big", signed=True)  # noqa
-        tick_upper = int.from_bytes(data[32:64], "big", signed=True)  # noqa
-        amount = int.from_bytes(data[64:96], "big")
-        amount0 = int.from_bytes(data[96:128], "big")
-        amount1 = int.from_bytes(data[128:160], "big")
-
-        pool_contract = self.w3.eth.contract(address=pool_address, abi=self._pool_abi)
-        token0_address = pool_contract.functions.token0().call()
-        token1_address = pool_contract.functions.token1().call()
-
-        token0_info = get_token_info(self.w3, token0_address)
-        token1_info = get_token_info(self.w3, token1_address)
+        if token0_info is None or token1_info is None:
+            token0_info, token1_info, _ = self._pool_tokens(pool_address)
 
         return LiquidityEvent(
-            tx_hash=log["transactionHash"].hex(),
+            tx_hash="0x" + log["transactionHash"].hex(),
             block_number=log["blockNumber"],
             log_index=log["logIndex"],
             dex_protocol=self.protocol,
@@ -290,43 +393,119 @@ class UniswapV3Reader(BaseDexReader):
     ) -> List[LiquidityEvent]:
         """Extract all liquidity events from a transaction."""
         receipt = self.w3.eth.get_transaction_receipt(tx_hash)
-        events = []
+        return self._decode_liquidity_logs(receipt["logs"])
+
+    def get_liquidity_events_from_block(
+        self, block_number: int, pool_address: Optional[str] = None
+    ) -> List[LiquidityEvent]:
+        """Extract all Uniswap V3 liquidity events from a block.
+
+        Mint and Burn are matched with a single OR topic filter, optionally
+        restricted to one pool, so the node can skip unrelated logs.
+        """
+        log_filter: FilterParams = {
+            "fromBlock": block_number,
+            "toBlock": block_number,
+            "topics": [[self.MINT_EVENT_SIGNATURE, self.BURN_EVENT_SIGNATURE]],
+        }
+        if pool_address is not None:
+            log_filter["address"] = Web3.to_checksum_address(pool_address)
+
+        return self._decode_liquidity_logs(self.w3.eth.get_logs(log_filter))
+
+    def _decode_liquidity_logs(
+        self, logs: Iterable[LogReceipt]
+    ) -> List[LiquidityEvent]:
+        """Decode Mint/Burn logs, resolving all of their pools in one batch first."""
+        liquidity_logs = [
+            log
+            for log in logs
+            if log["topics"]
+            and (
+                log["topics"][0] == self.MINT_SIG_BYTES
+                or log["topics"][0] == self.BURN_SIG_BYTES
+            )
+        ]
 
-        for log in receipt["logs"]:
+        self._prefetch_pools(log["address"] for log in liquidity_logs)
+
+        events = []
+        for log in liquidity_logs:
             try:
-                topic = log["topics"][0].hex()
-                if topic in [self.MINT_EVENT_SIGNATURE, self.BURN_EVENT_SIGNATURE]:
-                    event = self.decode_liquidity_event(log)
-                    events.append(event)
-            except Exception:
+                events.append(self.decode_liquidity_event(log))
+            except self.DECODE_ERRORS:
                 continue
 
         return events
 
-    def calculate_price_impact(self, swap: SwapEvent, pool: LiquidityPool) -> Decimal:
-        """Calculate price impact for Uniswap V3 (simplified)."""
-        if not pool.sqrt_price_x96:
-            return Decimal(0)
+    def _prefetch_pools(self, pool_addresses: Iterable[str]) -> None:
+        """Resolve token0/token1/fee for unseen pools via Multicall3.
 
-        current_price = Decimal(pool.sqrt_price_x96) ** 2 / (Decimal(2) ** 192)
+        Pools that cannot be resolved this way are left uncached so that
+        _pool_tokens falls back to direct contract calls.
+        """
+        pools = {
+            pool.lower(): pool
+            for pool in pool_addresses
+            if pool.lower() not in self._pool_immutables
+        }
+        if not pools:
+            return
 
-        if swap.amount_in == 0:
-            return Decimal(0)
+        try:
+            pool_immutables = get_pools_token_infos(
+                self.w3, pools.values(), self._token_cache, with_fee=True
+            )
+        except MULTICALL_ERRORS:
+            return
+        for pool, immutables in pool_immutables.items():
+            self._pool_immutables[pool.lower()] = immutables
+
+    def _pool_tokens(self, pool_address: str) -> Tuple[TokenInfo, TokenInfo, int]:
+        """Get (token0, token1, fee) for a pool, fetching and caching on a miss."""
+        key = pool_address.lower()
+        cached = self._pool_immutables.get(key)
+        if cached is not None:
+            return cached
+
+        self._prefetch_pools([pool_address])
+        cached = self._pool_immutables.get(key)
+        if cached is not None:
+            return cached
+
+        # Multicall3 unavailable for this pool, query it directly
+        pool_contract = self.w3.eth.contract(address=pool_address, abi=self._pool_abi)
+        pool_immutables = (
+            get_token_info(
+                self.w3, pool_contract.functions.token0().call(), self._token_cache
+            ),
+            get_token_info(
+                self.w3, pool_contract.functions.token1().call(), self._token_cache
+            ),
+            pool_contract.functions.fee().call(),
+        )
+        self._pool_immutables[key] = pool_immutables
 
-        price_change = swap.amount_out / swap.amount_in
+        return pool_immutables
 
-        if current_price == 0:
+    def calculate_price_impact(self, swap: SwapEvent, pool: LiquidityPool) -> Decimal:
+        """Calculate price impact for Uniswap V3 (simplified)."""
+        if not pool.sqrt_price_x96 or swap.amount_in == 0:
             return Decimal(0)
 
-        return abs((price_change - current_price) / current_price)
+        impact = price_impact(
+            price_from_sqrt_x96(pool.sqrt_price_x96),
+            float(swap.amount_in),
+            float(swap.amount_out),
+        )
+
+        return Decimal(repr(impact))
 
     def get_token_price(
         self, token_address: str, block_number: Optional[int] = None
     ) -> Optional[Decimal]:
         """Get token price in ETH using Uniswap V3."""
-        weth_address = "0xC02aaA39b223FE8d0A0e5C4F27eAD9083C756Cc2"
-
-        pool_address = self.find_pool_address(token_address, weth_address)
+        pool_address = self.find_pool_address(token_address, WETH_ADDRESS)
         if not pool_address:
             return None
 
@@ -347,10 +526,10 @@ class UniswapV3Reader(BaseDexReader):
             if sqrt_price_x96 == 0:
                 return Decimal(0)
 
-            price = (Decimal(sqrt_price_x96) ** 2) / (Decimal(2) ** 192)
+            price = Decimal(repr(price_from_sqrt_x96(sqrt_price_x96)))
 
-            pool = self.get_pool_info(pool_address)
-            if pool.token0.address.lower() == token_address.lower():
+            token0_info, _, _ = self._pool_tokens(pool_address)
+            if token0_info.address.lower() == token_address.lower():
                 return price
             else:
                 return Decimal(1) / price if price > 0 else Decimal(0)
@@ -367,7 +546,7 @@ class UniswapV3Reader(BaseDexReader):
 
         for log in logs:
             if len(log.get("topics", [])) > 0:
-                if log["topics"][0].hex() == self.SWAP_EVENT_SIGNATURE:
+                if log["topics"][0] == self.SWAP_SIG_BYTES:
                     swap_count += 1
 
         return swap_count > 0, swap_count
@@ -382,8 +561,8 @@ class UniswapV3Reader(BaseDexReader):
 
         for log in logs:
             if len(log.get("topics", [])) > 0:
-                topic = log["topics"][0].hex()
-                if topic in [self.MINT_EVENT_SIGNATURE, self.BURN_EVENT_SIGNATURE]:
+                topic = log["topics"][0]
+                if topic == self.MINT_SIG_BYTES or topic == self.BURN_SIG_BYTES:
                     liquidity_count += 1
 
         return liquidity_count > 0, liquidity_count
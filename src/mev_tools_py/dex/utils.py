@@ -1,85 +1,323 @@
-from typing import Dict, Any, List
+import sys
+from functools import lru_cache
+from typing import (
+    Dict,
+    Any,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+    overload,
+)
 from decimal import Decimal
-from eth_typing import Address
+from eth_typing import ABIEvent, Address
+from eth_utils import event_abi_to_log_topic
 from web3 import Web3
 from web3.types import LogReceipt
 
-from mev_tools_py.dex.models import TokenInfo
+from mev_tools_py.dex.cache import TokenCache
+from mev_tools_py.dex.models import LiquidityEvent, TokenInfo
+from mev_tools_py.dex.multicall import (
+    TOKEN0_SELECTOR,
+    TOKEN1_SELECTOR,
+    FEE_SELECTOR,
+    NAME_SELECTOR,
+    SYMBOL_SELECTOR,
+    DECIMALS_SELECTOR,
+    call,
+    multicall,
+    decode_address_result,
+    decode_string_result,
+    decode_uint_result,
+)
+
+
+# Decoders built by _event_decoders, keyed by id(abi). The ABI list is kept
+# alongside its decoders so the id cannot be reused while the entry exists.
+_EVENT_DECODER_CACHE: Dict[int, Tuple[List[Dict[str, Any]], Dict[bytes, Any]]] = {}
+
+
+def _event_decoders(abi: List[Dict[str, Any]]) -> Dict[bytes, Any]:
+    """Map each non-anonymous event's topic0 to its contract event, built once per ABI."""
+    cached = _EVENT_DECODER_CACHE.get(id(abi))
+    if cached is not None:
+        return cached[1]
+
+    contract = Web3().eth.contract(abi=abi)
+    decoders = {}
+    for event_abi in abi:
+        if event_abi.get("type") != "event" or event_abi.get("anonymous"):
+            continue
+        topic = event_abi_to_log_topic(cast(ABIEvent, event_abi))
+        decoders[topic] = contract.events[event_abi["name"]]()
+    _EVENT_DECODER_CACHE[id(abi)] = (abi, decoders)
+
+    return decoders
 
 
 def parse_log_data(log: LogReceipt, abi: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Parse log data using ABI."""
-    w3 = Web3()
-    contract = w3.eth.contract(abi=abi)
+    topics = log["topics"]
+    decoder = _event_decoders(abi).get(bytes(topics[0])) if topics else None
+    if decoder is None:
+        raise ValueError(f"Could not decode log: {log}")
+
+    try:
+        return decoder.process_log(log)["args"]
+    except Exception as e:
+        raise ValueError(f"Could not decode log: {log}") from e
 
-    for event_abi in abi:
-        if event_abi.get("type") == "event":
-            try:
-                decoded = contract.events[event_abi["name"]]().process_log(log)
-                return decoded["args"]
-            except Exception:
-                continue
 
-    raise ValueError(f"Could not decode log: {log}")
+# Quote token for get_token_price on mainnet
+WETH_ADDRESS = "0xC02aaA39b223FE8d0A0e5C4F27eAD9083C756Cc2"
+
+# Scale factors for every decimals value seen in practice, so conversions
+# don't recompute the power of ten per call
+_DECIMAL_SCALE = {d: Decimal(10) ** d for d in range(37)}
+_FLOAT_SCALE = {d: 10.0**d for d in range(37)}
 
 
 def wei_to_decimal(wei_amount: int, decimals: int) -> Decimal:
     """Convert wei amount to decimal with proper scaling."""
-    return Decimal(wei_amount) / (Decimal(10) ** decimals)
+    scale = _DECIMAL_SCALE.get(decimals)
+    if scale is None:
+        scale = Decimal(10) ** decimals
+    return Decimal(wei_amount) / scale
+
+
+def wei_to_float(wei_amount: int, decimals: int) -> float:
+    """Convert wei amount to a float for analytics that don't need exact values."""
+    scale = _FLOAT_SCALE.get(decimals)
+    if scale is None:
+        scale = 10.0**decimals
+    return wei_amount / scale
 
 
 def decimal_to_wei(decimal_amount: Decimal, decimals: int) -> int:
     """Convert decimal amount to wei with proper scaling."""
-    return int(decimal_amount * (Decimal(10) ** decimals))
-
-
-def get_token_info(w3: Web3, token_address: Address) -> TokenInfo:
-    """Get token information from contract."""
-    erc20_abi = [
-        {
-            "constant": True,
-            "inputs": [],
-            "name": "name",
-            "outputs": [{"name": "", "type": "string"}],
-            "type": "function",
-        },
-        {
-            "constant": True,
-            "inputs": [],
-            "name": "symbol",
-            "outputs": [{"name": "", "type": "string"}],
-            "type": "function",
-        },
-        {
-            "constant": True,
-            "inputs": [],
-            "name": "decimals",
-            "outputs": [{"name": "", "type": "uint8"}],
-            "type": "function",
-        },
-    ]
-
-    contract = w3.eth.contract(address=token_address, abi=erc20_abi)
+    scale = _DECIMAL_SCALE.get(decimals)
+    if scale is None:
+        scale = Decimal(10) ** decimals
+    return int(decimal_amount * scale)
 
-    try:
-        name = contract.functions.name().call()
-        symbol = contract.functions.symbol().call()
-        decimals = contract.functions.decimals().call()
 
-        return TokenInfo(
-            address=token_address.hex(),
-            symbol=symbol,
-            decimals=decimals,
-            name=name,
-        )
+# Token metadata and pool tokens are immutable, so results are memoized per
+# (w3, address) for the lifetime of the process. Failed lookups raise inside
+# the cached functions and are therefore never cached.
+TOKEN_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _fetch_token_info(w3: Web3, token_address: str) -> TokenInfo:
+    return TokenInfo(
+        address=token_address,
+        symbol=decode_string_result(call(w3, token_address, SYMBOL_SELECTOR)),
+        decimals=decode_uint_result(call(w3, token_address, DECIMALS_SELECTOR)),
+        name=decode_string_result(call(w3, token_address, NAME_SELECTOR)),
+    )
+
+
+def get_token_info(
+    w3: Web3, token_address: Address | str, cache: Optional[TokenCache] = None
+) -> TokenInfo:
+    """Get token information from contract.
+
+    With a persistent cache, stored metadata is returned without any RPC and
+    successful lookups are stored for later runs.
+    """
+    token_address = Web3.to_checksum_address(token_address)
+
+    if cache is not None:
+        cache.check_chain(w3)
+        cached = cache.get_token(token_address)
+        if cached is not None:
+            return cached
+
+    try:
+        token_info = _fetch_token_info(w3, token_address)
     except Exception:
         return TokenInfo(
-            address=token_address.hex(),
+            address=token_address,
             symbol="UNKNOWN",
             decimals=18,
             name=None,
         )
 
+    if cache is not None:
+        cache.put_token(token_info)
+
+    return token_info
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _fetch_pool_tokens(w3: Web3, pool_address: str) -> Tuple[str, str]:
+    return (
+        decode_address_result(call(w3, pool_address, TOKEN0_SELECTOR)),
+        decode_address_result(call(w3, pool_address, TOKEN1_SELECTOR)),
+    )
+
+
+def get_pool_tokens(w3: Web3, pool_address: str) -> Tuple[str, str]:
+    """Get the (token0, token1) addresses of a Uniswap style pool."""
+    return _fetch_pool_tokens(w3, Web3.to_checksum_address(pool_address))
+
+
+def get_token_infos(
+    w3: Web3, token_addresses: Iterable[str], cache: Optional[TokenCache] = None
+) -> Dict[str, TokenInfo]:
+    """Get token information for many tokens in a single Multicall3 round trip.
+
+    Tokens found in the persistent cache, if given, are not queried.
+    """
+    if cache is not None:
+        cache.check_chain(w3)
+    token_infos = {}
+    tokens = []
+    for token in dict.fromkeys(token_addresses):
+        cached = cache.get_token(token) if cache is not None else None
+        if cached is not None:
+            token_infos[token] = cached
+        else:
+            tokens.append(token)
+
+    calls = []
+    for token in tokens:
+        calls.append((token, NAME_SELECTOR))
+        calls.append((token, SYMBOL_SELECTOR))
+        calls.append((token, DECIMALS_SELECTOR))
+
+    results = multicall(w3, calls)
+
+    for i, token in enumerate(tokens):
+        (name_ok, name_data), (symbol_ok, symbol_data), (decimals_ok, decimals_data) = (
+            results[3 * i : 3 * i + 3]
+        )
+        try:
+            if not (name_ok and symbol_ok and decimals_ok):
+                raise ValueError(f"Metadata call reverted for token {token}")
+
+            token_infos[token] = TokenInfo(
+                address=token,
+                symbol=decode_string_result(symbol_data),
+                decimals=decode_uint_result(decimals_data),
+                name=decode_string_result(name_data),
+            )
+        except Exception:
+            # Placeholders are not persisted, so the token is retried next run
+            token_infos[token] = TokenInfo(
+                address=token,
+                symbol="UNKNOWN",
+                decimals=18,
+                name=None,
+            )
+            continue
+
+        if cache is not None:
+            cache.put_token(token_infos[token])
+
+    return token_infos
+
+
+@overload
+def get_pools_token_infos(
+    w3: Web3,
+    pool_addresses: Iterable[str],
+    cache: Optional[TokenCache] = ...,
+    with_fee: Literal[False] = ...,
+) -> Dict[str, Tuple[TokenInfo, TokenInfo]]: ...
+
+
+@overload
+def get_pools_token_infos(
+    w3: Web3,
+    pool_addresses: Iterable[str],
+    cache: Optional[TokenCache],
+    with_fee: Literal[True],
+) -> Dict[str, Tuple[TokenInfo, TokenInfo, int]]: ...
+
+
+def get_pools_token_infos(
+    w3: Web3,
+    pool_addresses: Iterable[str],
+    cache: Optional[TokenCache] = None,
+    with_fee: bool = False,
+) -> Union[
+    Dict[str, Tuple[TokenInfo, TokenInfo]], Dict[str, Tuple[TokenInfo, TokenInfo, int]]
+]:
+    """Get (token0, token1) info for many Uniswap style pools via Multicall3.
+
+    Issues one multicall for the pools' token0()/token1() and one for the
+    ERC20 metadata of the returned tokens, regardless of the pool count.
+    With with_fee=True the pools' fee() is fetched in the same multicall and
+    (token0, token1, fee) is returned, as for Uniswap V3 pools.
+    Pools whose calls revert are omitted from the result.
+    Pools and tokens found in the persistent cache, if given, are not queried.
+    """
+    if cache is not None:
+        cache.check_chain(w3)
+    selectors = [TOKEN0_SELECTOR, TOKEN1_SELECTOR]
+    if with_fee:
+        selectors.append(FEE_SELECTOR)
+
+    pool_immutables: Dict[str, Tuple[str, str, Optional[int]]] = {}
+    pools = []
+    for pool in dict.fromkeys(pool_addresses):
+        cached = cache.get_pool(pool) if cache is not None else None
+        # Rows stored without a fee cannot answer a fee lookup
+        if cached is not None and not (with_fee and cached[2] is None):
+            pool_immutables[pool] = cached
+        else:
+            pools.append(pool)
+
+    calls = [(pool, selector) for pool in pools for selector in selectors]
+
+    results = multicall(w3, calls)
+
+    width = len(selectors)
+    for i, pool in enumerate(pools):
+        pool_results = results[width * i : width * (i + 1)]
+        if not all(ok for ok, _ in pool_results):
+            continue
+        try:
+            token0 = decode_address_result(pool_results[0][1])
+            token1 = decode_address_result(pool_results[1][1])
+            fee = decode_uint_result(pool_results[2][1]) if with_fee else None
+        except ValueError:
+            continue
+        pool_immutables[pool] = (token0, token1, fee)
+        if cache is not None:
+            cache.put_pool(pool, token0, token1, fee)
+
+    if not pool_immutables:
+        return {}
+
+    token_infos = get_token_infos(
+        w3,
+        (
+            token
+            for token0, token1, _ in pool_immutables.values()
+            for token in (token0, token1)
+        ),
+        cache,
+    )
+
+    if with_fee:
+        return {
+            pool: (token_infos[token0], token_infos[token1], cast(int, fee))
+            for pool, (token0, token1, fee) in pool_immutables.items()
+        }
+    return {
+        pool: (token_infos[token0], token_infos[token1])
+        for pool, (token0, token1, _) in pool_immutables.items()
+    }
+
+
+# Q64.96 fixed point scale used by Uniswap V3 sqrtPriceX96 values
+_Q96 = Decimal(2) ** 96
+
 
 def calculate_sqrt_price(reserve0: Decimal, reserve1: Decimal) -> int:
     """Calculate sqrt price for Uniswap V3 style pricing."""
@@ -89,7 +327,16 @@ def calculate_sqrt_price(reserve0: Decimal, reserve1: Decimal) -> int:
     price = reserve1 / reserve0
     sqrt_price = price.sqrt()
 
-    return int(sqrt_price * (Decimal(2) ** 96))
+    return int(sqrt_price * _Q96)
+
+
+def intern_address(address: str) -> str:
+    """Intern an address string so repeated addresses share one object.
+
+    Decoded logs repeat the same pool and trader addresses many times; interned
+    copies save memory and let equality checks short-circuit on identity.
+    """
+    return sys.intern(address)
 
 
 def normalize_address(address: str) -> str:
@@ -120,3 +367,13 @@ def calculate_price_from_reserves(
     normalized_reserve1 = reserve1 / (Decimal(10) ** decimals1)
 
     return normalized_reserve1 / normalized_reserve0
+
+
+def group_by_transaction(
+    events: Iterable[LiquidityEvent],
+) -> Dict[str, List[LiquidityEvent]]:
+    """Group block-level liquidity events by transaction hash, in log order."""
+    grouped: Dict[str, List[LiquidityEvent]] = {}
+    for event in events:
+        grouped.setdefault(event.tx_hash, []).append(event)
+    return grouped
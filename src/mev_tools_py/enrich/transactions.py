@@ -1,11 +1,45 @@
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import List, Dict, Any, Optional, Tuple
 from web3 import Web3
 from eth_typing import HexStr
 
+from mev_tools_py.dex.cache import TwoLevelCache
+
+# Upper bound on concurrent requests when a provider cannot batch
+MAX_ENRICH_WORKERS = 32
+
+# A receipt only exists once a transaction is mined, and a mined transaction
+# and its receipt never change unless its block is reorged out. Fetched pairs
+# are therefore cached per (w3, tx hash) until clear_tx_cache is called.
+TX_CACHE_SIZE = 4096
+_tx_cache: TwoLevelCache[Tuple[Web3, str], Tuple[Any, Any]] = TwoLevelCache(
+    history_size=TX_CACHE_SIZE
+)
+_tx_cache_lock = Lock()
+
+
+def clear_tx_cache() -> None:
+    """Forget cached transactions and receipts, e.g. after a chain reorg."""
+    with _tx_cache_lock:
+        _tx_cache.clear()
+
+
+def _get_cached_tx(w3: Web3, tx_hash: str) -> Optional[Tuple[Any, Any]]:
+    with _tx_cache_lock:
+        return _tx_cache.get((w3, tx_hash.lower()))
+
+
+def _cache_tx(w3: Web3, tx_hash: str, tx: Any, receipt: Any) -> None:
+    with _tx_cache_lock:
+        _tx_cache.put((w3, tx_hash.lower()), (tx, receipt))
+
 
 def enrich_tx(w3: Web3, tx_hash: str) -> Dict[str, Any]:
     """Enrich a transaction with additional details.
 
+    The transaction and its receipt are cached, see clear_tx_cache.
+
     Args:
     - w3 (Web3): An instance of Web3 connected to an Ethereum node.
     - tx_hash (str): The hash of the transaction to enrich.
@@ -13,10 +47,15 @@ def enrich_tx(w3: Web3, tx_hash: str) -> Dict[str, Any]:
     Returns:
     - Dict: A dictionary containing enriched transaction details.
     """
+    cached = _get_cached_tx(w3, tx_hash)
+    if cached is None:
+        cached = _fetch_tx(w3, tx_hash)
+        _cache_tx(w3, tx_hash, *cached)
+
+    return _build_enriched_tx(*cached)
 
-    tx = w3.eth.get_transaction(HexStr(tx_hash))
-    receipt = w3.eth.get_transaction_receipt(HexStr(tx_hash))
 
+def _build_enriched_tx(tx: Any, receipt: Any) -> Dict[str, Any]:
     return {
         "hash": tx["hash"].hex(),
         "from": tx["from"],
@@ -33,6 +72,9 @@ def enrich_tx(w3: Web3, tx_hash: str) -> Dict[str, Any]:
 def enrich_txs(w3: Web3, tx_hashes: List[str]) -> List[Dict]:
     """Enrich a list of transactions with additional details.
 
+    Uncached transactions are fetched in a single JSON-RPC batch, or
+    concurrently when the provider does not support batching.
+
     Args:
     - w3 (Web3): An instance of Web3 connected to an Ethereum node.
     - tx_hashes (List[str]): A list of transaction hashes to enrich.
@@ -40,8 +82,55 @@ def enrich_txs(w3: Web3, tx_hashes: List[str]) -> List[Dict]:
     Returns:
     - List[Dict]: A list of dictionaries containing enriched transaction details.
     """
-    enriched = []
+    pairs: Dict[str, Tuple[Any, Any]] = {}
+    missing = []
     for tx_hash in tx_hashes:
-        enriched.append(enrich_tx(w3, tx_hash))
+        cached = _get_cached_tx(w3, tx_hash)
+        if cached is None:
+            missing.append(tx_hash)
+        else:
+            pairs[tx_hash] = cached
+
+    if missing:
+        pairs.update(_fetch_txs(w3, missing))
+
+    return [_build_enriched_tx(*pairs[tx_hash]) for tx_hash in tx_hashes]
+
+
+def _fetch_tx(w3: Web3, tx_hash: str) -> Tuple[Any, Any]:
+    return (
+        w3.eth.get_transaction(HexStr(tx_hash)),
+        w3.eth.get_transaction_receipt(HexStr(tx_hash)),
+    )
+
+
+def _fetch_txs(w3: Web3, tx_hashes: List[str]) -> Dict[str, Tuple[Any, Any]]:
+    """Fetch and cache the transaction and receipt for every hash."""
+    try:
+        fetched = _fetch_txs_batched(w3, tx_hashes)
+    except Exception:
+        # Not every provider supports JSON-RPC batches; overlap the individual
+        # requests on a thread pool instead
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_ENRICH_WORKERS, len(tx_hashes))
+        ) as executor:
+            fetched = list(executor.map(lambda h: _fetch_tx(w3, h), tx_hashes))
+
+    for tx_hash, (tx, receipt) in zip(tx_hashes, fetched):
+        _cache_tx(w3, tx_hash, tx, receipt)
+
+    return dict(zip(tx_hashes, fetched))
+
+
+def _fetch_txs_batched(w3: Web3, tx_hashes: List[str]) -> List[Tuple[Any, Any]]:
+    """Fetch every transaction and receipt in a single JSON-RPC batch."""
+    with w3.batch_requests() as batch:
+        for tx_hash in tx_hashes:
+            batch.add(w3.eth.get_transaction(HexStr(tx_hash)))
+            batch.add(w3.eth.get_transaction_receipt(HexStr(tx_hash)))
+        responses = batch.execute()
+
+    if len(responses) != 2 * len(tx_hashes):
+        raise ValueError("Batch response count does not match request count")
 
-    return enriched
+    return list(zip(responses[::2], responses[1::2]))
@@ -1,5 +1,5 @@
 from web3 import Web3
-from typing import List, Dict, Any, cast
+from typing import List, Dict, Any, Optional, cast
 
 
 def _ensure_hex_prefix(hex_value: str) -> str:
@@ -16,58 +16,48 @@ def get_mev_bundles(
     block = w3.eth.get_block(block_number, full_transactions=True)
     logs = w3.eth.get_logs({"fromBlock": block_number, "toBlock": block_number})
 
+    origin_bytes = bytes.fromhex(origin_topic.removeprefix("0x"))
     builder_address = str(block["miner"]).lower()
-    txs = block["transactions"]
+    refund_address = refund_address.lower()
+    txs = cast(List[Any], block["transactions"])
 
-    logs_by_tx: Dict[str, List[Any]] = {}
+    # Hash and lowercase every transaction once up front so the backwards scan
+    # below only works with list indices
+    hashes = [_ensure_hex_prefix(tx["hash"].hex()) for tx in txs]
+    tos = [str(tx["to"]).lower() if tx["to"] is not None else None for tx in txs]
+    froms = [str(tx["from"]).lower() for tx in txs]
+
+    # Only whether a transaction emitted the origin topic matters, so keep the
+    # raw hashes of those transactions
+    origin_txs = set()
     for log in logs:
-        tx_hash = _ensure_hex_prefix(log["transactionHash"].hex())
-        logs_by_tx.setdefault(tx_hash, []).append(log)
+        if len(log["topics"]) > 0 and log["topics"][0] == origin_bytes:
+            origin_txs.add(bytes(log["transactionHash"]))
 
     bundles = []
-    refund_txs = []
-    last_refund_idx = None
+    refund_txs: List[str] = []
+    last_refund_idx: Optional[int] = None
 
     for i in reversed(range(len(txs))):
-        tx = cast(Dict[str, Any], txs[i])
-        tx_hash = _ensure_hex_prefix(cast(str, tx["hash"].hex()))
-
         # Check for refund
-        tx_to = tx["to"]
-        tx_from = tx["from"]
-        if (
-            tx_to is not None
-            and str(tx_to).lower() == refund_address.lower()
-            and str(tx_from).lower() == builder_address
-        ):
-            print("refund found", i)
-            refund_txs.append(tx_hash)
+        if tos[i] == refund_address and froms[i] == builder_address:
+            refund_txs.append(hashes[i])
             if last_refund_idx is None or i > last_refund_idx:
                 last_refund_idx = i
             continue
 
         # Check for origin
-        for log in logs_by_tx.get(tx_hash, []):
-            if len(log["topics"]) == 0:
-                continue
-            if _ensure_hex_prefix(log["topics"][0].hex()) == origin_topic:
-                if last_refund_idx is not None:
-                    bundle = {
-                        "origin_tx_hash": tx_hash,
-                        "refund_tx_hashes": refund_txs[
-                            ::-1
-                        ],  # maintain chronological order
-                        "bundle_tx_hashes": [
-                            _ensure_hex_prefix(
-                                cast(str, cast(Dict[str, Any], t)["hash"].hex())
-                            )
-                            for t in txs[i : last_refund_idx + 1]
-                        ],
-                    }
-                    bundles.append(bundle)
-                    refund_txs = []
-                    last_refund_idx = None
-                break  # found origin, move on
+        if last_refund_idx is not None and bytes(txs[i]["hash"]) in origin_txs:
+            bundles.append(
+                {
+                    "origin_tx_hash": hashes[i],
+                    # maintain chronological order
+                    "refund_tx_hashes": refund_txs[::-1],
+                    "bundle_tx_hashes": hashes[i : last_refund_idx + 1],
+                }
+            )
+            refund_txs = []
+            last_refund_idx = None
 
     bundles.reverse()
 
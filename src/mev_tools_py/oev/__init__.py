@@ -0,0 +1,5 @@
+"""OEV protocol processors for detecting and analyzing liquidations."""
+
+from mev_tools_py.oev.models import LiquidationEvent
+
+__all__ = ["LiquidationEvent"]
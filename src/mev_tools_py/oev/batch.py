@@ -0,0 +1,68 @@
+"""Columnar containers for decoding whole ranges of liquidation logs at once."""
+
+from array import array
+from typing import Any, List, Tuple
+
+
+def _hash_to_hex(value: Any) -> str:
+    """Normalize a transaction hash from a log to a 0x-prefixed hex string."""
+    if isinstance(value, str):
+        return value
+    return "0x" + bytes(value).hex()
+
+
+class LiquidationCallColumns:
+    """Columnar view of decoded Aave V3 LiquidationCall logs.
+
+    Each decoded log adds one value to every column, so range-level analytics
+    can walk the lists directly instead of building a dict per liquidation.
+    Amounts are raw token units and can exceed 64 bits, so they are plain int
+    lists; block_number and log_index are typed arrays.
+    """
+
+    def __init__(self) -> None:
+        self.liquidator: List[str] = []
+        self.user: List[str] = []
+        self.debt_asset: List[str] = []
+        self.collateral_asset: List[str] = []
+        self.debt_to_cover: List[int] = []
+        self.liquidated_collateral_amount: List[int] = []
+        self.receive_atoken: List[bool] = []
+        self.tx_hash: List[str] = []
+        self.block_number = array("q")
+        self.log_index = array("q")
+
+    def __len__(self) -> int:
+        return len(self.log_index)
+
+    def append(self, args: Any, log: Any) -> None:
+        """Add a liquidation from its decoded event args and source log."""
+        self.liquidator.append(args["liquidator"])
+        self.user.append(args["user"])
+        self.debt_asset.append(args["debtAsset"])
+        self.collateral_asset.append(args["collateralAsset"])
+        self.debt_to_cover.append(args["debtToCover"])
+        self.liquidated_collateral_amount.append(args["liquidatedCollateralAmount"])
+        self.receive_atoken.append(args["receiveAToken"])
+        self.tx_hash.append(_hash_to_hex(log.get("transactionHash", "")))
+        self.block_number.append(log.get("blockNumber", 0))
+        self.log_index.append(log.get("logIndex", 0))
+
+    def to_rows(self) -> List[Tuple[str, str, str, str, int, int, bool, str, int, int]]:
+        """Return one (liquidator, user, debt_asset, collateral_asset,
+        debt_to_cover, liquidated_collateral_amount, receive_atoken, tx_hash,
+        block_number, log_index) tuple per liquidation in column order."""
+        return list(
+            zip(
+                self.liquidator,
+                self.user,
+                self.debt_asset,
+                self.collateral_asset,
+                self.debt_to_cover,
+                self.liquidated_collateral_amount,
+                self.receive_atoken,
+                self.tx_hash,
+                self.block_number,
+                self.log_index,
+            )
+        )
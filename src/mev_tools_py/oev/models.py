@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
+
+
+@dataclass(slots=True, frozen=True)
+class LiquidationEvent:
+    protocol: str
+    liquidator: str
+    user: str
+    debt_token: str
+    debt_amount: int
+    collateral_token: str
+    collateral_amount: int
+    liquidation_bonus: float
+    tx_hash: Union[str, bytes]
+    block_number: int
+    log_index: int
+    receive_atoken: Optional[bool] = None
+    health_score: Optional[int] = None
+    base_discount: Optional[int] = None
+    discount: Optional[int] = None
+    # Morpho Blue markets are identified by id rather than by token addresses
+    market_id: Optional[str] = None
+    debt_shares: Optional[int] = None
+    bad_debt_amount: Optional[int] = None
+    bad_debt_shares: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the event as a dict in the common decode_liquidation format."""
+        event: Dict[str, Any] = {
+            "protocol": self.protocol,
+            "liquidator": self.liquidator,
+            "user": self.user,
+            "debt_repaid": {"token": self.debt_token, "amount": str(self.debt_amount)},
+            "collateral_seized": {
+                "token": self.collateral_token,
+                "amount": str(self.collateral_amount),
+            },
+            "collateral_asset": self.collateral_token,
+            "debt_asset": self.debt_token,
+            "debt_repaid_wei": self.debt_amount,
+            "collateral_seized_wei": self.collateral_amount,
+            "liquidation_bonus": self.liquidation_bonus,
+        }
+        if self.receive_atoken is not None:
+            event["receive_atoken"] = self.receive_atoken
+        if self.health_score is not None:
+            event["health_score"] = str(self.health_score)
+        if self.base_discount is not None:
+            event["base_discount"] = str(self.base_discount)
+        if self.discount is not None:
+            event["discount"] = str(self.discount)
+        if self.market_id is not None:
+            event["market_id"] = self.market_id
+        if self.debt_shares is not None:
+            event["debt_shares"] = str(self.debt_shares)
+        if self.bad_debt_amount is not None:
+            event["bad_debt_assets"] = str(self.bad_debt_amount)
+            event["has_bad_debt"] = self.bad_debt_amount > 0
+        if self.bad_debt_shares is not None:
+            event["bad_debt_shares"] = str(self.bad_debt_shares)
+        event["transaction_hash"] = self.tx_hash
+        event["block_number"] = self.block_number
+        event["log_index"] = self.log_index
+        return event
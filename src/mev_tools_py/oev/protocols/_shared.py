@@ -0,0 +1,169 @@
+"""Helpers for decoding fixed-layout event logs without web3's generic ABI path."""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from eth_hash.auto import keccak
+from eth_utils import to_checksum_address
+from web3 import Web3
+from web3.contract.contract import ContractEvent
+
+# Provider-less Web3 used only for its ABI codec; building one and parsing
+# event ABIs is costly, so every processor shares this instance
+W3 = Web3()
+
+# Errors raised by the helpers below when a log does not match the expected
+# layout; callers fall back to web3's process_log on any of these
+FAST_DECODE_ERRORS = (ValueError, KeyError, TypeError)
+
+# Liquidations touch a small, repeating set of assets and liquidators, so
+# checksummed addresses are cached across decodes
+CHECKSUM_CACHE_SIZE = 16384
+
+# 1e18 fixed-point scale of discounts and LLTVs. Dividing raw ints by it is as
+# fast as multiplying by 1e-18 but, unlike the inexact reciprocal, correctly
+# rounded
+WAD = 1e18
+
+_ADDRESS_PADDING = bytes(12)
+
+
+@lru_cache(maxsize=CHECKSUM_CACHE_SIZE)
+def checksum(address: bytes) -> str:
+    """Checksum a raw 20 byte address, caching the result."""
+    return to_checksum_address(address)
+
+
+def event_topic(signature: str) -> bytes:
+    """Return the topic0 (keccak256) of a canonical event signature."""
+    return keccak(signature.encode())
+
+
+def bloom_bits(value: bytes) -> Tuple[Tuple[int, int], ...]:
+    """Return the (byte index, bit mask) pairs a value sets in a 2048-bit logs bloom.
+
+    Per the yellow paper, the low 11 bits of each of the first three byte pairs
+    of keccak256(value) select a bit, counted from the least significant end of
+    the big-endian bloom.
+    """
+    digest = keccak(value)
+    bits = []
+    for i in (0, 2, 4):
+        bit = int.from_bytes(digest[i : i + 2], "big") & 2047
+        bits.append((255 - (bit >> 3), 1 << (bit & 7)))
+    return tuple(bits)
+
+
+def bloom_may_contain(bloom: Optional[Any], bits: Tuple[Tuple[int, int], ...]) -> bool:
+    """Return False only if the bloom proves the value is absent.
+
+    A missing or malformed bloom cannot rule anything out, so it returns True.
+    """
+    if bloom is None:
+        return True
+    bloom = to_bytes(bloom)
+    if len(bloom) != 256:
+        return True
+    return all(bloom[index] & mask for index, mask in bits)
+
+
+def event_decoder(abi: Dict[str, Any]) -> ContractEvent:
+    """Build the web3 contract event used to decode logs of a single event ABI."""
+    return W3.eth.contract(abi=[abi]).events[abi["name"]]
+
+
+class LazyEventDecoder:
+    """Class attribute holding the event_decoder of an event ABI, built on first
+    access and then shared by all instances.
+
+    Parsing event ABIs is costly, and callers that only detect liquidations by
+    topic never need the decoders, so nothing is built at import.
+    """
+
+    def __init__(self, abi: Dict[str, Any]) -> None:
+        self.abi = abi
+        self._decoder: Optional[ContractEvent] = None
+
+    def __get__(self, instance: Any, owner: Any = None) -> ContractEvent:
+        if self._decoder is None:
+            self._decoder = event_decoder(self.abi)
+        return self._decoder
+
+
+def to_bytes(value: Any) -> bytes:
+    """Convert a hex string or bytes-like log field to bytes."""
+    if isinstance(value, str):
+        return bytes.fromhex(value.removeprefix("0x"))
+    return bytes(value)
+
+
+def log_topic0(log: Dict[str, Any]) -> Optional[bytes]:
+    """Return a log's first topic as bytes, or None if it has no valid one.
+
+    HexBytes and bytes topics are returned as is, since they compare and hash
+    like the precomputed topic bytes; only hex string topics (raw JSON-RPC
+    logs) are parsed.
+    """
+    topics = log.get("topics")
+    if not topics:
+        return None
+    topic = topics[0]
+    if isinstance(topic, bytes):
+        return topic
+    try:
+        return to_bytes(topic)
+    except (ValueError, TypeError):
+        return None
+
+
+def has_topic0(log: Dict[str, Any], topic0: bytes) -> bool:
+    """Return whether a log's first topic is topic0, without raising."""
+    return log_topic0(log) == topic0
+
+
+def raw_amount(amount: Any) -> int:
+    """Parse a stringified token amount, tolerating float notation like "1e18"."""
+    try:
+        return int(amount)
+    except ValueError:
+        return int(float(amount))
+
+
+def split_words(data: bytes, count: int) -> List[bytes]:
+    """Split ABI-encoded static data into exactly count 32 byte words."""
+    if len(data) != 32 * count:
+        raise ValueError(f"Expected {32 * count} bytes of data, got {len(data)}")
+    return [data[i : i + 32] for i in range(0, len(data), 32)]
+
+
+def indexed_words(topics: Sequence[Any], topic0: bytes, count: int) -> List[bytes]:
+    """Return the count indexed topics after checking topic0 and their sizes."""
+    if len(topics) != count + 1:
+        raise ValueError(f"Expected {count + 1} topics, got {len(topics)}")
+    if to_bytes(topics[0]) != topic0:
+        raise ValueError("Event signature does not match")
+
+    words = [to_bytes(topic) for topic in topics[1:]]
+    if any(len(word) != 32 for word in words):
+        raise ValueError("Indexed topics must be 32 bytes")
+    return words
+
+
+def word_to_address(word: bytes) -> str:
+    """Decode a 32 byte ABI word into a checksum address."""
+    if word[:12] != _ADDRESS_PADDING:
+        raise ValueError("Address word has non-zero padding")
+    return checksum(word[12:])
+
+
+def word_to_uint(word: bytes) -> int:
+    """Decode a 32 byte ABI word into an unsigned integer."""
+    return int.from_bytes(word, "big")
+
+
+def word_to_bool(word: bytes) -> bool:
+    """Decode a 32 byte ABI word into a bool, rejecting values other than 0/1."""
+    value = int.from_bytes(word, "big")
+    if value > 1:
+        raise ValueError("Bool word out of range")
+    return value == 1
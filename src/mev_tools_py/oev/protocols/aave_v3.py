@@ -1,10 +1,71 @@
-from typing import Any, Dict, List, Tuple
-
-from web3 import Web3
-
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from mev_tools_py.oev.batch import LiquidationCallColumns
+from mev_tools_py.oev.models import LiquidationEvent
+from mev_tools_py.oev.protocols._shared import (
+    FAST_DECODE_ERRORS,
+    LazyEventDecoder,
+    W3,
+    bloom_bits,
+    bloom_may_contain,
+    event_topic,
+    has_topic0,
+    indexed_words,
+    log_topic0,
+    raw_amount,
+    split_words,
+    to_bytes,
+    word_to_address,
+    word_to_bool,
+    word_to_uint,
+)
 from mev_tools_py.oev.protocols.base import BaseProtocolProcessor
-
-
+from mev_tools_py.oev.protocols.router import register_protocol
+
+# Scale from USDC's 6 decimals to 18 decimals
+_USDC_TO_WAD = 10**12
+
+# Category values written into every enriched event. Interned so all events
+# reference the same string objects and consumers can compare by identity.
+SIZE_SMALL = sys.intern("small")
+SIZE_MEDIUM = sys.intern("medium")
+SIZE_LARGE = sys.intern("large")
+METHOD_ATOKEN = sys.intern("receive_atoken")
+METHOD_UNDERLYING = sys.intern("receive_underlying")
+RECEIVES_ATOKEN = sys.intern("aToken")
+RECEIVES_UNDERLYING = sys.intern("underlying_asset")
+
+
+# Placeholder risk parameters keyed by lowercased asset address - in a real
+# implementation these would come from the PoolDataProvider contract
+_LIQUIDATION_THRESHOLDS = {
+    # Common Aave V3 liquidation thresholds (as percentages)
+    "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2": 0.83,  # WETH (83%)
+    "0x6b175474e89094c44da98b954eedeac495271d0f": 0.77,  # DAI (77%)
+    "0xa0b86a33e6441db5db86df4d9e5c4e6a05f3a9": 0.825,  # USDC (82.5%)
+    "0xdac17f958d2ee523a2206206994597c13d831ec7": 0.80,  # USDT (80%)
+    "0x2260fac5e5542a773aa44fbcfedf7c193bc2c599": 0.70,  # WBTC (70%)
+}
+_LIQUIDATION_BONUSES = {
+    # Common Aave V3 liquidation bonuses (as percentages)
+    "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2": 0.05,  # WETH (5%)
+    "0x6b175474e89094c44da98b954eedeac495271d0f": 0.045,  # DAI (4.5%)
+    "0xa0b86a33e6441db5db86df4d9e5c4e6a05f3a9": 0.045,  # USDC (4.5%)
+    "0xdac17f958d2ee523a2206206994597c13d831ec7": 0.045,  # USDT (4.5%)
+    "0x2260fac5e5542a773aa44fbcfedf7c193bc2c599": 0.075,  # WBTC (7.5%)
+}
+_DEFAULT_THRESHOLD = 0.75
+_DEFAULT_BONUS = 0.05
+_DEFAULT_PARAMS = (_DEFAULT_THRESHOLD, _DEFAULT_BONUS)
+# (threshold, bonus) per asset for callers needing both
+_LIQUIDATION_PARAMS = {
+    asset: (threshold, _LIQUIDATION_BONUSES.get(asset, _DEFAULT_BONUS))
+    for asset, threshold in _LIQUIDATION_THRESHOLDS.items()
+}
+
+
+@register_protocol
 class AaveV3ProtocolProcessor(BaseProtocolProcessor):
     """Aave V3 protocol liquidation processor for Ethereum mainnet."""
 
@@ -15,6 +76,25 @@ class AaveV3ProtocolProcessor(BaseProtocolProcessor):
     POOL_ADDRESSES_PROVIDER = "0x2f39d218133AFaB8F2B819B1066c7E434Ad94E9e"
     POOL_DATA_PROVIDER = "0x7B4EB56E7CD4b454BA8ff71E4518426369a138a3"
 
+    # Lowercased lookups used by is_liquidation_transaction on every transaction
+    _POOL_ADDRESS_LOWER = POOL_ADDRESS.lower()
+    _AAVE_V3_CONTRACTS = frozenset({_POOL_ADDRESS_LOWER})
+
+    # keccak256 of the LiquidationCall event signature, hashed once at import
+    LIQUIDATION_CALL_TOPIC0_BYTES = event_topic(
+        "LiquidationCall(address,address,address,uint256,uint256,address,bool)"
+    )
+    LIQUIDATION_CALL_TOPIC0 = "0x" + LIQUIDATION_CALL_TOPIC0_BYTES.hex()
+    _LIQUIDATION_CALL_BLOOM_BITS = bloom_bits(LIQUIDATION_CALL_TOPIC0_BYTES)
+
+    # Routing metadata for router.register_protocol
+    LOG_TOPICS = {LIQUIDATION_CALL_TOPIC0_BYTES: "LiquidationCall"}
+    CONTRACT_ADDRESSES = _AAVE_V3_CONTRACTS
+    METHOD_SELECTORS = {
+        "0x00a718a9": "liquidationCall",
+        "0x52d84d1e": "flashLiquidation",  # example selector
+    }
+
     # Aave V3 LiquidationCall event ABI
     LIQUIDATION_CALL_EVENT_ABI = {
         "anonymous": False,
@@ -111,20 +191,95 @@ class AaveV3ProtocolProcessor(BaseProtocolProcessor):
         "type": "event",
     }
 
-    def __init__(self) -> None:
-        """Initialize the Aave V3 protocol processor with web3 instance."""
-        self.w3 = Web3()
-        # Create event contracts for decoding
-        self.liquidation_call_event = self.w3.eth.contract(
-            abi=[self.LIQUIDATION_CALL_EVENT_ABI]
-        ).events.LiquidationCall
-        self.reserve_data_updated_event = self.w3.eth.contract(
-            abi=[self.RESERVE_DATA_UPDATED_EVENT_ABI]
-        ).events.ReserveDataUpdated
+    # Fields enrich_event adds with the same value for every liquidation
+    STATIC_ENRICHMENTS: Dict[str, Any] = {
+        "liquidation_type": "aave_v3",
+        "protocol_version": "3",
+        "is_emode_liquidation": False,  # Would need to check eMode status
+        "supports_flash_liquidation": True,
+        "supports_partial_liquidation": True,
+        "is_cross_chain": False,  # Mainnet deployment
+        "uses_isolation_mode": False,  # Would need to check reserve config
+        "uses_efficiency_mode": False,  # Would need to check user config
+        "supports_stable_debt": True,
+        "supports_variable_debt": True,
+    }
 
-    def decode_liquidation(self, log: Dict[str, Any]) -> Dict[str, Any]:
+    _RECEIVE_ATOKEN_FIELDS: Dict[str, Any] = {
+        "liquidation_method": METHOD_ATOKEN,
+        "liquidator_receives": RECEIVES_ATOKEN,
+    }
+    _RECEIVE_UNDERLYING_FIELDS: Dict[str, Any] = {
+        "liquidation_method": METHOD_UNDERLYING,
+        "liquidator_receives": RECEIVES_UNDERLYING,
+    }
+
+    # Event contracts for decoding, built on first use and shared by all instances
+    w3 = W3
+    liquidation_call_event = LazyEventDecoder(LIQUIDATION_CALL_EVENT_ABI)
+    reserve_data_updated_event = LazyEventDecoder(RESERVE_DATA_UPDATED_EVENT_ABI)
+
+    def _decode_liquidation_call_fast(self, log: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Decode LiquidationCall args directly from the fixed topic/data layout.
+
+        Raises one of FAST_DECODE_ERRORS if the log does not match the layout.
         """
-        Decode a raw Aave V3 liquidation log into a structured event using web3.py ABI decoding.
+        collateral_asset, debt_asset, user = indexed_words(
+            log["topics"], self.LIQUIDATION_CALL_TOPIC0_BYTES, 3
+        )
+        debt_to_cover, collateral_amount, liquidator, receive_atoken = split_words(
+            to_bytes(log["data"]), 4
+        )
+
+        return {
+            "collateralAsset": word_to_address(collateral_asset),
+            "debtAsset": word_to_address(debt_asset),
+            "user": word_to_address(user),
+            "debtToCover": word_to_uint(debt_to_cover),
+            "liquidatedCollateralAmount": word_to_uint(collateral_amount),
+            "liquidator": word_to_address(liquidator),
+            "receiveAToken": word_to_bool(receive_atoken),
+        }
+
+    def _decode_liquidation_call_args(self, log: Dict[str, Any]) -> Any:
+        """Decode LiquidationCall args, falling back to web3 for irregular logs."""
+        try:
+            return self._decode_liquidation_call_fast(log)
+        except FAST_DECODE_ERRORS:
+            return self.liquidation_call_event.process_log(log)["args"]
+
+    def decode_liquidations_batch(
+        self, logs: Iterable[Dict[str, Any]]
+    ) -> LiquidationCallColumns:
+        """
+        Decode many LiquidationCall logs (e.g. an eth_getLogs range) into columns.
+
+        Skips the per-event dict that decode_liquidation builds; raises ValueError
+        on the first log that cannot be decoded.
+        """
+        columns = LiquidationCallColumns()
+        for log in logs:
+            if not has_topic0(log, self.LIQUIDATION_CALL_TOPIC0_BYTES):
+                raise ValueError(
+                    "Failed to decode Aave V3 liquidation log: "
+                    "not a LiquidationCall event"
+                )
+            try:
+                args = self._decode_liquidation_call_args(log)
+            except Exception as e:
+                raise ValueError(
+                    f"Failed to decode Aave V3 liquidation log: {e}"
+                ) from e
+            columns.append(args, log)
+        return columns
+
+    def decode_liquidation_event(self, log: Dict[str, Any]) -> LiquidationEvent:
+        """
+        Decode a raw Aave V3 liquidation log into a LiquidationEvent.
+
+        Well-formed logs are decoded from their fixed layout; anything else goes
+        through web3.py ABI decoding.
 
         Aave V3 LiquidationCall event structure:
         event LiquidationCall(
@@ -137,107 +292,162 @@ class AaveV3ProtocolProcessor(BaseProtocolProcessor):
             bool receiveAToken
         )
         """
+        # Reject other events up front: speculative calls (e.g. from a
+        # dispatcher) mostly hit this path, and going through process_log
+        # would raise and wrap two exceptions per log
+        if not has_topic0(log, self.LIQUIDATION_CALL_TOPIC0_BYTES):
+            raise ValueError(
+                "Failed to decode Aave V3 liquidation log: not a LiquidationCall event"
+            )
+
         try:
-            # Decode the log using web3.py
-            decoded_log = self.liquidation_call_event.process_log(log)
-            args = decoded_log["args"]
+            args = self._decode_liquidation_call_args(log)
+
+            debt_to_cover = args["debtToCover"]
 
             # Calculate liquidation bonus (need to account for different decimals)
             # For accurate calculation, we'd need to know token decimals and prices
             # This is a simplified calculation assuming proper price conversion
-            debt_to_cover = float(args["debtToCover"])
-
             if debt_to_cover > 0:
                 # Simplified bonus calculation - in practice would need price feeds
                 liquidation_bonus = 0.05  # Default 5% for Aave V3
             else:
                 liquidation_bonus = 0.0
 
-            return {
-                "protocol": self.protocol,
-                "liquidator": args["liquidator"],
-                "user": args["user"],
-                "debt_repaid": {
-                    "token": args["debtAsset"],
-                    "amount": str(args["debtToCover"]),
-                },
-                "collateral_seized": {
-                    "token": args["collateralAsset"],
-                    "amount": str(args["liquidatedCollateralAmount"]),
-                },
-                "collateral_asset": args["collateralAsset"],
-                "debt_asset": args["debtAsset"],
-                "liquidation_bonus": liquidation_bonus,
-                "receive_atoken": args["receiveAToken"],
-                "transaction_hash": log.get("transactionHash", ""),
-                "block_number": log.get("blockNumber", 0),
-                "log_index": log.get("logIndex", 0),
-            }
+            return LiquidationEvent(
+                protocol=self.protocol,
+                liquidator=args["liquidator"],
+                user=args["user"],
+                debt_token=args["debtAsset"],
+                debt_amount=debt_to_cover,
+                collateral_token=args["collateralAsset"],
+                collateral_amount=args["liquidatedCollateralAmount"],
+                liquidation_bonus=liquidation_bonus,
+                tx_hash=log.get("transactionHash", ""),
+                block_number=log.get("blockNumber", 0),
+                log_index=log.get("logIndex", 0),
+                receive_atoken=args["receiveAToken"],
+            )
         except Exception as e:
             raise ValueError(f"Failed to decode Aave V3 liquidation log: {e}") from e
 
-    def enrich_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
+    def decode_liquidation(self, log: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Enrich a decoded Aave V3 liquidation event with protocol-specific analytics.
+        Decode a raw Aave V3 liquidation log into a structured event dict.
+
+        The dict also carries the raw integer amounts as debt_repaid_wei and
+        collateral_seized_wei, so enrichment never goes through float.
         """
-        enriched = event.copy()
+        return self.decode_liquidation_event(log).to_dict()
 
-        # Add Aave V3-specific enrichments
-        enriched.update(
-            {
-                "liquidation_type": "aave_v3",
-                "protocol_version": "3",
-                "is_emode_liquidation": False,  # Would need to check eMode status
-                "supports_flash_liquidation": True,
-                "supports_partial_liquidation": True,
-                "is_cross_chain": False,  # Mainnet deployment
-            }
-        )
+    @staticmethod
+    def _liquidation_metrics(
+        debt_amount: int, collateral_amount: int
+    ) -> Dict[str, Any]:
+        """Ratio, profitability, incentive and size class of one liquidation.
 
+        Amounts are raw integer token units; only the ratio becomes a float.
+        """
+        # For proper ratio calculation, we'd need to normalize by token decimals and prices
+        # This is a simplified calculation - in practice would use price oracles
+        # Assuming USDC (6 decimals) vs WETH (18 decimals) example
+        # Convert USDC to 18 decimals for comparison: debt_amount * 10**12
+        if debt_amount < _USDC_TO_WAD:
+            normalized_debt = debt_amount * _USDC_TO_WAD
+            debt_usdc = debt_amount
+        else:
+            normalized_debt = debt_amount
+            debt_usdc = debt_amount // _USDC_TO_WAD
+        liquidation_ratio = collateral_amount / normalized_debt
+
+        # Classify liquidation size based on debt amount (assume USDC scale)
+        if debt_usdc < 1000:  # Small liquidation
+            size_category = SIZE_SMALL
+        elif debt_usdc < 10000:  # Medium liquidation
+            size_category = SIZE_MEDIUM
+        else:  # Large liquidation
+            size_category = SIZE_LARGE
+
+        return {
+            "liquidation_ratio": liquidation_ratio,
+            "is_profitable": liquidation_ratio > 1.0,
+            # Estimate liquidation incentive (typical Aave V3 range)
+            "liquidation_incentive": liquidation_ratio - 1.0,
+            "liquidation_size_category": size_category,
+        }
+
+    def enrich_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Enrich a decoded Aave V3 liquidation event with protocol-specific analytics.
+        """
         # Calculate liquidation metrics
-        debt_amount = float(event.get("debt_repaid", {}).get("amount", "0"))
-        collateral_amount = float(event.get("collateral_seized", {}).get("amount", "0"))
+        debt_amount = event.get("debt_repaid_wei")
+        if debt_amount is None:
+            debt_amount = raw_amount(event.get("debt_repaid", {}).get("amount", "0"))
+        collateral_amount = event.get("collateral_seized_wei")
+        if collateral_amount is None:
+            collateral_amount = raw_amount(
+                event.get("collateral_seized", {}).get("amount", "0")
+            )
 
         if debt_amount > 0 and collateral_amount > 0:
-            # For proper ratio calculation, we'd need to normalize by token decimals and prices
-            # This is a simplified calculation - in practice would use price oracles
-            # Assuming USDC (6 decimals) vs WETH (18 decimals) example
-            # Convert USDC to 18 decimals for comparison: debt_amount * 1e12
-            normalized_debt = debt_amount * 1e12 if debt_amount < 1e12 else debt_amount
-            enriched["liquidation_ratio"] = collateral_amount / normalized_debt
-            enriched["is_profitable"] = enriched["liquidation_ratio"] > 1.0
-
-            # Estimate liquidation incentive (typical Aave V3 range)
-            liquidation_incentive = enriched["liquidation_ratio"] - 1.0
-            enriched["liquidation_incentive"] = liquidation_incentive
-
-            # Classify liquidation size based on debt amount (assume USDC scale)
-            debt_usdc = debt_amount if debt_amount < 1e12 else debt_amount / 1e12
-            if debt_usdc < 1000:  # Small liquidation
-                enriched["liquidation_size_category"] = "small"
-            elif debt_usdc < 10000:  # Medium liquidation
-                enriched["liquidation_size_category"] = "medium"
-            else:  # Large liquidation
-                enriched["liquidation_size_category"] = "large"
-
-        # Add Aave-specific features
-        enriched["uses_isolation_mode"] = False  # Would need to check reserve config
-        enriched["uses_efficiency_mode"] = False  # Would need to check user config
-        enriched["supports_stable_debt"] = True
-        enriched["supports_variable_debt"] = True
+            metrics = self._liquidation_metrics(debt_amount, collateral_amount)
+        else:
+            metrics = {}
 
         # Add liquidation method information
         if event.get("receive_atoken"):
-            enriched["liquidation_method"] = "receive_atoken"
-            enriched["liquidator_receives"] = "aToken"
+            method_fields = self._RECEIVE_ATOKEN_FIELDS
         else:
-            enriched["liquidation_method"] = "receive_underlying"
-            enriched["liquidator_receives"] = "underlying_asset"
+            method_fields = self._RECEIVE_UNDERLYING_FIELDS
+
+        # Build the enriched event in one pass rather than copy + update
+        return {**event, **self.STATIC_ENRICHMENTS, **metrics, **method_fields}
+
+    def enrich_events_batch(
+        self, columns: LiquidationCallColumns
+    ) -> Dict[str, List[Any]]:
+        """
+        Compute enrich_event's per-liquidation fields for a whole batch.
 
+        Returns one list per field, aligned with the rows of columns. The metric
+        fields are None where enrich_event would omit them (zero debt or
+        collateral). Fields that are the same for every liquidation are not
+        repeated; they are in STATIC_ENRICHMENTS.
+        """
+        enriched: Dict[str, List[Any]] = {
+            "liquidation_ratio": [],
+            "is_profitable": [],
+            "liquidation_incentive": [],
+            "liquidation_size_category": [],
+        }
+        metric_columns = list(enriched.items())
+        missing = dict.fromkeys(enriched)
+
+        for debt, collateral in zip(
+            columns.debt_to_cover, columns.liquidated_collateral_amount
+        ):
+            if debt > 0 and collateral > 0:
+                metrics = self._liquidation_metrics(debt, collateral)
+            else:
+                metrics = missing
+            for name, values in metric_columns:
+                values.append(metrics[name])
+
+        receive = columns.receive_atoken
+        enriched["liquidation_method"] = [
+            METHOD_ATOKEN if r else METHOD_UNDERLYING for r in receive
+        ]
+        enriched["liquidator_receives"] = [
+            RECEIVES_ATOKEN if r else RECEIVES_UNDERLYING for r in receive
+        ]
         return enriched
 
     def is_liquidation_transaction(
-        self, transaction: Dict[str, Any], logs: List[Dict[str, Any]]
+        self,
+        transaction: Dict[str, Any],
+        logs: List[Dict[str, Any]],
+        logs_bloom: Optional[Any] = None,
     ) -> Tuple[bool, int]:
         """
         Detect if a transaction contains an Aave V3 liquidation.
@@ -246,54 +456,47 @@ class AaveV3ProtocolProcessor(BaseProtocolProcessor):
         1. Transaction sent to Aave V3 Pool contract
         2. LiquidationCall event logs emitted
         3. Method calls that could trigger liquidations
+
+        If the receipt's logs bloom is given (or present as transaction
+        "logsBloom") and rules out LiquidationCall, the log scan is skipped.
         """
         to_address = transaction.get("to", "").lower()
 
         # Check if transaction is sent to Aave V3 Pool
-        aave_v3_contracts = {
-            self.POOL_ADDRESS.lower(),
-        }
-
-        if to_address not in aave_v3_contracts:
+        if to_address not in self._AAVE_V3_CONTRACTS:
             # Also check if it's sent to a flashloan aggregator or router
             # that might interact with Aave V3
             return False, -1
 
-        # Get the liquidation event topic from the ABI
-        liquidation_call_event_topic = self.w3.keccak(
-            text="LiquidationCall(address,address,address,uint256,uint256,address,bool)"
-        ).to_0x_hex()
-
-        # Check for liquidation events in logs
-        for idx, log in enumerate(logs):
-            topics = log.get("topics", [])
-            if not topics:
-                continue
-
-            event_signature = topics[0].to_0x_hex()
-
-            # Check for LiquidationCall events
-            if event_signature == liquidation_call_event_topic:
-                # Verify the log is from the Aave V3 Pool contract
-                log_address = log.get("address", "").lower()
-                if log_address == self.POOL_ADDRESS.lower():
-                    return True, idx
+        if logs_bloom is None:
+            logs_bloom = transaction.get("logsBloom")
+        if not bloom_may_contain(logs_bloom, self._LIQUIDATION_CALL_BLOOM_BITS):
+            logs = []
+
+        # First LiquidationCall log emitted by the Aave V3 Pool, if any
+        topic0 = self.LIQUIDATION_CALL_TOPIC0_BYTES
+        pool_address = self._POOL_ADDRESS_LOWER
+        idx = next(
+            (
+                idx
+                for idx, log in enumerate(logs)
+                if log_topic0(log) == topic0
+                and log.get("address", "").lower() == pool_address
+            ),
+            -1,
+        )
+        if idx != -1:
+            return True, idx
 
         # Check transaction input for liquidation method calls
         input_data = transaction.get("input", "")
         if input_data and len(input_data) >= 10:  # At least function selector (4 bytes)
             method_signature = input_data[:10]  # First 4 bytes (8 hex chars + 0x)
 
-            # Aave V3 liquidation method signatures
-            liquidation_methods = {
-                "0x00a718a9",  # liquidationCall method signature
-                "0x52d84d1e",  # flashLiquidation method signature (example)
-            }
-
-            if method_signature in liquidation_methods:
-                # Only return True if transaction is to the Aave V3 Pool contract
-                if to_address in aave_v3_contracts:
-                    return True, -1
+            # The early return above already guarantees the transaction
+            # targets the Aave V3 Pool contract
+            if method_signature in self.METHOD_SELECTORS:
+                return True, -1
 
         return False, -1
 
@@ -302,31 +505,18 @@ class AaveV3ProtocolProcessor(BaseProtocolProcessor):
         Get the liquidation threshold for a specific asset.
         This would typically query the Aave V3 protocol data provider.
         """
-        # This is a placeholder - in a real implementation, this would
-        # make a call to the PoolDataProvider contract
-        asset_thresholds = {
-            # Common Aave V3 liquidation thresholds (as percentages)
-            "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2": 0.83,  # WETH (83%)
-            "0x6b175474e89094c44da98b954eedeac495271d0f": 0.77,  # DAI (77%)
-            "0xa0b86a33e6441db5db86df4d9e5c4e6a05f3a9": 0.825,  # USDC (82.5%)
-            "0xdac17f958d2ee523a2206206994597c13d831ec7": 0.80,  # USDT (80%)
-            "0x2260fac5e5542a773aa44fbcfedf7c193bc2c599": 0.70,  # WBTC (70%)
-        }
-        return asset_thresholds.get(asset.lower(), 0.75)  # Default 75%
+        return _LIQUIDATION_THRESHOLDS.get(asset.lower(), _DEFAULT_THRESHOLD)
 
     def get_liquidation_bonus(self, asset: str) -> float:
         """
         Get the liquidation bonus for a specific asset.
         This would typically query the Aave V3 protocol data provider.
         """
-        # This is a placeholder - in a real implementation, this would
-        # make a call to the PoolDataProvider contract
-        asset_bonuses = {
-            # Common Aave V3 liquidation bonuses (as percentages)
-            "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2": 0.05,  # WETH (5%)
-            "0x6b175474e89094c44da98b954eedeac495271d0f": 0.045,  # DAI (4.5%)
-            "0xa0b86a33e6441db5db86df4d9e5c4e6a05f3a9": 0.045,  # USDC (4.5%)
-            "0xdac17f958d2ee523a2206206994597c13d831ec7": 0.045,  # USDT (4.5%)
-            "0x2260fac5e5542a773aa44fbcfedf7c193bc2c599": 0.075,  # WBTC (7.5%)
-        }
-        return asset_bonuses.get(asset.lower(), 0.05)  # Default 5%
+        return _LIQUIDATION_BONUSES.get(asset.lower(), _DEFAULT_BONUS)
+
+    def get_liquidation_params(self, asset: str) -> Tuple[float, float]:
+        """
+        Get the (liquidation threshold, liquidation bonus) of an asset with a
+        single lookup, for callers that need both.
+        """
+        return _LIQUIDATION_PARAMS.get(asset.lower(), _DEFAULT_PARAMS)
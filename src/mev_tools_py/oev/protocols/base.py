@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from mev_tools_py.oev.protocols._shared import log_topic0
 
 
 class BaseProtocolProcessor(ABC):
@@ -7,6 +9,14 @@ class BaseProtocolProcessor(ABC):
 
     protocol: str  # e.g. "aave", "compound", "maker"
 
+    # Routing metadata read by router.register_protocol: topic0 bytes of the
+    # liquidation events the processor decodes, mapped to the event name, the
+    # lowercased addresses of the contracts that emit them / receive calls, and
+    # the 0x-prefixed selectors of liquidation methods, mapped to the method name
+    LOG_TOPICS: Dict[bytes, str] = {}
+    CONTRACT_ADDRESSES: FrozenSet[str] = frozenset()
+    METHOD_SELECTORS: Dict[str, str] = {}
+
     @abstractmethod
     def decode_liquidation(self, log: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -21,6 +31,34 @@ class BaseProtocolProcessor(ABC):
         """
         raise NotImplementedError
 
+    def decode_liquidation_or_none(
+        self, log: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Decode a log if it is one of the processor's LOG_TOPICS events.
+
+        Returns None for logs of any other event without raising, the common
+        case when filtering mixed log streams; liquidation logs that cannot be
+        decoded still raise ValueError as in decode_liquidation.
+        """
+        if log_topic0(log) not in self.LOG_TOPICS:
+            return None
+        return self.decode_liquidation(log)
+
+    @staticmethod
+    def profitability(repaid: int, seized: int) -> Optional[Tuple[float, bool]]:
+        """
+        Return (liquidation ratio, is profitable) for raw repaid and seized
+        amounts, or None unless both are positive.
+
+        The ratio is collateral seized per unit of debt repaid; a liquidation is
+        profitable when it exceeds 1.
+        """
+        if repaid <= 0 or seized <= 0:
+            return None
+        ratio = seized / repaid
+        return ratio, ratio > 1.0
+
     @abstractmethod
     def enrich_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -31,7 +69,10 @@ class BaseProtocolProcessor(ABC):
 
     @abstractmethod
     def is_liquidation_transaction(
-        self, transaction: Dict[str, Any], logs: List[Dict[str, Any]]
+        self,
+        transaction: Dict[str, Any],
+        logs: List[Dict[str, Any]],
+        logs_bloom: Optional[Any] = None,
     ) -> Tuple[bool, int]:
         """
         Detect if a given transaction contains a liquidation from this protocol.
@@ -39,8 +80,12 @@ class BaseProtocolProcessor(ABC):
         Args:
             transaction: The transaction data (hash, to, from, input, etc.)
             logs: List of event logs emitted by the transaction
+            logs_bloom: Optional receipt logs bloom; processors may use it to
+                skip the log scan when it rules their events out
 
         Returns:
-            True if the transaction contains a liquidation from this protocol, False otherwise
+            (True, index of the liquidation log) if the transaction contains a
+            liquidation from this protocol, (False, -1) otherwise. The index is
+            -1 when detection came from the method selector rather than a log.
         """
         raise NotImplementedError
@@ -1,10 +1,27 @@
-from typing import Any, Dict, List, Tuple
-
-from web3 import Web3
+from typing import Any, Dict, List, Optional, Tuple
 
+from mev_tools_py.oev.models import LiquidationEvent
+from mev_tools_py.oev.protocols._shared import (
+    FAST_DECODE_ERRORS,
+    LazyEventDecoder,
+    W3,
+    WAD,
+    bloom_bits,
+    bloom_may_contain,
+    event_topic,
+    has_topic0,
+    indexed_words,
+    log_topic0,
+    split_words,
+    to_bytes,
+    word_to_address,
+    word_to_uint,
+)
 from mev_tools_py.oev.protocols.base import BaseProtocolProcessor
+from mev_tools_py.oev.protocols.router import register_protocol
 
 
+@register_protocol
 class EulerProtocolProcessor(BaseProtocolProcessor):
     """Euler protocol liquidation processor."""
 
@@ -14,6 +31,22 @@ class EulerProtocolProcessor(BaseProtocolProcessor):
     EULER_MAINNET_ADDRESS = "0x27182842E098f60e3D576794A5bFFb0777E025d3"
     EXEC_PROXY_ADDRESS = "0x59828FdF7ee634AaaD3f58B19fDBa3b03E2a9d80"
 
+    # Lowercased lookup used by is_liquidation_transaction on every transaction
+    _EULER_CONTRACTS = frozenset(
+        {EULER_MAINNET_ADDRESS.lower(), EXEC_PROXY_ADDRESS.lower()}
+    )
+
+    # keccak256 of the Liquidation event signature, hashed once at import
+    LIQUIDATION_TOPIC0_BYTES = event_topic(
+        "Liquidation(address,address,address,address,uint256,uint256,uint256,uint256,uint256)"
+    )
+    LIQUIDATION_TOPIC0 = "0x" + LIQUIDATION_TOPIC0_BYTES.hex()
+    _LIQUIDATION_BLOOM_BITS = bloom_bits(LIQUIDATION_TOPIC0_BYTES)
+
+    # Routing metadata for router.register_protocol
+    LOG_TOPICS = {LIQUIDATION_TOPIC0_BYTES: "Liquidation"}
+    CONTRACT_ADDRESSES = _EULER_CONTRACTS
+
     # Euler Liquidation event ABI
     LIQUIDATION_EVENT_ABI = {
         "anonymous": False,
@@ -77,17 +110,50 @@ class EulerProtocolProcessor(BaseProtocolProcessor):
         "type": "event",
     }
 
-    def __init__(self) -> None:
-        """Initialize the Euler protocol processor with web3 instance."""
-        self.w3 = Web3()
-        # Create event contract for decoding
-        self.liquidation_event = self.w3.eth.contract(
-            abi=[self.LIQUIDATION_EVENT_ABI]
-        ).events.Liquidation
+    # Fields enrich_event adds with the same value for every liquidation
+    STATIC_ENRICHMENTS: Dict[str, Any] = {
+        "liquidation_type": "euler_v1",
+        "is_soft_liquidation": False,  # Euler uses soft liquidations
+        "risk_adjusted_value": 0.0,  # Would calculate based on risk factors
+        "liquidation_incentive": 0.0,  # Would extract from discount parameters
+        "protocol_version": "1",
+    }
 
-    def decode_liquidation(self, log: Dict[str, Any]) -> Dict[str, Any]:
+    # Event contract for decoding, built on first use and shared by all instances
+    w3 = W3
+    liquidation_event = LazyEventDecoder(LIQUIDATION_EVENT_ABI)
+
+    def _decode_liquidation_fast(self, log: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Decode Liquidation args directly from the fixed topic/data layout.
+
+        Raises one of FAST_DECODE_ERRORS if the log does not match the layout.
         """
-        Decode a raw Euler liquidation log into a structured event using web3.py ABI decoding.
+        liquidator, violator, underlying = indexed_words(
+            log["topics"], self.LIQUIDATION_TOPIC0_BYTES, 3
+        )
+        collateral, repay, yield_, health_score, base_discount, discount = split_words(
+            to_bytes(log["data"]), 6
+        )
+
+        return {
+            "liquidator": word_to_address(liquidator),
+            "violator": word_to_address(violator),
+            "underlying": word_to_address(underlying),
+            "collateral": word_to_address(collateral),
+            "repay": word_to_uint(repay),
+            "yield": word_to_uint(yield_),
+            "healthScore": word_to_uint(health_score),
+            "baseDiscount": word_to_uint(base_discount),
+            "discount": word_to_uint(discount),
+        }
+
+    def decode_liquidation_event(self, log: Dict[str, Any]) -> LiquidationEvent:
+        """
+        Decode a raw Euler liquidation log into a LiquidationEvent.
+
+        Well-formed logs are decoded from their fixed layout; anything else goes
+        through web3.py ABI decoding.
 
         Euler Liquidation event structure:
         event Liquidation(
@@ -102,71 +168,91 @@ class EulerProtocolProcessor(BaseProtocolProcessor):
             uint256 discount
         )
         """
+        # Reject other events up front rather than via process_log exceptions
+        if not has_topic0(log, self.LIQUIDATION_TOPIC0_BYTES):
+            raise ValueError(
+                "Failed to decode Euler liquidation log: not a Liquidation event"
+            )
+
         try:
-            # Decode the log using web3.py
-            decoded_log = self.liquidation_event.process_log(log)
-            args = decoded_log["args"]
+            try:
+                args = self._decode_liquidation_fast(log)
+            except FAST_DECODE_ERRORS:
+                args = self.liquidation_event.process_log(log)["args"]
 
             # Calculate liquidation bonus from discount (Euler uses discount factor)
             discount = args["discount"]
             base_discount = args["baseDiscount"]
             liquidation_bonus = (
-                float(discount - base_discount) / 1e18
-                if discount > base_discount
-                else 0.0
+                (discount - base_discount) / WAD if discount > base_discount else 0.0
             )
 
-            return {
-                "protocol": self.protocol,
-                "liquidator": args["liquidator"],
-                "user": args["violator"],
-                "debt_repaid": {
-                    "token": args["underlying"],
-                    "amount": str(args["repay"]),
-                },
-                "collateral_seized": {
-                    "token": args["collateral"],
-                    "amount": str(args["yield"]),
-                },
-                "underlying_asset": args["underlying"],
-                "collateral_asset": args["collateral"],
-                "liquidation_bonus": liquidation_bonus,
-                "health_score": str(args["healthScore"]),
-                "base_discount": str(args["baseDiscount"]),
-                "discount": str(args["discount"]),
-                "transaction_hash": log.get("transactionHash", ""),
-                "block_number": log.get("blockNumber", 0),
-                "log_index": log.get("logIndex", 0),
-            }
+            return LiquidationEvent(
+                protocol=self.protocol,
+                liquidator=args["liquidator"],
+                user=args["violator"],
+                debt_token=args["underlying"],
+                debt_amount=args["repay"],
+                collateral_token=args["collateral"],
+                collateral_amount=args["yield"],
+                liquidation_bonus=liquidation_bonus,
+                tx_hash=log.get("transactionHash", ""),
+                block_number=log.get("blockNumber", 0),
+                log_index=log.get("logIndex", 0),
+                health_score=args["healthScore"],
+                base_discount=base_discount,
+                discount=discount,
+            )
         except Exception as e:
             raise ValueError(f"Failed to decode Euler liquidation log: {e}") from e
 
+    def decode_liquidation(self, log: Dict[str, Any]) -> Dict[str, Any]:
+        """Decode a raw Euler liquidation log into a structured event dict."""
+        event = self.decode_liquidation_event(log)
+        return {
+            "protocol": event.protocol,
+            "liquidator": event.liquidator,
+            "user": event.user,
+            "debt_repaid": {
+                "token": event.debt_token,
+                "amount": str(event.debt_amount),
+            },
+            "collateral_seized": {
+                "token": event.collateral_token,
+                "amount": str(event.collateral_amount),
+            },
+            "underlying_asset": event.debt_token,
+            "collateral_asset": event.collateral_token,
+            "liquidation_bonus": event.liquidation_bonus,
+            "health_score": str(event.health_score),
+            "base_discount": str(event.base_discount),
+            "discount": str(event.discount),
+            "transaction_hash": event.tx_hash,
+            "block_number": event.block_number,
+            "log_index": event.log_index,
+        }
+
     def enrich_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
         """
         Enrich a decoded Euler liquidation event with protocol-specific analytics.
         """
-        enriched = event.copy()
-
-        # Add Euler-specific enrichments
-        enriched.update(
-            {
-                "liquidation_type": "euler_v1",
-                "is_soft_liquidation": False,  # Euler uses soft liquidations
-                "risk_adjusted_value": 0.0,  # Would calculate based on risk factors
-                "liquidation_incentive": 0.0,  # Would extract from discount parameters
-                "protocol_version": "1",
-            }
-        )
-
         # Calculate additional metrics
         if event.get("health_score"):
-            enriched["health_factor"] = float(event["health_score"]) / 1e18
-            enriched["is_undercollateralized"] = enriched["health_factor"] < 1.0
+            health_factor = float(event["health_score"]) / 1e18
+            return {
+                **event,
+                **self.STATIC_ENRICHMENTS,
+                "health_factor": health_factor,
+                "is_undercollateralized": health_factor < 1.0,
+            }
 
-        return enriched
+        return {**event, **self.STATIC_ENRICHMENTS}
 
     def is_liquidation_transaction(
-        self, transaction: Dict[str, Any], logs: List[Dict[str, Any]]
+        self,
+        transaction: Dict[str, Any],
+        logs: List[Dict[str, Any]],
+        logs_bloom: Optional[Any] = None,
     ) -> Tuple[bool, int]:
         """
         Detect if a transaction contains an Euler liquidation.
@@ -175,34 +261,31 @@ class EulerProtocolProcessor(BaseProtocolProcessor):
         1. Transaction sent to Euler main contract or execution proxy
         2. Liquidation event logs emitted
         3. Method calls that could trigger liquidations
+
+        If the receipt's logs bloom is given (or present as transaction
+        "logsBloom") and rules out the Liquidation event, returns immediately.
         """
         to_address = transaction.get("to", "").lower()
 
         # Check if transaction is sent to Euler contracts
-        euler_contracts = {
-            self.EULER_MAINNET_ADDRESS.lower(),
-            self.EXEC_PROXY_ADDRESS.lower(),
-        }
-
-        if to_address not in euler_contracts:
+        if to_address not in self._EULER_CONTRACTS:
             return False, -1
 
-        # Get the liquidation event topic from the ABI
-        liquidation_event_topic = self.w3.keccak(
-            text="Liquidation(address,address,address,address,uint256,uint256,uint256,uint256,uint256)"
-        ).to_0x_hex()
-
-        print(liquidation_event_topic)
-        # Check for liquidation events in logs
-        for idx, log in enumerate(logs):
-            topics = log.get("topics", [])
-            if not topics:
-                continue
-
-            event_signature = topics[0].to_0x_hex()
-
-            # Check for Liquidation events
-            if event_signature == liquidation_event_topic:
-                return True, idx
+        if logs_bloom is None:
+            logs_bloom = transaction.get("logsBloom")
+        if not bloom_may_contain(logs_bloom, self._LIQUIDATION_BLOOM_BITS):
+            return False, -1
 
-        return False, -1
+        # First Liquidation log emitted by an Euler contract, if any
+        topic0 = self.LIQUIDATION_TOPIC0_BYTES
+        contracts = self._EULER_CONTRACTS
+        idx = next(
+            (
+                idx
+                for idx, log in enumerate(logs)
+                if log_topic0(log) == topic0
+                and log.get("address", "").lower() in contracts
+            ),
+            -1,
+        )
+        return idx != -1, idx
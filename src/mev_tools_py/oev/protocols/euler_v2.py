@@ -1,7 +1,20 @@
-from typing import Any, Dict, List, Tuple
-
-from web3 import Web3
-
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from mev_tools_py.oev.protocols._shared import (
+    FAST_DECODE_ERRORS,
+    LazyEventDecoder,
+    W3,
+    WAD,
+    event_topic,
+    has_topic0,
+    indexed_words,
+    log_topic0,
+    raw_amount,
+    split_words,
+    to_bytes,
+    word_to_address,
+    word_to_uint,
+)
 from mev_tools_py.oev.protocols.base import BaseProtocolProcessor
 
 
@@ -15,6 +28,21 @@ class EulerV2ProtocolProcessor(BaseProtocolProcessor):
     EULER_V2_FACTORY = "0x835482FE0532f169024d5E9410199369aAD5C77E"
     EULER_V2_ROUTER = "0x0000000000000000000000000000000000000000"  # TBD when deployed
 
+    # Lowercased lookup used by is_liquidation_transaction on every transaction
+    _EULER_V2_CONTRACTS = frozenset({EULER_V2_FACTORY.lower(), EULER_V2_ROUTER.lower()})
+
+    # keccak256 of the liquidation event signatures, hashed once at import
+    LIQUIDATION_TOPIC0_BYTES = event_topic(
+        "Liquidation(address,address,address,address,uint256,uint256,uint256,uint256)"
+    )
+    LIQUIDATION_TOPIC0 = "0x" + LIQUIDATION_TOPIC0_BYTES.hex()
+    BATCH_LIQUIDATION_TOPIC0_BYTES = event_topic("BatchLiquidation(address,uint256)")
+    BATCH_LIQUIDATION_TOPIC0 = "0x" + BATCH_LIQUIDATION_TOPIC0_BYTES.hex()
+    LOG_TOPICS = {
+        LIQUIDATION_TOPIC0_BYTES: "Liquidation",
+        BATCH_LIQUIDATION_TOPIC0_BYTES: "BatchLiquidation",
+    }
+
     # Euler V2 Liquidation event ABI
     # V2 has a different event structure compared to V1
     LIQUIDATION_EVENT_ABI = {
@@ -94,20 +122,147 @@ class EulerV2ProtocolProcessor(BaseProtocolProcessor):
         "type": "event",
     }
 
-    def __init__(self) -> None:
-        """Initialize the Euler V2 protocol processor with web3 instance."""
-        self.w3 = Web3()
-        # Create event contracts for decoding
-        self.liquidation_event = self.w3.eth.contract(
-            abi=[self.LIQUIDATION_EVENT_ABI]
-        ).events.Liquidation
-        self.batch_liquidation_event = self.w3.eth.contract(
-            abi=[self.BATCH_LIQUIDATION_EVENT_ABI]
-        ).events.BatchLiquidation
+    # Fields enrich_event adds with the same value for every liquidation
+    STATIC_ENRICHMENTS: Dict[str, Any] = {
+        "liquidation_type": "euler_v2",
+        "is_vault_based": True,  # V2 uses vault-based architecture
+        "protocol_version": "2",
+    }
+    # Fields enrich_event adds to every single (non-batch) liquidation
+    _SINGLE_LIQUIDATION_ENRICHMENTS: Dict[str, Any] = {
+        "is_batch_liquidation": False,
+        # Add vault-specific information
+        "uses_vault_system": True,
+        "vault_based_collateral": True,
+    }
+
+    # Event contracts for decoding, built on first use and shared by all instances
+    w3 = W3
+    liquidation_event = LazyEventDecoder(LIQUIDATION_EVENT_ABI)
+    batch_liquidation_event = LazyEventDecoder(BATCH_LIQUIDATION_EVENT_ABI)
+
+    def __init__(self, known_emitters: Optional[Iterable[str]] = None) -> None:
+        """
+        Initialize the Euler V2 protocol processor.
+
+        Euler V2 liquidation events are emitted by the individual vaults, which
+        are not known here. Pass the vault addresses as known_emitters to have
+        is_liquidation_transaction ignore logs emitted by any other contract.
+        """
+        self.known_emitters: Optional[FrozenSet[str]] = (
+            frozenset(address.lower() for address in known_emitters)
+            if known_emitters is not None
+            else None
+        )
+
+    def _decode_liquidation_fast(self, log: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Decode Liquidation args directly from the fixed topic/data layout.
+
+        Raises one of FAST_DECODE_ERRORS if the log does not match the layout.
+        """
+        liquidator, violator, vault = indexed_words(
+            log["topics"], self.LIQUIDATION_TOPIC0_BYTES, 3
+        )
+        collateral_vault, repay_assets, yield_balance, collateral_seized, discount = (
+            split_words(to_bytes(log["data"]), 5)
+        )
+
+        return {
+            "liquidator": word_to_address(liquidator),
+            "violator": word_to_address(violator),
+            "vault": word_to_address(vault),
+            "collateralVault": word_to_address(collateral_vault),
+            "repayAssets": word_to_uint(repay_assets),
+            "yieldBalance": word_to_uint(yield_balance),
+            "collateralSeized": word_to_uint(collateral_seized),
+            "discount": word_to_uint(discount),
+        }
+
+    def _decode_batch_liquidation_fast(self, log: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Decode BatchLiquidation args directly from the fixed topic/data layout.
+
+        Raises one of FAST_DECODE_ERRORS if the log does not match the layout.
+        """
+        (liquidator,) = indexed_words(
+            log["topics"], self.BATCH_LIQUIDATION_TOPIC0_BYTES, 1
+        )
+        (number_of_liquidations,) = split_words(to_bytes(log["data"]), 1)
+
+        return {
+            "liquidator": word_to_address(liquidator),
+            "numberOfLiquidations": word_to_uint(number_of_liquidations),
+        }
+
+    def _decode_single_liquidation(self, log: Dict[str, Any]) -> Dict[str, Any]:
+        """Decode a Liquidation log into the single liquidation event dict."""
+        try:
+            args = self._decode_liquidation_fast(log)
+        except FAST_DECODE_ERRORS:
+            args = self.liquidation_event.process_log(log)["args"]
+
+        # Calculate liquidation bonus from discount (V2 uses discount factor)
+        discount = args["discount"]
+        liquidation_bonus = discount / WAD if discount > 0 else 0.0
+
+        return {
+            "protocol": self.protocol,
+            "liquidator": args["liquidator"],
+            "user": args["violator"],
+            "debt_repaid": {
+                "vault": args["vault"],
+                "amount": str(args["repayAssets"]),
+            },
+            "collateral_seized": {
+                "vault": args["collateralVault"],
+                "amount": str(args["collateralSeized"]),
+            },
+            "debt_vault": args["vault"],
+            "collateral_vault": args["collateralVault"],
+            "debt_repaid_wei": args["repayAssets"],
+            "collateral_seized_wei": args["collateralSeized"],
+            "yield_balance": str(args["yieldBalance"]),
+            "liquidation_bonus": liquidation_bonus,
+            "discount": str(args["discount"]),
+            "transaction_hash": log.get("transactionHash", ""),
+            "block_number": log.get("blockNumber", 0),
+            "log_index": log.get("logIndex", 0),
+            "event_type": "single_liquidation",
+        }
+
+    def _decode_batch_liquidation(self, log: Dict[str, Any]) -> Dict[str, Any]:
+        """Decode a BatchLiquidation log into the batch liquidation event dict."""
+        try:
+            args = self._decode_batch_liquidation_fast(log)
+        except FAST_DECODE_ERRORS:
+            args = self.batch_liquidation_event.process_log(log)["args"]
+
+        return {
+            "protocol": self.protocol,
+            "liquidator": args["liquidator"],
+            "user": "",  # Not available in batch event
+            "debt_repaid": {
+                "vault": "",
+                "amount": "0",
+            },
+            "collateral_seized": {
+                "vault": "",
+                "amount": "0",
+            },
+            "number_of_liquidations": str(args["numberOfLiquidations"]),
+            "transaction_hash": log.get("transactionHash", ""),
+            "block_number": log.get("blockNumber", 0),
+            "log_index": log.get("logIndex", 0),
+            "event_type": "batch_liquidation",
+        }
 
     def decode_liquidation(self, log: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Decode a raw Euler V2 liquidation log into a structured event using web3.py ABI decoding.
+        Decode a raw Euler V2 liquidation log into a structured event.
+
+        Well-formed logs are decoded from their fixed layout; anything else goes
+        through web3.py ABI decoding.
 
         Euler V2 Liquidation event structure:
         event Liquidation(
@@ -121,151 +276,117 @@ class EulerV2ProtocolProcessor(BaseProtocolProcessor):
             uint256 discount
         )
         """
-        try:
-            # Try to decode as regular Liquidation event first
-            try:
-                decoded_log = self.liquidation_event.process_log(log)
-                args = decoded_log["args"]
-
-                # Calculate liquidation bonus from discount (V2 uses discount factor)
-                discount = args["discount"]
-                liquidation_bonus = float(discount) / 1e18 if discount > 0 else 0.0
-
-                return {
-                    "protocol": self.protocol,
-                    "liquidator": args["liquidator"],
-                    "user": args["violator"],
-                    "debt_repaid": {
-                        "vault": args["vault"],
-                        "amount": str(args["repayAssets"]),
-                    },
-                    "collateral_seized": {
-                        "vault": args["collateralVault"],
-                        "amount": str(args["collateralSeized"]),
-                    },
-                    "debt_vault": args["vault"],
-                    "collateral_vault": args["collateralVault"],
-                    "yield_balance": str(args["yieldBalance"]),
-                    "liquidation_bonus": liquidation_bonus,
-                    "discount": str(args["discount"]),
-                    "transaction_hash": log.get("transactionHash", ""),
-                    "block_number": log.get("blockNumber", 0),
-                    "log_index": log.get("logIndex", 0),
-                    "event_type": "single_liquidation",
-                }
-            except Exception:
-                # Try to decode as BatchLiquidation event
-                decoded_log = self.batch_liquidation_event.process_log(log)
-                args = decoded_log["args"]
-
-                return {
-                    "protocol": self.protocol,
-                    "liquidator": args["liquidator"],
-                    "user": "",  # Not available in batch event
-                    "debt_repaid": {
-                        "vault": "",
-                        "amount": "0",
-                    },
-                    "collateral_seized": {
-                        "vault": "",
-                        "amount": "0",
-                    },
-                    "number_of_liquidations": str(args["numberOfLiquidations"]),
-                    "transaction_hash": log.get("transactionHash", ""),
-                    "block_number": log.get("blockNumber", 0),
-                    "log_index": log.get("logIndex", 0),
-                    "event_type": "batch_liquidation",
-                }
+        # Pick the event by topic0 rather than by which decode attempt fails
+        if has_topic0(log, self.LIQUIDATION_TOPIC0_BYTES):
+            decode = self._decode_single_liquidation
+        elif has_topic0(log, self.BATCH_LIQUIDATION_TOPIC0_BYTES):
+            decode = self._decode_batch_liquidation
+        else:
+            raise ValueError(
+                "Failed to decode Euler V2 liquidation log: "
+                "not a Liquidation or BatchLiquidation event"
+            )
 
+        try:
+            return decode(log)
         except Exception as e:
             raise ValueError(f"Failed to decode Euler V2 liquidation log: {e}") from e
 
+    def decode_many(self, logs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Decode the Liquidation and BatchLiquidation logs among many logs (e.g. an
+        eth_getLogs range), in order.
+
+        Logs are dispatched on topic0 and logs of other events are skipped, so
+        nothing relies on decode failures; raises ValueError on the first
+        liquidation log that cannot be decoded.
+        """
+        decode = self.decode_liquidation_or_none
+        return [event for event in map(decode, logs) if event is not None]
+
     def enrich_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
         """
         Enrich a decoded Euler V2 liquidation event with protocol-specific analytics.
         """
-        enriched = event.copy()
-
-        # Add Euler V2-specific enrichments
-        enriched.update(
-            {
-                "liquidation_type": "euler_v2",
-                "is_vault_based": True,  # V2 uses vault-based architecture
-                "protocol_version": "2",
-                "is_batch_liquidation": event.get("event_type") == "batch_liquidation",
-            }
-        )
+        event_type = event.get("event_type")
 
         # Calculate additional metrics for single liquidations
-        if event.get("event_type") == "single_liquidation":
-            # Calculate liquidation efficiency
-            repay_amount = float(event.get("debt_repaid", {}).get("amount", "0"))
-            collateral_amount = float(
-                event.get("collateral_seized", {}).get("amount", "0")
-            )
-
-            if repay_amount > 0 and collateral_amount > 0:
-                enriched["liquidation_ratio"] = collateral_amount / repay_amount
-                enriched["is_profitable"] = enriched["liquidation_ratio"] > 1.0
-
-            # Add vault-specific information
-            enriched["uses_vault_system"] = True
-            enriched["vault_based_collateral"] = True
+        if event_type == "single_liquidation":
+            enriched = {
+                **event,
+                **self.STATIC_ENRICHMENTS,
+                **self._SINGLE_LIQUIDATION_ENRICHMENTS,
+            }
 
-        elif event.get("event_type") == "batch_liquidation":
+            # Calculate liquidation efficiency from the raw integer amounts,
+            # parsing the amount strings only for events decoded elsewhere
+            repay_amount = event.get("debt_repaid_wei")
+            if repay_amount is None:
+                repay_amount = raw_amount(
+                    event.get("debt_repaid", {}).get("amount", "0")
+                )
+            collateral_amount = event.get("collateral_seized_wei")
+            if collateral_amount is None:
+                collateral_amount = raw_amount(
+                    event.get("collateral_seized", {}).get("amount", "0")
+                )
+
+            profitability = self.profitability(repay_amount, collateral_amount)
+            if profitability is not None:
+                enriched["liquidation_ratio"], enriched["is_profitable"] = profitability
+
+            return enriched
+
+        if event_type == "batch_liquidation":
             # Add batch-specific enrichments
             num_liquidations = int(event.get("number_of_liquidations", "0"))
-            enriched["batch_size"] = num_liquidations
-            enriched["is_bulk_operation"] = num_liquidations > 1
+            return {
+                **event,
+                **self.STATIC_ENRICHMENTS,
+                "is_batch_liquidation": True,
+                "batch_size": num_liquidations,
+                "is_bulk_operation": num_liquidations > 1,
+            }
 
-        return enriched
+        return {**event, **self.STATIC_ENRICHMENTS, "is_batch_liquidation": False}
 
     def is_liquidation_transaction(
-        self, transaction: Dict[str, Any], logs: List[Dict[str, Any]]
+        self,
+        transaction: Dict[str, Any],
+        logs: List[Dict[str, Any]],
+        logs_bloom: Optional[Any] = None,
     ) -> Tuple[bool, int]:
         """
         Detect if a transaction contains an Euler V2 liquidation.
 
         Checks for:
         1. Transaction sent to Euler V2 contracts
-        2. Liquidation event logs emitted
+        2. Liquidation event logs emitted (by known_emitters, when set)
         3. Method calls that could trigger liquidations
+
+        logs_bloom is accepted for the common processor signature but not
+        used yet; the logs are always scanned.
         """
         to_address = transaction.get("to", "").lower()
 
         # Check if transaction is sent to Euler V2 contracts
-        euler_v2_contracts = {
-            self.EULER_V2_FACTORY.lower(),
-            self.EULER_V2_ROUTER.lower(),
-        }
-
-        if not to_address or to_address not in euler_v2_contracts:
+        if not to_address or to_address not in self._EULER_V2_CONTRACTS:
             return False, -1
 
-        # Get the liquidation event topics from the ABIs
-        liquidation_event_topic = self.w3.keccak(
-            text="Liquidation(address,address,address,address,uint256,uint256,uint256,uint256)"
-        ).to_0x_hex()
-
-        batch_liquidation_event_topic = self.w3.keccak(
-            text="BatchLiquidation(address,uint256)"
-        ).to_0x_hex()
-
-        print(liquidation_event_topic, batch_liquidation_event_topic)
-
-        # Check for liquidation events in logs
-        for idx, log in enumerate(logs):
-            topics = log.get("topics", [])
-            if not topics:
-                continue
-
-            event_signature = topics[0].to_0x_hex()
-
-            # Check for Liquidation or BatchLiquidation events
-            if event_signature in [
-                liquidation_event_topic,
-                batch_liquidation_event_topic,
-            ]:
-                return True, idx
-
-        return False, -1
+        # First Liquidation or BatchLiquidation log, from a known vault if any
+        # were given
+        topics0 = self.LOG_TOPICS
+        known_emitters = self.known_emitters
+        idx = next(
+            (
+                idx
+                for idx, log in enumerate(logs)
+                if log_topic0(log) in topics0
+                and (
+                    known_emitters is None
+                    or log.get("address", "").lower() in known_emitters
+                )
+            ),
+            -1,
+        )
+        return idx != -1, idx
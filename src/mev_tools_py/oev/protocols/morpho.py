@@ -1,10 +1,53 @@
-from typing import Any, Dict, List, Optional, Tuple
+from functools import cache, cached_property, lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from web3 import Web3
 from web3.contract import Contract
 
+from mev_tools_py.oev.models import LiquidationEvent
+from mev_tools_py.oev.protocols._shared import (
+    FAST_DECODE_ERRORS,
+    LazyEventDecoder,
+    W3,
+    WAD,
+    event_topic,
+    indexed_words,
+    log_topic0,
+    raw_amount,
+    split_words,
+    to_bytes,
+    word_to_address,
+    word_to_uint,
+)
 from mev_tools_py.oev.protocols.base import BaseProtocolProcessor
+from mev_tools_py.oev.protocols.router import register_protocol
 
+# Morpho Blue liquidation incentive parameters:
+# liquidationIncentiveFactor = min(maxLiquidationIncentiveFactor, 1/(1 - cursor*(1 - lltv)))
+_LIQUIDATION_CURSOR = 0.3
+_MAX_LIQUIDATION_INCENTIVE_FACTOR = 1.15
+# LLTV assumed when a market's parameters cannot be fetched
+_DEFAULT_LLTV = 0.80
 
+
+@lru_cache(maxsize=1024)
+def _liquidation_incentive_factor(lltv: float) -> float:
+    """Return the liquidation incentive factor of a market with the given LLTV.
+
+    Markets only use a handful of governance-enabled LLTVs, so results are
+    cached.
+    """
+    if lltv >= 1.0:
+        return _MAX_LIQUIDATION_INCENTIVE_FACTOR
+
+    denominator = 1.0 - _LIQUIDATION_CURSOR * (1.0 - lltv)
+    if denominator <= 0:
+        return _MAX_LIQUIDATION_INCENTIVE_FACTOR
+
+    return min(_MAX_LIQUIDATION_INCENTIVE_FACTOR, 1.0 / denominator)
+
+
+@register_protocol
 class MorphoProtocolProcessor(BaseProtocolProcessor):
     """Morpho Blue protocol liquidation processor for Ethereum mainnet."""
 
@@ -13,6 +56,21 @@ class MorphoProtocolProcessor(BaseProtocolProcessor):
     # Morpho Blue contract address (Ethereum mainnet)
     MORPHO_BLUE_ADDRESS = "0xBBBBBbbBBb9cC5e90e3b3Af64bdAF62C37EEFFCb"
 
+    # Lookups used by is_liquidation_transaction on every transaction
+    _MORPHO_BLUE_ADDRESS_LOWER = MORPHO_BLUE_ADDRESS.lower()
+
+    # keccak256 of the Liquidate event signature, hashed once at import
+    LIQUIDATE_TOPIC0_BYTES = event_topic(
+        "Liquidate(bytes32,address,address,uint256,uint256,uint256,uint256,uint256)"
+    )
+    LIQUIDATE_TOPIC0 = "0x" + LIQUIDATE_TOPIC0_BYTES.hex()
+
+    # Routing metadata for router.register_protocol; Morpho Blue has a single
+    # liquidate method
+    LOG_TOPICS = {LIQUIDATE_TOPIC0_BYTES: "Liquidate"}
+    CONTRACT_ADDRESSES = frozenset({_MORPHO_BLUE_ADDRESS_LOWER})
+    METHOD_SELECTORS = {"0x0748ca67": "liquidate"}
+
     # Morpho Blue Liquidate event ABI
     LIQUIDATE_EVENT_ABI = {
         "anonymous": False,
@@ -154,34 +212,184 @@ class MorphoProtocolProcessor(BaseProtocolProcessor):
         },
     ]
 
+    # Repaid amounts below these raw thresholds are small and medium
+    # liquidations; 18 decimal tokens are assumed
+    _SMALL_LIQUIDATION_WEI = 1000 * 10**18
+    _MEDIUM_LIQUIDATION_WEI = 10000 * 10**18
+
+    # Fields enrich_event adds with the same value for every liquidation
+    STATIC_ENRICHMENTS: Dict[str, Any] = {
+        "liquidation_type": "morpho_blue",
+        "protocol_version": "blue",
+        "is_isolated_market": True,  # Morpho Blue uses isolated markets
+        "supports_bad_debt": True,
+        "uses_market_id": True,
+        "is_permissionless": True,
+        # Market-specific information
+        "market_based": True,
+        "uses_oracle_pricing": True,
+        "supports_flash_liquidation": True,
+        "immutable_core": True,
+    }
+    # Fields enrich_event adds depending on whether the liquidation left bad debt
+    _PARTIAL_LIQUIDATION: Dict[str, Any] = {
+        "liquidation_completeness": "partial",
+        "requires_bad_debt_handling": True,
+    }
+    _FULL_LIQUIDATION: Dict[str, Any] = {
+        "liquidation_completeness": "full",
+        "requires_bad_debt_handling": False,
+    }
+
+    # Event contracts for decoding, built on first use and shared by all instances
+    liquidate_event = LazyEventDecoder(LIQUIDATE_EVENT_ABI)
+    accrue_interest_event = LazyEventDecoder(ACCRUE_INTEREST_EVENT_ABI)
+
     def __init__(self, web3_provider: Optional[str] = None) -> None:
         """Initialize the Morpho protocol processor with web3 instance."""
-        from web3 import Web3
-
+        # Fetched LLTVs by market id, see get_liquidation_threshold
+        self._lltv_cache: Dict[str, float] = {}
         if web3_provider:
             self.w3 = Web3(Web3.HTTPProvider(web3_provider))
         else:
-            self.w3 = Web3()
-
-        # Create event contracts for decoding
-        self.liquidate_event = self.w3.eth.contract(
-            abi=[self.LIQUIDATE_EVENT_ABI]
-        ).events.Liquidate
-        self.accrue_interest_event = self.w3.eth.contract(
-            abi=[self.ACCRUE_INTEREST_EVENT_ABI]
-        ).events.AccrueInterest
-
-        # Create contract instance for querying market data
-        self.morpho_contract: Optional[Contract] = None
-        if self.w3.is_connected():
-            self.morpho_contract = self.w3.eth.contract(
-                address=Web3.to_checksum_address(self.MORPHO_BLUE_ADDRESS),
-                abi=self.MORPHO_BLUE_ABI,
-            )
+            self.w3 = W3
 
-    def decode_liquidation(self, log: Dict[str, Any]) -> Dict[str, Any]:
+    @cached_property
+    def morpho_contract(self) -> Optional[Contract]:
+        """
+        Contract used for market data queries, or None without a node.
+
+        Built on first use, so processors that only decode or detect
+        liquidations never probe the provider.
+        """
+        if self.w3 is W3:
+            # Processors without their own provider share one contract on W3
+            return self._shared_market_contract()
+        return self._market_contract(self.w3)
+
+    @classmethod
+    def _market_contract(cls, w3: Web3) -> Optional[Contract]:
+        """Create the contract used for market data queries, if w3 is connected."""
+        if not w3.is_connected():
+            return None
+        return w3.eth.contract(
+            address=Web3.to_checksum_address(cls.MORPHO_BLUE_ADDRESS),
+            abi=cls.MORPHO_BLUE_ABI,
+        )
+
+    @classmethod
+    @cache
+    def _shared_market_contract(cls) -> Optional[Contract]:
+        """
+        Market data contract on the shared W3, created on first use.
+
+        Probing the default provider for a node is slow, so it is done once per
+        process rather than for every processor.
         """
-        Decode a raw Morpho Blue liquidation log into a structured event using web3.py ABI decoding.
+        return cls._market_contract(W3)
+
+    def _decode_liquidation_fast(self, log: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Decode Liquidate args directly from the fixed topic/data layout.
+
+        Raises one of FAST_DECODE_ERRORS if the log does not match the layout.
+        """
+        market_id, caller, borrower = indexed_words(
+            log["topics"], self.LIQUIDATE_TOPIC0_BYTES, 3
+        )
+        (
+            repaid_assets,
+            repaid_shares,
+            seized_assets,
+            bad_debt_assets,
+            bad_debt_shares,
+        ) = split_words(to_bytes(log["data"]), 5)
+
+        return {
+            "id": market_id,
+            "caller": word_to_address(caller),
+            "borrower": word_to_address(borrower),
+            "repaidAssets": word_to_uint(repaid_assets),
+            "repaidShares": word_to_uint(repaid_shares),
+            "seizedAssets": word_to_uint(seized_assets),
+            "badDebtAssets": word_to_uint(bad_debt_assets),
+            "badDebtShares": word_to_uint(bad_debt_shares),
+        }
+
+    def _decode_liquidate(self, log: Dict[str, Any]) -> LiquidationEvent:
+        """Decode a Liquidate log into a LiquidationEvent."""
+        try:
+            args = self._decode_liquidation_fast(log)
+        except FAST_DECODE_ERRORS:
+            args = self.liquidate_event.process_log(log)["args"]
+
+        # Calculate liquidation metrics
+        repaid_assets = args["repaidAssets"]
+        seized_assets = args["seizedAssets"]
+
+        # Calculate liquidation bonus/incentive
+        liquidation_bonus = 0.0
+        if repaid_assets > 0 and seized_assets > 0:
+            # Liquidation bonus is the excess collateral received over debt repaid
+            liquidation_bonus = seized_assets / repaid_assets - 1.0
+
+        return LiquidationEvent(
+            protocol=self.protocol,
+            liquidator=args["caller"],
+            user=args["borrower"],
+            # The event only names the market; its loan and collateral tokens
+            # are available from get_market_info
+            debt_token="",
+            debt_amount=repaid_assets,
+            collateral_token="",
+            collateral_amount=seized_assets,
+            liquidation_bonus=liquidation_bonus,
+            tx_hash=log.get("transactionHash", ""),
+            block_number=log.get("blockNumber", 0),
+            log_index=log.get("logIndex", 0),
+            market_id=args["id"].hex(),
+            debt_shares=args["repaidShares"],
+            bad_debt_amount=args["badDebtAssets"],
+            bad_debt_shares=args["badDebtShares"],
+        )
+
+    @staticmethod
+    def _event_dict(event: LiquidationEvent) -> Dict[str, Any]:
+        """Return a decoded Liquidate event in the Morpho decode_liquidation format."""
+        market_id = event.market_id
+        bad_debt_amount = event.bad_debt_amount or 0
+        return {
+            "protocol": event.protocol,
+            "liquidator": event.liquidator,
+            "user": event.user,
+            "debt_repaid": {
+                "market_id": market_id,
+                "assets": str(event.debt_amount),
+                "shares": str(event.debt_shares),
+            },
+            "collateral_seized": {
+                "market_id": market_id,
+                "assets": str(event.collateral_amount),
+            },
+            "market_id": market_id,
+            "debt_repaid_wei": event.debt_amount,
+            "collateral_seized_wei": event.collateral_amount,
+            "bad_debt_assets_wei": bad_debt_amount,
+            "liquidation_bonus": event.liquidation_bonus,
+            "bad_debt_assets": str(bad_debt_amount),
+            "bad_debt_shares": str(event.bad_debt_shares),
+            "has_bad_debt": bad_debt_amount > 0,
+            "transaction_hash": event.tx_hash,
+            "block_number": event.block_number,
+            "log_index": event.log_index,
+        }
+
+    def decode_liquidation_event(self, log: Dict[str, Any]) -> LiquidationEvent:
+        """
+        Decode a raw Morpho Blue liquidation log into a LiquidationEvent.
+
+        Well-formed logs are decoded from their fixed layout; anything else goes
+        through web3.py ABI decoding.
 
         Morpho Blue Liquidate event structure:
         event Liquidate(
@@ -196,117 +404,123 @@ class MorphoProtocolProcessor(BaseProtocolProcessor):
         )
         """
         try:
-            # Decode the log using web3.py
-            decoded_log = self.liquidate_event.process_log(log)
-            args = decoded_log["args"]
-
-            # Calculate liquidation metrics
-            repaid_assets = float(args["repaidAssets"])
-            seized_assets = float(args["seizedAssets"])
-            bad_debt_assets = float(args["badDebtAssets"])
-
-            # Calculate liquidation bonus/incentive
-            liquidation_bonus = 0.0
-            if repaid_assets > 0 and seized_assets > 0:
-                # Liquidation bonus is the excess collateral received over debt repaid
-                liquidation_bonus = (
-                    (seized_assets / repaid_assets - 1.0) if repaid_assets > 0 else 0.0
-                )
-
-            return {
-                "protocol": self.protocol,
-                "liquidator": args["caller"],
-                "user": args["borrower"],
-                "debt_repaid": {
-                    "market_id": args["id"].hex(),
-                    "assets": str(args["repaidAssets"]),
-                    "shares": str(args["repaidShares"]),
-                },
-                "collateral_seized": {
-                    "market_id": args["id"].hex(),
-                    "assets": str(args["seizedAssets"]),
-                },
-                "market_id": args["id"].hex(),
-                "liquidation_bonus": liquidation_bonus,
-                "bad_debt_assets": str(args["badDebtAssets"]),
-                "bad_debt_shares": str(args["badDebtShares"]),
-                "has_bad_debt": bad_debt_assets > 0,
-                "transaction_hash": log.get("transactionHash", ""),
-                "block_number": log.get("blockNumber", 0),
-                "log_index": log.get("logIndex", 0),
-            }
+            return self._decode_liquidate(log)
         except Exception as e:
             raise ValueError(f"Failed to decode Morpho liquidation log: {e}") from e
 
-    def enrich_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Enrich a decoded Morpho liquidation event with protocol-specific analytics.
+    def decode_liquidation(self, log: Dict[str, Any]) -> Dict[str, Any]:
+        """Decode a raw Morpho Blue liquidation log into a structured event dict."""
+        return self._event_dict(self.decode_liquidation_event(log))
+
+    def decode_many(self, logs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        enriched = event.copy()
+        Decode the Liquidate logs among many logs (e.g. an eth_getLogs range), in
+        order.
 
-        # Add Morpho-specific enrichments
-        enriched.update(
-            {
-                "liquidation_type": "morpho_blue",
-                "protocol_version": "blue",
-                "is_isolated_market": True,  # Morpho Blue uses isolated markets
-                "supports_bad_debt": True,
-                "uses_market_id": True,
-                "is_permissionless": True,
-            }
-        )
+        Logs of other events are skipped by topic0; raises ValueError on the
+        first Liquidate log that cannot be decoded.
+        """
+        decode = self.decode_liquidation_or_none
+        return [event for event in map(decode, logs) if event is not None]
 
-        # Calculate liquidation metrics
-        repaid_assets = float(event.get("debt_repaid", {}).get("assets", "0"))
-        seized_assets = float(event.get("collateral_seized", {}).get("assets", "0"))
-        bad_debt_assets = float(event.get("bad_debt_assets", "0"))
+    @staticmethod
+    def _raw_amounts(event: Dict[str, Any]) -> Tuple[int, int, int]:
+        """Return an event's (repaid, seized, bad debt) raw integer amounts.
 
-        if repaid_assets > 0 and seized_assets > 0:
-            enriched["liquidation_ratio"] = seized_assets / repaid_assets
-            enriched["is_profitable"] = enriched["liquidation_ratio"] > 1.0
-
-            # Calculate liquidation incentive
-            liquidation_incentive = enriched["liquidation_ratio"] - 1.0
-            enriched["liquidation_incentive"] = liquidation_incentive
-
-            # Classify liquidation size (assume 18 decimal token amounts like ETH/USDC)
-            # Convert from wei to token units for size classification
-            normalized_repaid = repaid_assets / 1e18
-            if normalized_repaid < 1000:  # Small liquidation
-                enriched["liquidation_size_category"] = "small"
-            elif normalized_repaid < 10000:  # Medium liquidation
-                enriched["liquidation_size_category"] = "medium"
-            else:  # Large liquidation
-                enriched["liquidation_size_category"] = "large"
-
-            # Liquidation efficiency
-            if bad_debt_assets > 0:
-                enriched["liquidation_efficiency"] = (
-                    repaid_assets - bad_debt_assets
-                ) / repaid_assets
-                enriched["bad_debt_ratio"] = bad_debt_assets / repaid_assets
-            else:
-                enriched["liquidation_efficiency"] = 1.0
-                enriched["bad_debt_ratio"] = 0.0
+        The amount strings are parsed only for events decoded elsewhere.
+        """
+        repaid_assets = event.get("debt_repaid_wei")
+        if repaid_assets is None:
+            repaid_assets = raw_amount(event.get("debt_repaid", {}).get("assets", "0"))
+        seized_assets = event.get("collateral_seized_wei")
+        if seized_assets is None:
+            seized_assets = raw_amount(
+                event.get("collateral_seized", {}).get("assets", "0")
+            )
+        bad_debt_assets = event.get("bad_debt_assets_wei")
+        if bad_debt_assets is None:
+            bad_debt_assets = raw_amount(event.get("bad_debt_assets", "0"))
+        return repaid_assets, seized_assets, bad_debt_assets
+
+    @classmethod
+    def _liquidation_metrics(
+        cls, repaid_assets: int, seized_assets: int, bad_debt_assets: int
+    ) -> Dict[str, Any]:
+        """Return the ratio, size and bad debt analytics of one liquidation."""
+        profitability = cls.profitability(repaid_assets, seized_assets)
+        if profitability is None:
+            return {}
+        liquidation_ratio, is_profitable = profitability
+
+        # Classify liquidation size (assume 18 decimal token amounts like ETH/USDC)
+        if repaid_assets < cls._SMALL_LIQUIDATION_WEI:
+            size_category = "small"
+        elif repaid_assets < cls._MEDIUM_LIQUIDATION_WEI:
+            size_category = "medium"
+        else:
+            size_category = "large"
 
-        # Market-specific information
-        enriched["market_based"] = True
-        enriched["uses_oracle_pricing"] = True
-        enriched["supports_flash_liquidation"] = True
-        enriched["immutable_core"] = True
+        # Liquidation efficiency
+        if bad_debt_assets > 0:
+            efficiency = (repaid_assets - bad_debt_assets) / repaid_assets
+            bad_debt_ratio = bad_debt_assets / repaid_assets
+        else:
+            efficiency = 1.0
+            bad_debt_ratio = 0.0
+
+        return {
+            "liquidation_ratio": liquidation_ratio,
+            "is_profitable": is_profitable,
+            "liquidation_incentive": liquidation_ratio - 1.0,
+            "liquidation_size_category": size_category,
+            "liquidation_efficiency": efficiency,
+            "bad_debt_ratio": bad_debt_ratio,
+        }
 
+    def enrich_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Enrich a decoded Morpho liquidation event with protocol-specific analytics.
+        """
         # Bad debt analysis
-        if event.get("has_bad_debt"):
-            enriched["liquidation_completeness"] = "partial"
-            enriched["requires_bad_debt_handling"] = True
-        else:
-            enriched["liquidation_completeness"] = "full"
-            enriched["requires_bad_debt_handling"] = False
+        completeness = (
+            self._PARTIAL_LIQUIDATION
+            if event.get("has_bad_debt")
+            else self._FULL_LIQUIDATION
+        )
+        return {
+            **event,
+            **self.STATIC_ENRICHMENTS,
+            **completeness,
+            **self._liquidation_metrics(*self._raw_amounts(event)),
+        }
+
+    def enrich_many(self, events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Enrich many decoded Morpho liquidation events, e.g. a historical replay.
 
-        return enriched
+        Equivalent to calling enrich_event on each event, with the per-event
+        attribute lookups hoisted out of the loop.
+        """
+        static = self.STATIC_ENRICHMENTS
+        partial = self._PARTIAL_LIQUIDATION
+        full = self._FULL_LIQUIDATION
+        raw_amounts = self._raw_amounts
+        metrics = self._liquidation_metrics
+        return [
+            {
+                **event,
+                **static,
+                **(partial if event.get("has_bad_debt") else full),
+                **metrics(*raw_amounts(event)),
+            }
+            for event in events
+        ]
 
     def is_liquidation_transaction(
-        self, transaction: Dict[str, Any], logs: List[Dict[str, Any]]
+        self,
+        transaction: Dict[str, Any],
+        logs: List[Dict[str, Any]],
+        logs_bloom: Optional[Any] = None,
     ) -> Tuple[bool, int]:
         """
         Detect if a transaction contains a Morpho Blue liquidation.
@@ -315,52 +529,40 @@ class MorphoProtocolProcessor(BaseProtocolProcessor):
         1. Transaction sent to Morpho Blue contract
         2. Liquidate event logs emitted
         3. Method calls that could trigger liquidations
+
+        logs_bloom is accepted for the common processor signature but not
+        used yet; the logs are always scanned.
         """
         to_address = transaction.get("to", "").lower()
 
         # Check if transaction is sent to Morpho Blue
-        morpho_contracts = {
-            self.MORPHO_BLUE_ADDRESS.lower(),
-        }
-
-        # Get the liquidation event topic from the ABI
-        liquidate_event_topic = self.w3.keccak(
-            text="Liquidate(bytes32,address,address,uint256,uint256,uint256,uint256,uint256)"
-        ).to_0x_hex()
-
-        if not to_address or to_address not in morpho_contracts:
+        if to_address != self._MORPHO_BLUE_ADDRESS_LOWER:
             return False, -1
 
-        # Check for liquidation events in logs
-        for idx, log in enumerate(logs):
-            topics = log.get("topics", [])
-            if not topics:
-                continue
-
-            event_signature = topics[0].to_0x_hex()
-
-            # Check for Liquidate events
-            if event_signature == liquidate_event_topic:
-                # Verify the log is from the Morpho Blue contract
-                log_address = log.get("address", "").lower()
-                if log_address == self.MORPHO_BLUE_ADDRESS.lower():
-                    return True, idx
+        # First Liquidate log emitted by the Morpho Blue contract, if any
+        topic0 = self.LIQUIDATE_TOPIC0_BYTES
+        morpho_address = self._MORPHO_BLUE_ADDRESS_LOWER
+        idx = next(
+            (
+                idx
+                for idx, log in enumerate(logs)
+                if log_topic0(log) == topic0
+                and log.get("address", "").lower() == morpho_address
+            ),
+            -1,
+        )
+        if idx != -1:
+            return True, idx
 
         # Check transaction input for liquidation method calls
         input_data = transaction.get("input", "")
         if input_data and len(input_data) >= 10:  # At least function selector (4 bytes)
             method_signature = input_data[:10]  # First 4 bytes (8 hex chars + 0x)
 
-            # Morpho Blue liquidation method signatures
-            liquidation_methods = {
-                "0x0748ca67",  # liquidate method signature
-                # Morpho Blue has a single liquidate method
-            }
-
-            if method_signature in liquidation_methods:
-                # Only return True if transaction is to the Morpho Blue contract
-                if to_address in morpho_contracts:
-                    return True, -1
+            # The early return above already guarantees the transaction
+            # targets the Morpho Blue contract
+            if method_signature in self.METHOD_SELECTORS:
+                return True, -1
 
         return False, -1
 
@@ -417,7 +619,7 @@ class MorphoProtocolProcessor(BaseProtocolProcessor):
             ) = market_state
 
             # Convert LLTV from wei to percentage (Morpho Blue stores LLTV as a number where 1e18 = 100%)
-            lltv_percentage = float(lltv) / 1e18
+            lltv_percentage = lltv / WAD
 
             return {
                 "market_id": (
@@ -453,28 +655,18 @@ class MorphoProtocolProcessor(BaseProtocolProcessor):
         Calculate the liquidation incentive for a given market.
         Based on Morpho Blue's liquidation incentive formula.
         """
-        # Morpho Blue liquidation incentive calculation:
-        # liquidationIncentiveFactor = min(maxLiquidationIncentiveFactor, 1/(1 - cursor*(1 - lltv)))
-        # where cursor is typically 0.3 and maxLiquidationIncentiveFactor is typically 1.15
-
-        LIQUIDATION_CURSOR = 0.3
-        MAX_LIQUIDATION_INCENTIVE_FACTOR = 1.15
-
-        if lltv >= 1.0:
-            return MAX_LIQUIDATION_INCENTIVE_FACTOR
-
-        denominator = 1.0 - LIQUIDATION_CURSOR * (1.0 - lltv)
-        if denominator <= 0:
-            return MAX_LIQUIDATION_INCENTIVE_FACTOR
-
-        calculated_factor = 1.0 / denominator
-        return min(MAX_LIQUIDATION_INCENTIVE_FACTOR, calculated_factor)
+        # The factor depends only on the LLTV (cursor is typically 0.3 and
+        # maxLiquidationIncentiveFactor is typically 1.15)
+        return _liquidation_incentive_factor(lltv)
 
     def get_liquidation_threshold(self, market_id: str) -> float:
         """
         Get the liquidation threshold for a specific market.
         This is the LLTV (Loan-to-Liquidation Threshold Value) in Morpho Blue.
 
+        Market parameters are immutable once a market is created, so fetched
+        LLTVs are cached per processor; the fallback default is not.
+
         Args:
             market_id: The market ID as a hex string
 
@@ -484,10 +676,17 @@ class MorphoProtocolProcessor(BaseProtocolProcessor):
         Raises:
             ValueError: If market info cannot be retrieved
         """
+        lltv = self._lltv_cache.get(market_id)
+        if lltv is not None:
+            return lltv
+
         try:
             market_info = self.get_market_info(market_id)
-            return market_info["lltv"]
+            lltv = market_info["lltv"]
         except Exception as e:
             # Fallback to reasonable default if contract call fails
             print(f"Warning: Could not fetch LLTV for market {market_id}: {e}")
-            return 0.80  # Default 80% LLTV
+            return _DEFAULT_LLTV  # Default 80% LLTV
+
+        self._lltv_cache[market_id] = lltv
+        return lltv
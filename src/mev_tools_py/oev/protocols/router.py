@@ -0,0 +1,122 @@
+"""Route logs and transactions straight to the protocol processor that handles them.
+
+Processors register their liquidation event topics and contract addresses at
+import time with @register_protocol, so a block can be scanned in one pass with
+a dict lookup per log instead of asking every processor about every log.
+
+Aave V3, Euler V1 and Morpho Blue are registered. Euler V2 is deliberately left
+out: its liquidations are emitted by per-market vaults whose addresses are not
+known up front, so they cannot be routed by contract address.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+
+from mev_tools_py.oev.protocols._shared import log_topic0
+from mev_tools_py.oev.protocols.base import BaseProtocolProcessor
+
+# topic0 -> (processor, event name)
+LOG_ROUTER: Dict[bytes, Tuple[BaseProtocolProcessor, str]] = {}
+# lowercased contract address -> processor
+TX_ROUTER: Dict[str, BaseProtocolProcessor] = {}
+# 0x-prefixed method selector -> (processor, method name)
+SELECTOR_ROUTER: Dict[str, Tuple[BaseProtocolProcessor, str]] = {}
+
+ProcessorClass = TypeVar("ProcessorClass", bound=Type[BaseProtocolProcessor])
+
+
+def _check_unclaimed(
+    router: Dict[Any, Any], keys: Iterable[Any], cls: Type[BaseProtocolProcessor]
+) -> None:
+    """Raise ValueError if any key is already routed to another processor."""
+    for key in keys:
+        existing = router.get(key)
+        if existing is None:
+            continue
+        owner = existing[0] if isinstance(existing, tuple) else existing
+        if type(owner) is not cls:
+            raise ValueError(
+                f"{cls.__name__} cannot claim {key!r}, already routed to "
+                f"{type(owner).__name__}"
+            )
+
+
+def register_protocol(cls: ProcessorClass) -> ProcessorClass:
+    """Class decorator adding a processor's LOG_TOPICS, CONTRACT_ADDRESSES and
+    METHOD_SELECTORS to the routers. One shared instance of the class handles routed input.
+
+    Raises ValueError, leaving the routers unchanged, if a topic, address or
+    selector is already routed to a different processor, so a fork reusing a
+    signature cannot hijack routing.
+    """
+    _check_unclaimed(LOG_ROUTER, cls.LOG_TOPICS, cls)
+    _check_unclaimed(TX_ROUTER, cls.CONTRACT_ADDRESSES, cls)
+    _check_unclaimed(SELECTOR_ROUTER, cls.METHOD_SELECTORS, cls)
+
+    processor = cls()
+    for topic0, event_name in cls.LOG_TOPICS.items():
+        LOG_ROUTER[topic0] = (processor, event_name)
+    for address in cls.CONTRACT_ADDRESSES:
+        TX_ROUTER[address] = processor
+    for selector, method_name in cls.METHOD_SELECTORS.items():
+        SELECTOR_ROUTER[selector] = (processor, method_name)
+    return cls
+
+
+def route_log(log: Dict[str, Any]) -> Optional[Tuple[BaseProtocolProcessor, str]]:
+    """Return the (processor, event name) for a log, or None if unhandled.
+
+    Logs are only routed when emitted by one of the processor's contracts, so
+    forks reusing an event signature are not decoded as the original protocol.
+    """
+    topic0 = log_topic0(log)
+    if topic0 is None:
+        return None
+
+    entry = LOG_ROUTER.get(topic0)
+    if entry is None:
+        return None
+
+    if str(log.get("address", "")).lower() not in entry[0].CONTRACT_ADDRESSES:
+        return None
+    return entry
+
+
+def route_transaction(transaction: Dict[str, Any]) -> Optional[BaseProtocolProcessor]:
+    """Return the processor whose contracts the transaction is sent to, if any."""
+    to_address = transaction.get("to")
+    if not to_address:
+        return None
+    return TX_ROUTER.get(str(to_address).lower())
+
+
+def route_method_call(
+    transaction: Dict[str, Any],
+) -> Optional[Tuple[BaseProtocolProcessor, str]]:
+    """Return the (processor, method name) of a transaction calling a liquidation
+    method, or None.
+
+    One selector lookup replaces asking every processor about the transaction;
+    only calls sent to one of the processor's contracts are routed. Logs still
+    have to be scanned for liquidations triggered indirectly.
+    """
+    input_data = transaction.get("input") or ""
+    if not isinstance(input_data, str):
+        input_data = "0x" + bytes(input_data[:4]).hex()
+
+    entry = SELECTOR_ROUTER.get(input_data[:10])
+    if entry is None:
+        return None
+
+    if str(transaction.get("to") or "").lower() not in entry[0].CONTRACT_ADDRESSES:
+        return None
+    return entry
+
+
+def decode_liquidations(logs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Decode every routed liquidation log from any registered protocol, in order."""
+    events = []
+    for log in logs:
+        entry = route_log(log)
+        if entry is not None:
+            events.append(entry[0].decode_liquidation(log))
+    return events
@@ -0,0 +1,73 @@
+"""Integer-array kernels for the sandwich detection hot loops.
+
+The detector passes the interned address id columns of a SwapBatch so the
+inner loops compare ints instead of lowercasing and comparing address
+strings for every candidate pair.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Dict, List, Sequence, Tuple
+
+Triplet = Tuple[int, int, List[int]]
+
+
+def find_sandwich_triplets(
+    sender_ids: Sequence[int],
+    token_in_ids: Sequence[int],
+    token_out_ids: Sequence[int],
+    block_numbers: Sequence[int],
+    max_block_distance: int,
+) -> List[Triplet]:
+    """Find (frontrun, backrun, victims) index triplets in position-sorted swaps.
+
+    Swaps must be ordered by (block_number, log_index). A frontrun i and
+    backrun j > i + 1 must share a sender, trade in opposite directions and
+    lie within max_block_distance blocks. Victims are swaps strictly between
+    them from a different sender trading the same pair in the frontrun's or
+    backrun's direction. Only pairs with at least one victim are returned,
+    ordered by (i, j).
+    """
+    n = len(sender_ids)
+    triplets: List[Triplet] = []
+
+    # Index swap positions by sender and by unordered token pair so each
+    # frontrun only visits its sender's later swaps, and victims are read
+    # from a bisected slice of the pair's positions
+    by_sender: Dict[int, List[int]] = defaultdict(list)
+    by_pair: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    pair_keys = []
+    for k in range(n):
+        token_in = token_in_ids[k]
+        token_out = token_out_ids[k]
+        pair = (token_in, token_out) if token_in < token_out else (token_out, token_in)
+        by_sender[sender_ids[k]].append(k)
+        by_pair[pair].append(k)
+        pair_keys.append(pair)
+
+    for i in range(n - 2):
+        sender = sender_ids[i]
+        token_in = token_in_ids[i]
+        token_out = token_out_ids[i]
+        block = block_numbers[i]
+        sender_positions = by_sender[sender]
+        pair_positions = by_pair[pair_keys[i]]
+        victims_from = bisect_right(pair_positions, i)
+
+        for j in sender_positions[bisect_right(sender_positions, i) :]:
+            if block_numbers[j] - block > max_block_distance:
+                break  # positions are block ordered, later ones are further
+            if token_in_ids[j] != token_out or token_out_ids[j] != token_in:
+                continue
+
+            # Every swap on the same pair trades in the frontrun's or the
+            # backrun's direction, so only the sender needs checking
+            victims = [
+                k
+                for k in pair_positions[victims_from : bisect_left(pair_positions, j)]
+                if sender_ids[k] != sender
+            ]
+            if victims:
+                triplets.append((i, j, victims))
+
+    return triplets
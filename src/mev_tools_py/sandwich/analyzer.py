@@ -1,10 +1,27 @@
-from typing import List, Dict
+from dataclasses import dataclass, field
+from typing import List, Dict, Set
 from decimal import Decimal
 from collections import defaultdict, Counter
+from heapq import nlargest
+from operator import itemgetter
 
 from mev_tools_py.sandwich.models import SandwichAttack, SandwichStatistics
 
 
+@dataclass(slots=True)
+class _AttackerStats:
+    """Running totals for one attacker in identify_sophisticated_attackers."""
+
+    attack_count: int = 0
+    total_profit: Decimal = Decimal("0")
+    total_gas: Decimal = Decimal("0")
+    victim_count: int = 0
+    pools_targeted: Set[str] = field(default_factory=set)
+    attack_types: Counter = field(default_factory=Counter)
+    # Sum of calculate_attack_efficiency(attack)["profit_per_gas"]
+    profit_per_gas_sum: Decimal = Decimal("0")
+
+
 class SandwichAnalyzer:
     """Analyzer for sandwich attack patterns and statistics."""
 
@@ -16,38 +33,44 @@ class SandwichAnalyzer:
         if not attacks:
             return self._empty_statistics()
 
-        # Basic counts and totals
+        # Totals, block range, most profitable attack and per-attacker / per-pool
+        # tallies, all gathered in one pass over the attacks
         total_attacks = len(attacks)
-        total_profit = sum(attack.profit_amount for attack in attacks)
-        total_victim_loss = sum(attack.victim_loss_amount for attack in attacks)
+        total_profit = Decimal("0")
+        total_victim_loss = Decimal("0")
+        most_profitable = attacks[0]
+        best_profit = most_profitable.profit_amount
+        from_block = to_block = most_profitable.block_number
+        attacker_profits: Dict[str, Decimal] = defaultdict(Decimal)
+        pool_counts: Dict[str, int] = defaultdict(int)
 
-        # Find block range
-        block_numbers = [attack.block_number for attack in attacks]
-        from_block = min(block_numbers)
-        to_block = max(block_numbers)
+        for attack in attacks:
+            profit = attack.profit_amount
+            block_number = attack.block_number
 
-        # Calculate averages
-        average_profit = (
-            total_profit / total_attacks if total_attacks > 0 else Decimal("0")
-        )
+            total_profit += profit
+            total_victim_loss += attack.victim_loss_amount
 
-        # Find most profitable attack
-        most_profitable = (
-            max(attacks, key=lambda x: x.profit_amount) if attacks else None
-        )
+            if block_number < from_block:
+                from_block = block_number
+            elif block_number > to_block:
+                to_block = block_number
 
-        # Top attackers by profit
-        attacker_profits = defaultdict(Decimal)
-        for attack in attacks:
-            attacker_profits[attack.attacker_address] += attack.profit_amount
+            # Strictly greater keeps the first of equally profitable attacks
+            if profit > best_profit:
+                most_profitable = attack
+                best_profit = profit
 
-        top_attackers = sorted(
-            attacker_profits.items(), key=lambda x: x[1], reverse=True
-        )[:10]  # Top 10
+            attacker_profits[attack.attacker_address] += profit
+            pool_counts[attack.pool_address] += 1
+
+        # Calculate averages
+        average_profit = total_profit / total_attacks
 
-        # Most targeted pools
-        pool_counts = Counter(attack.pool_address for attack in attacks)
-        most_targeted_pools = pool_counts.most_common(10)
+        # Top 10 attackers by profit and most targeted pools; nlargest keeps
+        # ties in first-seen order like a stable sort, without sorting them all
+        top_attackers = nlargest(10, attacker_profits.items(), key=itemgetter(1))
+        most_targeted_pools = nlargest(10, pool_counts.items(), key=itemgetter(1))
 
         return SandwichStatistics(
             from_block=from_block,
@@ -73,8 +96,11 @@ class SandwichAnalyzer:
         block_distribution = Counter(attack.block_number for attack in attacks)
         attacks_per_block = list(block_distribution.values())
 
-        # Profit distribution
+        # Profit distribution; summed in attack order, then sorted in place once
+        # so min, max and median are read off the ends and middle
         profits = [float(attack.profit_amount) for attack in attacks]
+        total_profit = sum(profits)
+        profits.sort()
 
         # Gas usage patterns
         gas_costs = [
@@ -105,10 +131,10 @@ class SandwichAnalyzer:
                 ),
             },
             "profit_analysis": {
-                "min_profit": min(profits) if profits else 0,
-                "max_profit": max(profits) if profits else 0,
-                "avg_profit": sum(profits) / len(profits) if profits else 0,
-                "median_profit": sorted(profits)[len(profits) // 2] if profits else 0,
+                "min_profit": profits[0],
+                "max_profit": profits[-1],
+                "avg_profit": total_profit / len(profits),
+                "median_profit": profits[len(profits) // 2],
             },
             "gas_analysis": {
                 "avg_gas_cost": sum(gas_costs) / len(gas_costs) if gas_costs else 0,
@@ -163,57 +189,50 @@ class SandwichAnalyzer:
         min_total_profit: Decimal = Decimal("1.0"),
     ) -> List[Dict[str, any]]:
         """Identify sophisticated/professional sandwich attackers."""
-        attacker_stats = defaultdict(
-            lambda: {
-                "attacks": [],
-                "total_profit": Decimal("0"),
-                "total_gas": Decimal("0"),
-                "victim_count": 0,
-                "pools_targeted": set(),
-                "attack_types": Counter(),
-            }
-        )
+        attacker_stats: Dict[str, _AttackerStats] = {}
 
         # Aggregate stats per attacker
         for attack in attacks:
             addr = attack.attacker_address.lower()
-            stats = attacker_stats[addr]
-
-            stats["attacks"].append(attack)
-            stats["total_profit"] += attack.profit_amount
-            stats["total_gas"] += attack.gas_cost
-            stats["victim_count"] += len(attack.victim_txs)
-            stats["pools_targeted"].add(attack.pool_address)
-            stats["attack_types"][attack.sandwich_type] += 1
+            stats = attacker_stats.get(addr)
+            if stats is None:
+                stats = attacker_stats[addr] = _AttackerStats()
+
+            profit = attack.profit_amount
+            gas_cost = attack.gas_cost
+
+            stats.attack_count += 1
+            stats.total_profit += profit
+            stats.total_gas += gas_cost
+            stats.victim_count += len(attack.victim_txs)
+            stats.pools_targeted.add(attack.pool_address)
+            stats.attack_types[attack.sandwich_type] += 1
+            if gas_cost > 0:
+                stats.profit_per_gas_sum += profit / gas_cost
 
         # Filter and analyze sophisticated attackers
         sophisticated = []
         for address, stats in attacker_stats.items():
-            if (
-                len(stats["attacks"]) >= min_attacks
-                and stats["total_profit"] >= min_total_profit
-            ):
+            attack_count = stats.attack_count
+            if attack_count >= min_attacks and stats.total_profit >= min_total_profit:
                 # Calculate sophistication metrics
-                avg_profit = stats["total_profit"] / len(stats["attacks"])
-                pools_diversity = len(stats["pools_targeted"])
+                avg_profit = stats.total_profit / attack_count
+                pools_diversity = len(stats.pools_targeted)
 
                 # Efficiency metrics
-                avg_efficiency = sum(
-                    self.calculate_attack_efficiency(attack)["profit_per_gas"]
-                    for attack in stats["attacks"]
-                ) / len(stats["attacks"])
+                avg_efficiency = stats.profit_per_gas_sum / attack_count
 
                 sophisticated.append(
                     {
                         "address": address,
-                        "attack_count": len(stats["attacks"]),
-                        "total_profit": stats["total_profit"],
+                        "attack_count": attack_count,
+                        "total_profit": stats.total_profit,
                         "average_profit": avg_profit,
                         "pools_targeted": pools_diversity,
-                        "total_victims": stats["victim_count"],
-                        "attack_types": dict(stats["attack_types"]),
+                        "total_victims": stats.victim_count,
+                        "attack_types": dict(stats.attack_types),
                         "average_efficiency": avg_efficiency,
-                        "total_gas_spent": stats["total_gas"],
+                        "total_gas_spent": stats.total_gas,
                     }
                 )
 
@@ -230,54 +249,79 @@ class SandwichAnalyzer:
         # Sort attacks by block number
         sorted_attacks = sorted(attacks, key=lambda x: x.block_number)
 
+        # The current cluster's stats are kept up to date as it grows, so a
+        # finished cluster only needs packing
         clusters = []
-        current_cluster = [sorted_attacks[0]]
+        attack_count = 0
+        first_block = last_block = sorted_attacks[0].block_number
+        attackers: Set[str] = set()
+        pools: Set[str] = set()
+        total_profit = Decimal("0")
 
-        for i in range(1, len(sorted_attacks)):
-            attack = sorted_attacks[i]
-            prev_attack = sorted_attacks[i - 1]
+        for attack in sorted_attacks:
+            block_number = attack.block_number
 
             # Check if attack belongs to current cluster
-            if attack.block_number - prev_attack.block_number <= block_window:
-                current_cluster.append(attack)
-            else:
+            if block_number - last_block > block_window:
                 # Finalize current cluster and start new one
-                if len(current_cluster) > 1:
-                    clusters.append(self._analyze_cluster(current_cluster))
-                current_cluster = [attack]
+                if attack_count > 1:
+                    clusters.append(
+                        self._finalize_cluster(
+                            attack_count,
+                            first_block,
+                            last_block,
+                            attackers,
+                            pools,
+                            total_profit,
+                        )
+                    )
+                attack_count = 0
+                first_block = block_number
+                attackers = set()
+                pools = set()
+                total_profit = Decimal("0")
+
+            attack_count += 1
+            last_block = block_number
+            attackers.add(attack.attacker_address)
+            pools.add(attack.pool_address)
+            total_profit += attack.profit_amount
 
         # Don't forget the last cluster
-        if len(current_cluster) > 1:
-            clusters.append(self._analyze_cluster(current_cluster))
+        if attack_count > 1:
+            clusters.append(
+                self._finalize_cluster(
+                    attack_count,
+                    first_block,
+                    last_block,
+                    attackers,
+                    pools,
+                    total_profit,
+                )
+            )
 
         return clusters
 
-    def _analyze_cluster(self, cluster_attacks: List[SandwichAttack]) -> Dict[str, any]:
-        """Analyze a cluster of attacks."""
-        # Basic cluster stats
-        block_range = (
-            min(attack.block_number for attack in cluster_attacks),
-            max(attack.block_number for attack in cluster_attacks),
-        )
-
-        # Attacker analysis
-        attackers = set(attack.attacker_address for attack in cluster_attacks)
-        pools = set(attack.pool_address for attack in cluster_attacks)
-
+    def _finalize_cluster(
+        self,
+        attack_count: int,
+        first_block: int,
+        last_block: int,
+        attackers: Set[str],
+        pools: Set[str],
+        total_profit: Decimal,
+    ) -> Dict[str, any]:
+        """Summarize a cluster of attacks from its accumulated stats."""
         # Temporal density
-        block_span = block_range[1] - block_range[0] + 1
-        attack_density = len(cluster_attacks) / block_span
-
-        # Profit analysis
-        total_profit = sum(attack.profit_amount for attack in cluster_attacks)
+        block_span = last_block - first_block + 1
 
         return {
-            "attack_count": len(cluster_attacks),
-            "block_range": block_range,
+            "attack_count": attack_count,
+            "block_range": (first_block, last_block),
             "block_span": block_span,
             "unique_attackers": len(attackers),
             "unique_pools": len(pools),
-            "attack_density": attack_density,
+            "attack_density": attack_count / block_span,
             "total_profit": total_profit,
             "attackers": list(attackers),
             "pools": list(pools),
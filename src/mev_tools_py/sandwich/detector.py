@@ -1,9 +1,12 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from decimal import Decimal
 from datetime import datetime
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import uuid
 
+from mev_tools_py.dex.base import BaseDexReader
+from mev_tools_py.dex.batch import SwapBatch
 from mev_tools_py.dex.models import SwapEvent
 from mev_tools_py.sandwich.models import (
     SandwichTransaction,
@@ -11,13 +14,17 @@ from mev_tools_py.sandwich.models import (
     SandwichType,
 )
 from mev_tools_py.sandwich.utils import (
-    group_swaps_by_pool,
-    sort_swaps_by_block_position,
-    is_same_direction_trade,
-    is_opposite_direction_trade,
     identify_token_pair,
     calculate_sandwich_profit,
 )
+from mev_tools_py.sandwich._kernels import find_sandwich_triplets
+
+# Shared zero for missing price impacts and unknown prices; Decimals are
+# immutable, and building one from a string on every use is comparatively slow
+_ZERO = Decimal("0")
+
+# Confidence scores by integer tenths, "0.0" through "1.0"
+_CONFIDENCE_SCORES = [Decimal(tenths).scaleb(-1) for tenths in range(11)]
 
 
 class SandwichDetector:
@@ -34,27 +41,38 @@ class SandwichDetector:
         self.min_profit_threshold = min_profit_threshold
         self.max_block_distance = max_block_distance
         self.confidence_threshold = confidence_threshold
+        # Profit above which a sandwich scores higher confidence
+        self._confidence_profit_threshold = min_profit_threshold * 10
 
     def detect_sandwich_attacks_in_block(
-        self, block_number: int, swaps: List[SwapEvent]
+        self, block_number: int, swaps: Union[List[SwapEvent], SwapBatch]
     ) -> List[SandwichAttack]:
         """Detect all sandwich attacks within a single block."""
         if len(swaps) < 3:  # Need at least 3 swaps for a sandwich
             return []
 
+        batch = swaps if isinstance(swaps, SwapBatch) else SwapBatch.from_events(swaps)
+
         # Sort swaps by log index to get transaction order
-        sorted_swaps = sort_swaps_by_block_position(swaps)
+        order = sorted(
+            range(len(batch)),
+            key=lambda k: (batch.block_number[k], batch.log_index[k]),
+        )
 
         # Group by pool for analysis
-        pool_groups = group_swaps_by_pool(sorted_swaps)
+        pool_groups: Dict[int, List[int]] = defaultdict(list)
+        for k in order:
+            pool_groups[batch.pool_idx[k]].append(k)
 
         attacks = []
-        for pool_address, pool_swaps in pool_groups.items():
+        for pool_idx, pool_swaps in pool_groups.items():
             if len(pool_swaps) < 3:
                 continue
 
             # Look for sandwich patterns in this pool
-            pool_attacks = self._detect_sandwiches_in_pool(pool_address, pool_swaps)
+            pool_attacks = self._detect_sandwiches_in_pool(
+                batch.address_table[pool_idx], batch, pool_swaps
+            )
             attacks.extend(pool_attacks)
 
         return attacks
@@ -81,90 +99,75 @@ class SandwichDetector:
 
         return attacks
 
+    def detect_sandwich_attacks_in_blocks(
+        self,
+        reader: BaseDexReader,
+        block_numbers: Sequence[int],
+        max_workers: int = 8,
+    ) -> List[List[SandwichAttack]]:
+        """Fetch swaps for many blocks with a reader and detect attacks in each.
+
+        Blocks are independent, so they are processed on a thread pool to
+        overlap the reader's RPC latency. Results are returned in the order of
+        block_numbers.
+        """
+
+        def analyze_block(block_number: int) -> List[SandwichAttack]:
+            swaps = reader.get_swaps_from_block(block_number)
+            return self.detect_sandwich_attacks_in_block(block_number, swaps)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(analyze_block, block_numbers))
+
     def _detect_sandwiches_in_pool(
-        self, pool_address: str, swaps: List[SwapEvent]
+        self, pool_address: str, batch: SwapBatch, indices: List[int]
     ) -> List[SandwichAttack]:
-        """Detect sandwich patterns within a specific pool."""
-        if len(swaps) < 3:
+        """Detect sandwich patterns within a specific pool.
+
+        indices are the batch positions of the pool's swaps in block order.
+        """
+        if len(indices) < 3:
             return []
 
-        attacks = []
+        triplets = find_sandwich_triplets(
+            [batch.trader_idx[k] for k in indices],
+            [batch.token_in_idx[k] for k in indices],
+            [batch.token_out_idx[k] for k in indices],
+            [batch.block_number[k] for k in indices],
+            self.max_block_distance,
+        )
 
         # Look for sandwich patterns: A -> B -> A (where A is attacker, B is victim)
-        for i in range(len(swaps) - 2):
-            for j in range(i + 2, len(swaps)):
-                # Check if swaps[i] and swaps[j] could be frontrun/backrun by same attacker
-                frontrun = swaps[i]
-                backrun = swaps[j]
-
-                if not self._could_be_sandwich_pair(frontrun, backrun):
-                    continue
-
-                # Find victims between frontrun and backrun
-                victims = []
-                for k in range(i + 1, j):
-                    victim_swap = swaps[k]
-                    if self._is_potential_victim(frontrun, victim_swap, backrun):
-                        victims.append(victim_swap)
-
-                if victims:
-                    # Create sandwich attack object
-                    attack = self._create_sandwich_attack(
-                        pool_address, frontrun, victims, backrun
-                    )
-                    if (
-                        attack
-                        and attack.detection_confidence >= self.confidence_threshold
-                    ):
-                        attacks.append(attack)
+        # Only matched swaps are looked up as SwapEvent objects
+        events = batch.events
+        attacks = []
+        for i, j, victim_indices in triplets:
+            frontrun_k = indices[i]
+            attack = self._create_sandwich_attack(
+                pool_address,
+                events[frontrun_k],
+                [events[indices[k]] for k in victim_indices],
+                events[indices[j]],
+                batch.token_pair(frontrun_k),
+            )
+            if attack and attack.detection_confidence >= self.confidence_threshold:
+                attacks.append(attack)
 
         return attacks
 
-    def _could_be_sandwich_pair(self, frontrun: SwapEvent, backrun: SwapEvent) -> bool:
-        """Check if two swaps could be a frontrun/backrun pair."""
-        # Same trader
-        if frontrun.trader.lower() != backrun.trader.lower():
-            return False
-
-        # Opposite directions (buy then sell, or sell then buy)
-        if not is_opposite_direction_trade(frontrun, backrun):
-            return False
-
-        # Same token pair
-        if identify_token_pair(frontrun) != identify_token_pair(backrun):
-            return False
-
-        # Within block distance threshold
-        if abs(backrun.block_number - frontrun.block_number) > self.max_block_distance:
-            return False
-
-        return True
-
-    def _is_potential_victim(
-        self, frontrun: SwapEvent, candidate: SwapEvent, backrun: SwapEvent
-    ) -> bool:
-        """Check if a swap could be a victim between frontrun and backrun."""
-        # Different trader than attacker
-        if candidate.trader.lower() == frontrun.trader.lower():
-            return False
-
-        # Same token pair
-        if identify_token_pair(candidate) != identify_token_pair(frontrun):
-            return False
-
-        # Same direction as either frontrun or backrun (victim gets sandwiched)
-        return is_same_direction_trade(candidate, frontrun) or is_same_direction_trade(
-            candidate, backrun
-        )
-
     def _create_sandwich_attack(
         self,
         pool_address: str,
         frontrun: SwapEvent,
         victims: List[SwapEvent],
         backrun: SwapEvent,
+        token_pair: Optional[Tuple[str, str]] = None,
     ) -> Optional[SandwichAttack]:
-        """Create a SandwichAttack object from detected components."""
+        """Create a SandwichAttack object from detected components.
+
+        token_pair is the frontrun's normalized token pair when the caller
+        already has it; otherwise it is derived from the frontrun.
+        """
         try:
             # Calculate basic metrics
             profit = calculate_sandwich_profit(frontrun, backrun)
@@ -176,18 +179,18 @@ class SandwichDetector:
             frontrun_tx = SandwichTransaction(
                 swap_event=frontrun,
                 role="frontrun",
-                price_before=Decimal("0"),  # Would need pool state to calculate
-                price_after=Decimal("0"),
-                price_impact=frontrun.price_impact or Decimal("0"),
+                price_before=_ZERO,  # Would need pool state to calculate
+                price_after=_ZERO,
+                price_impact=frontrun.price_impact or _ZERO,
             )
 
             victim_txs = [
                 SandwichTransaction(
                     swap_event=victim,
                     role="victim",
-                    price_before=Decimal("0"),
-                    price_after=Decimal("0"),
-                    price_impact=victim.price_impact or Decimal("0"),
+                    price_before=_ZERO,
+                    price_after=_ZERO,
+                    price_impact=victim.price_impact or _ZERO,
                 )
                 for victim in victims
             ]
@@ -195,13 +198,15 @@ class SandwichDetector:
             backrun_tx = SandwichTransaction(
                 swap_event=backrun,
                 role="backrun",
-                price_before=Decimal("0"),
-                price_after=Decimal("0"),
-                price_impact=backrun.price_impact or Decimal("0"),
+                price_before=_ZERO,
+                price_after=_ZERO,
+                price_impact=backrun.price_impact or _ZERO,
             )
 
             # Calculate confidence score
-            confidence = self._calculate_confidence_score(frontrun, victims, backrun)
+            confidence = self._calculate_confidence_score(
+                frontrun, victims, backrun, profit
+            )
 
             # Determine sandwich type
             sandwich_type = (
@@ -213,9 +218,10 @@ class SandwichDetector:
                 sandwich_type = SandwichType.MULTI_VICTIM
 
             # Calculate victim losses (simplified)
-            total_victim_loss = sum(
-                victim.price_impact or Decimal("0") for victim in victims
-            )
+            total_victim_loss = sum(victim.price_impact or _ZERO for victim in victims)
+
+            # Gas of both attacker transactions; either may be unknown
+            gas_cost = Decimal((frontrun.gas_used or 0) + (backrun.gas_used or 0))
 
             attack = SandwichAttack(
                 attack_id=str(uuid.uuid4()),
@@ -223,7 +229,7 @@ class SandwichDetector:
                 block_number=frontrun.block_number,
                 block_timestamp=frontrun.timestamp or datetime.now(),
                 pool_address=pool_address,
-                token_pair=identify_token_pair(frontrun),
+                token_pair=token_pair or identify_token_pair(frontrun),
                 frontrun_txs=[frontrun_tx],
                 victim_txs=victim_txs,
                 backrun_txs=[backrun_tx],
@@ -231,9 +237,8 @@ class SandwichDetector:
                 profit_amount=profit,
                 profit_token=frontrun.token_out.address,
                 victim_loss_amount=total_victim_loss,
-                gas_cost=Decimal(str(frontrun.gas_used or 0 + backrun.gas_used or 0)),
-                net_profit=profit
-                - Decimal(str(frontrun.gas_used or 0 + backrun.gas_used or 0)),
+                gas_cost=gas_cost,
+                net_profit=profit - gas_cost,
                 detection_confidence=confidence,
                 price_manipulation_pct=self._calculate_price_manipulation(
                     frontrun, victims, backrun
@@ -248,35 +253,45 @@ class SandwichDetector:
             return None
 
     def _calculate_confidence_score(
-        self, frontrun: SwapEvent, victims: List[SwapEvent], backrun: SwapEvent
+        self,
+        frontrun: SwapEvent,
+        victims: List[SwapEvent],
+        backrun: SwapEvent,
+        profit: Optional[Decimal] = None,
     ) -> Decimal:
-        """Calculate confidence score for sandwich detection."""
-        score = Decimal("0")
+        """Calculate confidence score for sandwich detection.
+
+        profit is the sandwich's calculate_sandwich_profit result, if the
+        caller has already computed it.
+        """
+        # Scored in integer tenths, converted to Decimal once at the end
+        score = 0
 
         # Base score for pattern match
-        score += Decimal("0.5")
+        score += 5
 
         # Higher score if multiple victims
         if len(victims) > 1:
-            score += Decimal("0.1")
+            score += 1
 
         # Higher score if significant price impact
-        total_impact = (frontrun.price_impact or Decimal("0")) + (
-            backrun.price_impact or Decimal("0")
+        total_impact = (frontrun.price_impact or _ZERO) + (
+            backrun.price_impact or _ZERO
         )
         if total_impact > self.min_price_impact:
-            score += Decimal("0.2")
+            score += 2
 
         # Higher score if profit is substantial
-        profit = calculate_sandwich_profit(frontrun, backrun)
-        if profit > self.min_profit_threshold * 10:
-            score += Decimal("0.1")
+        if profit is None:
+            profit = calculate_sandwich_profit(frontrun, backrun)
+        if profit > self._confidence_profit_threshold:
+            score += 1
 
         # Higher score if same block (atomic)
         if frontrun.block_number == backrun.block_number:
-            score += Decimal("0.1")
+            score += 1
 
-        return min(score, Decimal("1.0"))
+        return _CONFIDENCE_SCORES[min(score, 10)]
 
     def _calculate_price_manipulation(
         self, frontrun: SwapEvent, victims: List[SwapEvent], backrun: SwapEvent
@@ -284,7 +299,7 @@ class SandwichDetector:
         """Calculate the percentage of price manipulation caused by the sandwich."""
         # This would require detailed pool state tracking
         # For now, return a simplified estimate based on price impacts
-        total_impact = (frontrun.price_impact or Decimal("0")) + (
-            backrun.price_impact or Decimal("0")
+        total_impact = (frontrun.price_impact or _ZERO) + (
+            backrun.price_impact or _ZERO
         )
         return total_impact
@@ -1,6 +1,6 @@
 from typing import List, Dict, Tuple, Set
 from decimal import Decimal
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 from mev_tools_py.dex.models import SwapEvent
 
@@ -41,25 +41,40 @@ def identify_token_pair(swap: SwapEvent) -> Tuple[str, str]:
 
 def group_swaps_by_pool(swaps: List[SwapEvent]) -> Dict[str, List[SwapEvent]]:
     """Group swaps by pool address for analysis."""
-    pool_groups = defaultdict(list)
+    pool_groups: Dict[str, List[SwapEvent]] = {}
+    # Pool address as given -> its group, so each distinct spelling of an
+    # address is lowercased once rather than once per swap
+    groups_by_address: Dict[str, List[SwapEvent]] = {}
 
     for swap in swaps:
-        pool_groups[swap.pool_address.lower()].append(swap)
+        address = swap.pool_address
+        group = groups_by_address.get(address)
+        if group is None:
+            group = pool_groups.setdefault(address.lower(), [])
+            groups_by_address[address] = group
+        group.append(swap)
 
-    return dict(pool_groups)
+    return pool_groups
 
 
 def group_swaps_by_token_pair(
     swaps: List[SwapEvent],
 ) -> Dict[Tuple[str, str], List[SwapEvent]]:
     """Group swaps by token pair for analysis."""
-    pair_groups = defaultdict(list)
+    pair_groups: Dict[Tuple[str, str], List[SwapEvent]] = {}
+    # (token_in, token_out) addresses as given -> their group, so
+    # identify_token_pair runs once per distinct direction and spelling
+    groups_by_tokens: Dict[Tuple[str, str], List[SwapEvent]] = {}
 
     for swap in swaps:
-        token_pair = identify_token_pair(swap)
-        pair_groups[token_pair].append(swap)
+        tokens = (swap.token_in.address, swap.token_out.address)
+        group = groups_by_tokens.get(tokens)
+        if group is None:
+            group = pair_groups.setdefault(identify_token_pair(swap), [])
+            groups_by_tokens[tokens] = group
+        group.append(swap)
 
-    return dict(pair_groups)
+    return pair_groups
 
 
 def sort_swaps_by_block_position(swaps: List[SwapEvent]) -> List[SwapEvent]:
@@ -71,10 +86,11 @@ def detect_potential_mev_addresses(
     swaps: List[SwapEvent], min_frequency: int = 3
 ) -> Set[str]:
     """Identify addresses that appear frequently in swaps (potential MEV bots)."""
-    trader_counts = defaultdict(int)
-
-    for swap in swaps:
-        trader_counts[swap.trader.lower()] += 1
+    # Count each address as given, then fold case variants together, so
+    # addresses are lowercased once per distinct spelling instead of per swap
+    trader_counts: Dict[str, int] = defaultdict(int)
+    for trader, count in Counter(swap.trader for swap in swaps).items():
+        trader_counts[trader.lower()] += count
 
     return {
         address for address, count in trader_counts.items() if count >= min_frequency
@@ -0,0 +1,365 @@
+from dataclasses import replace
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3.exceptions import ContractLogicError
+
+from mev_tools_py.dex.models import TokenInfo, SwapEvent, LiquidityPool
+from mev_tools_py.dex.multicall import GET_RESERVES_SELECTOR, TOTAL_SUPPLY_SELECTOR
+from mev_tools_py.dex.readers import uniswap_v2
+from mev_tools_py.dex.readers.uniswap_v2 import UniswapV2Reader
+
+USDC = TokenInfo("0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48", "USDC", 6)
+WETH = TokenInfo("0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2", "WETH", 18)
+POOL = "0xB4e16d0168e52d35CaCD2c6185b44281Ec28C9Dc"
+
+
+@pytest.fixture
+def reader() -> UniswapV2Reader:
+    return UniswapV2Reader(MagicMock())
+
+
+@pytest.fixture
+def pool() -> LiquidityPool:
+    return LiquidityPool(
+        address=POOL,
+        dex_protocol="uniswap_v2",
+        token0=USDC,
+        token1=WETH,
+        reserve0=Decimal("1000000"),
+        reserve1=Decimal("500"),
+        total_supply=Decimal("10000"),
+        fee_tier=Decimal("0.003"),
+    )
+
+
+def make_swap(token_in: TokenInfo, token_out: TokenInfo, amount_in: str) -> SwapEvent:
+    return SwapEvent(
+        tx_hash="0x123",
+        block_number=12345,
+        log_index=0,
+        dex_protocol="uniswap_v2",
+        pool_address=POOL,
+        trader="0xTraderAddress",
+        token_in=token_in,
+        token_out=token_out,
+        amount_in=Decimal(amount_in),
+        amount_out=Decimal("0"),
+    )
+
+
+def test_calculate_price_impact(reader, pool):
+    impact = reader.calculate_price_impact(make_swap(USDC, WETH, "10000"), pool)
+
+    # price_after / price_before = x / (x + dx) for a constant product pool
+    assert isinstance(impact, Decimal)
+    assert float(impact) == pytest.approx(1 - 1000000 / 1010000)
+
+
+def test_calculate_price_impact_reverse_direction(reader, pool):
+    impact = reader.calculate_price_impact(make_swap(WETH, USDC, "5"), pool)
+
+    assert float(impact) == pytest.approx(1 - 500 / 505)
+
+
+def test_calculate_price_impact_zero_amount(reader, pool):
+    assert reader.calculate_price_impact(make_swap(USDC, WETH, "0"), pool) == 0
+
+
+def test_calculate_price_impact_empty_pool(reader, pool):
+    empty_pool = replace(pool, reserve0=Decimal("0"))
+
+    assert reader.calculate_price_impact(make_swap(USDC, WETH, "10"), empty_pool) == 0
+
+
+def make_swap_log(amount0_in: int, amount1_out: int) -> dict:
+    return {
+        "address": POOL,
+        "topics": [
+            HexBytes(UniswapV2Reader.SWAP_EVENT_SIGNATURE),
+            HexBytes("0x" + "00" * 12 + "11" * 20),
+            HexBytes("0x" + "00" * 12 + "22" * 20),
+        ],
+        "data": HexBytes(
+            amount0_in.to_bytes(32, "big")
+            + bytes(32)
+            + bytes(32)
+            + amount1_out.to_bytes(32, "big")
+        ),
+        "transactionHash": HexBytes("0x" + "ab" * 32),
+        "blockNumber": 12345,
+        "logIndex": 3,
+    }
+
+
+def test_is_swap_transaction(reader):
+    logs = [
+        make_swap_log(1, 1),
+        {"topics": [HexBytes(UniswapV2Reader.MINT_EVENT_SIGNATURE)]},
+        {"topics": []},
+        make_swap_log(1, 1),
+    ]
+
+    assert reader.is_swap_transaction({}, logs) == (True, 2)
+    assert reader.is_liquidity_transaction({}, logs) == (True, 1)
+
+
+def test_decode_swap_event(reader):
+    reader._pool_token_cache[POOL.lower()] = (USDC, WETH)
+
+    swap = reader.decode_swap_event(make_swap_log(2_000_000, 10**18))
+
+    assert swap.token_in == USDC
+    assert swap.token_out == WETH
+    assert swap.amount_in == Decimal("2")
+    assert swap.amount_out == Decimal("1")
+    assert swap.log_index == 3
+    assert swap.trader == "0x" + "22" * 20
+    assert swap.tx_hash == "0x" + "ab" * 32
+
+
+def test_decode_swap_event_rejects_other_topics(reader):
+    log = make_swap_log(1, 1)
+    log["topics"][0] = HexBytes(UniswapV2Reader.MINT_EVENT_SIGNATURE)
+
+    with pytest.raises(ValueError):
+        reader.decode_swap_event(log)
+
+
+def test_get_swaps_from_block_uses_log_filter(reader):
+    reader._pool_token_cache[POOL.lower()] = (USDC, WETH)
+    reader.w3.eth.get_logs.return_value = [make_swap_log(2_000_000, 10**18)]
+
+    swaps = reader.get_swaps_from_block(12345)
+
+    assert len(swaps) == 1
+    assert swaps[0].amount_in == Decimal("2")
+    reader.w3.eth.get_logs.assert_called_once_with(
+        {
+            "fromBlock": 12345,
+            "toBlock": 12345,
+            "topics": [UniswapV2Reader.SWAP_EVENT_SIGNATURE],
+        }
+    )
+    reader.w3.eth.get_transaction_receipt.assert_not_called()
+
+    batch = reader.get_swaps_from_block(12345, as_batch=True)
+    assert batch.to_events() == swaps
+
+
+def test_get_token_price_at_block_skips_pool_info(reader, monkeypatch):
+    monkeypatch.setattr(reader, "find_pool_address", lambda *args: POOL)
+    monkeypatch.setattr(
+        reader,
+        "get_pool_reserves_at_block",
+        lambda pool, block: (Decimal("1000000"), Decimal("500")),
+    )
+    reader.get_pool_info = MagicMock()
+    monkeypatch.setattr(
+        uniswap_v2, "get_pool_tokens", lambda w3, pool: (USDC.address, WETH.address)
+    )
+
+    price = reader.get_token_price(USDC.address, block_number=12345)
+
+    assert price == Decimal("0.0005")
+    reader.get_pool_info.assert_not_called()
+
+
+def test_get_token_price_latest_skips_pool_info(reader, monkeypatch):
+    monkeypatch.setattr(reader, "find_pool_address", lambda *args: POOL)
+    monkeypatch.setattr(
+        uniswap_v2, "get_pool_tokens", lambda w3, pool: (USDC.address, WETH.address)
+    )
+    monkeypatch.setattr(
+        uniswap_v2,
+        "get_token_info",
+        lambda w3, token, cache=None: USDC if token == USDC.address else WETH,
+    )
+    reader.get_pool_info = MagicMock()
+    reader.w3.eth.call.return_value = encode(
+        ["uint112", "uint112", "uint32"], [2_000_000 * 10**6, 1000 * 10**18, 0]
+    )
+
+    assert reader.get_token_price(WETH.address) == Decimal("2000")
+    reader.get_pool_info.assert_not_called()
+    # getReserves only, no totalSupply read
+    assert reader.w3.eth.call.call_count == 1
+    assert reader.w3.eth.call.call_args[0][1] == "latest"
+
+
+def test_get_pool_info(reader, monkeypatch):
+    monkeypatch.setattr(
+        uniswap_v2, "get_pool_tokens", lambda w3, pool: (USDC.address, WETH.address)
+    )
+    monkeypatch.setattr(
+        uniswap_v2,
+        "get_token_info",
+        lambda w3, token, cache=None: USDC if token == USDC.address else WETH,
+    )
+    responses = {
+        GET_RESERVES_SELECTOR: encode(
+            ["uint112", "uint112", "uint32"], [2_000_000 * 10**6, 1000 * 10**18, 0]
+        ),
+        TOTAL_SUPPLY_SELECTOR: encode(["uint256"], [5 * 10**18]),
+    }
+    reader.w3.eth.call.side_effect = lambda tx, block: responses[tx["data"]]
+
+    pool = reader.get_pool_info(POOL)
+
+    assert pool.token0 == USDC
+    assert pool.token1 == WETH
+    assert pool.reserve0 == Decimal("2000000")
+    assert pool.reserve1 == Decimal("1000")
+    assert pool.total_supply == Decimal("5")
+
+
+def test_get_liquidity_events_prefetches_pools(reader, monkeypatch):
+    prefetched = []
+
+    def prefetch_pools(pools):
+        prefetched.append(list(pools))
+        reader._pool_token_cache[POOL.lower()] = (USDC, WETH)
+
+    monkeypatch.setattr(reader, "_prefetch_pools", prefetch_pools)
+    mint_log = make_swap_log(3_000_000, 0)
+    mint_log["topics"][0] = HexBytes(UniswapV2Reader.MINT_EVENT_SIGNATURE)
+    reader.w3.eth.get_transaction_receipt.return_value = {
+        "logs": [mint_log, make_swap_log(1, 1), mint_log]
+    }
+
+    events = reader.get_liquidity_events_from_transaction("0x" + "ab" * 32)
+
+    assert prefetched == [[POOL, POOL]]
+    assert len(events) == 2
+    assert events[0].event_type == "mint"
+    assert events[0].token0_amount == Decimal("3")
+    assert events[0].provider == "0x" + "11" * 20
+
+
+def test_pool_tokens_cache_ignores_address_case(reader, monkeypatch):
+    fetched = []
+
+    def get_pools_token_infos(w3, pools, cache=None):
+        pools = list(pools)
+        fetched.append(pools)
+        return {pool: (USDC, WETH) for pool in pools}
+
+    monkeypatch.setattr(uniswap_v2, "get_pools_token_infos", get_pools_token_infos)
+
+    assert reader._pool_tokens(POOL.lower()) == (USDC, WETH)
+    assert reader._pool_tokens(POOL) == (USDC, WETH)
+    reader._prefetch_pools([POOL, POOL.lower()])
+    assert fetched == [[POOL.lower()]]
+
+
+def test_prefetch_pools_propagates_unexpected_errors(reader, monkeypatch):
+    def get_pools_token_infos(w3, pools, cache=None):
+        raise RuntimeError("bug")
+
+    monkeypatch.setattr(uniswap_v2, "get_pools_token_infos", get_pools_token_infos)
+
+    with pytest.raises(RuntimeError):
+        reader._prefetch_pools([POOL])
+
+
+def test_get_pool_reserves_at_block_is_cached(reader, monkeypatch):
+    monkeypatch.setattr(
+        uniswap_v2, "get_pool_tokens", lambda w3, pool: (USDC.address, WETH.address)
+    )
+    monkeypatch.setattr(
+        uniswap_v2,
+        "get_token_info",
+        lambda w3, token, cache=None: USDC if token == USDC.address else WETH,
+    )
+    reader.w3.eth.call.return_value = encode(
+        ["uint112", "uint112", "uint32"], [2_000_000 * 10**6, 1000 * 10**18, 0]
+    )
+
+    first = reader.get_pool_reserves_at_block(POOL, 12345)
+    second = reader.get_pool_reserves_at_block(POOL.lower(), 12345)
+
+    assert first == second == (Decimal("2000000"), Decimal("1000"))
+    assert reader.w3.eth.call.call_count == 1
+
+    reader.clear_reserves_cache()
+    reader.get_pool_reserves_at_block(POOL, 12345)
+    assert reader.w3.eth.call.call_count == 2
+
+
+def test_find_pool_address_is_cached(reader):
+    get_pair = reader.w3.eth.contract.return_value.functions.getPair
+    get_pair.return_value.call.return_value = POOL
+
+    assert reader.find_pool_address(WETH.address, USDC.address) == POOL
+    assert reader.find_pool_address(USDC.address.lower(), WETH.address) == POOL
+    assert get_pair.call_count == 1
+
+
+def test_find_pool_address_does_not_cache_missing_pairs(reader):
+    get_pair = reader.w3.eth.contract.return_value.functions.getPair
+    get_pair.return_value.call.return_value = "0x" + "00" * 20
+
+    assert reader.find_pool_address(WETH.address, USDC.address) is None
+    assert reader.find_pool_address(WETH.address, USDC.address) is None
+    assert get_pair.call_count == 2
+
+
+def test_get_liquidity_events_from_block_uses_log_filter(reader):
+    reader._pool_token_cache[POOL.lower()] = (USDC, WETH)
+    mint_log = make_swap_log(3_000_000, 0)
+    mint_log["topics"][0] = HexBytes(UniswapV2Reader.MINT_EVENT_SIGNATURE)
+    reader.w3.eth.get_logs.return_value = [mint_log]
+
+    events = reader.get_liquidity_events_from_block(12345, pool_address=POOL.lower())
+
+    assert [event.event_type for event in events] == ["mint"]
+    reader.w3.eth.get_logs.assert_called_once_with(
+        {
+            "fromBlock": 12345,
+            "toBlock": 12345,
+            "topics": [
+                [
+                    UniswapV2Reader.MINT_EVENT_SIGNATURE,
+                    UniswapV2Reader.BURN_EVENT_SIGNATURE,
+                ]
+            ],
+            "address": POOL,
+        }
+    )
+
+
+def test_get_swaps_from_block_skips_undecodable_logs(reader, monkeypatch):
+    reader._pool_token_cache[POOL.lower()] = (USDC, WETH)
+    fake_pool_log = make_swap_log(1, 1)
+    fake_pool_log["address"] = "0x" + "33" * 20
+    reader.w3.eth.get_logs.return_value = [
+        fake_pool_log,
+        {"topics": []},
+        make_swap_log(2_000_000, 10**18),
+    ]
+    monkeypatch.setattr(reader, "_prefetch_pools", lambda pools: None)
+
+    def get_pool_tokens(w3, pool):
+        raise ContractLogicError("execution reverted")
+
+    monkeypatch.setattr(uniswap_v2, "get_pool_tokens", get_pool_tokens)
+
+    swaps = reader.get_swaps_from_block(12345)
+
+    assert [swap.pool_address for swap in swaps] == [POOL]
+
+
+def test_get_swaps_from_block_propagates_unexpected_errors(reader, monkeypatch):
+    reader.w3.eth.get_logs.return_value = [make_swap_log(1, 1)]
+    monkeypatch.setattr(reader, "_prefetch_pools", lambda pools: None)
+
+    def get_pool_tokens(w3, pool):
+        raise RuntimeError("bug")
+
+    monkeypatch.setattr(uniswap_v2, "get_pool_tokens", get_pool_tokens)
+
+    with pytest.raises(RuntimeError):
+        reader.get_swaps_from_block(12345)
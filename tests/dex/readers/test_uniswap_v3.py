@@ -0,0 +1,317 @@
+from dataclasses import replace
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+from eth_abi import decode, encode
+from hexbytes import HexBytes
+
+from mev_tools_py.dex.cache import TokenCache
+from mev_tools_py.dex.models import TokenInfo, SwapEvent, LiquidityPool
+from mev_tools_py.dex.multicall import (
+    TOKEN0_SELECTOR,
+    TOKEN1_SELECTOR,
+    FEE_SELECTOR,
+    NAME_SELECTOR,
+    SYMBOL_SELECTOR,
+    DECIMALS_SELECTOR,
+)
+from mev_tools_py.dex.readers.uniswap_v3 import UniswapV3Reader
+
+USDC = TokenInfo("0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48", "USDC", 6, "USDC")
+WETH = TokenInfo("0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2", "WETH", 18, "WETH")
+POOL = "0x88e6A0c2dDD26FEEb64F039a2c41296FcB3f5640"
+
+
+@pytest.fixture
+def reader() -> UniswapV3Reader:
+    return UniswapV3Reader(MagicMock())
+
+
+def make_aggregate3_call(responses):
+    """Build an eth.call side effect answering aggregate3 by (target, selector)."""
+
+    def eth_call(tx, block_identifier):
+        (calls,) = decode(["(address,bool,bytes)[]"], tx["data"][4:])
+        results = []
+        for target, _, call_data in calls:
+            data = responses.get((target.lower(), bytes(call_data[:4])))
+            results.append((data is not None, data or b""))
+        return encode(["(bool,bytes)[]"], [results])
+
+    return eth_call
+
+
+def pool_responses():
+    responses = {
+        (POOL.lower(), TOKEN0_SELECTOR): encode(["address"], [USDC.address]),
+        (POOL.lower(), TOKEN1_SELECTOR): encode(["address"], [WETH.address]),
+        (POOL.lower(), FEE_SELECTOR): encode(["uint24"], [500]),
+    }
+    for token in (USDC, WETH):
+        address = token.address.lower()
+        responses[(address, NAME_SELECTOR)] = encode(["string"], [token.name])
+        responses[(address, SYMBOL_SELECTOR)] = encode(["string"], [token.symbol])
+        responses[(address, DECIMALS_SELECTOR)] = encode(["uint8"], [token.decimals])
+    return responses
+
+
+def test_pool_tokens_are_prefetched_and_cached(reader):
+    reader.w3.eth.call.side_effect = make_aggregate3_call(pool_responses())
+
+    assert reader._pool_tokens(POOL) == (USDC, WETH, 500)
+    assert reader._pool_tokens(POOL.lower()) == (USDC, WETH, 500)
+    # One multicall for token0/token1/fee and one for the token metadata
+    assert reader.w3.eth.call.call_count == 2
+    reader.w3.eth.contract.assert_not_called()
+
+
+def mainnet_w3():
+    w3 = MagicMock()
+    w3.eth.chain_id = 1
+    return w3
+
+
+def test_pool_tokens_are_persisted():
+    cache = TokenCache(chain_id=1)
+    reader = UniswapV3Reader(mainnet_w3(), token_cache=cache)
+    reader.w3.eth.call.side_effect = make_aggregate3_call(pool_responses())
+    assert reader._pool_tokens(POOL) == (USDC, WETH, 500)
+
+    restarted = UniswapV3Reader(mainnet_w3(), token_cache=cache)
+
+    assert restarted._pool_tokens(POOL) == (USDC, WETH, 500)
+    restarted.w3.eth.call.assert_not_called()
+
+
+def test_cache_of_another_chain_is_not_served():
+    cache = TokenCache(chain_id=10)
+    cache.put_pool(POOL, USDC.address, WETH.address, 500)
+
+    with pytest.raises(ValueError):
+        UniswapV3Reader(mainnet_w3(), token_cache=cache)
+
+
+def test_get_token_price_skips_pool_info(reader, monkeypatch):
+    reader._pool_immutables[POOL.lower()] = (USDC, WETH, 500)
+    monkeypatch.setattr(reader, "find_pool_address", lambda *args: POOL)
+    reader.get_pool_info = MagicMock()
+    slot0 = reader.w3.eth.contract.return_value.functions.slot0.return_value
+    slot0.call.return_value = (2**96, 0, 0, 0, 0, 0, True)
+
+    assert reader.get_token_price(USDC.address) == 1
+    reader.get_pool_info.assert_not_called()
+
+
+def test_get_swaps_from_block_uses_log_filter(reader):
+    reader.w3.eth.get_logs.return_value = []
+
+    assert reader.get_swaps_from_block(12345) == []
+    reader.w3.eth.get_logs.assert_called_once_with(
+        {
+            "fromBlock": 12345,
+            "toBlock": 12345,
+            "topics": [UniswapV3Reader.SWAP_EVENT_SIGNATURE],
+        }
+    )
+    reader.w3.eth.get_transaction_receipt.assert_not_called()
+
+
+def test_get_liquidity_events_from_block_uses_log_filter(reader):
+    reader.w3.eth.get_logs.return_value = []
+
+    assert reader.get_liquidity_events_from_block(12345) == []
+    (log_filter,) = reader.w3.eth.get_logs.call_args[0]
+    assert log_filter["topics"] == [
+        [UniswapV3Reader.MINT_EVENT_SIGNATURE, UniswapV3Reader.BURN_EVENT_SIGNATURE]
+    ]
+    assert "address" not in log_filter
+
+    reader.get_liquidity_events_from_block(12345, pool_address=POOL.lower())
+    (log_filter,) = reader.w3.eth.get_logs.call_args[0]
+    assert log_filter["address"] == POOL
+
+
+SWAP_TYPES = ["int256", "int256", "uint160", "uint128", "int24"]
+# Non-indexed fields of Mint and Burn; owner and ticks are indexed topics
+MINT_TYPES = ["address", "uint128", "uint256", "uint256"]
+BURN_TYPES = ["uint128", "uint256", "uint256"]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [-5 * 10**18, 10**6, 2**96, 10**20, -887272],
+        [2**255 - 1, -(2**255), 2**160 - 1, 2**128 - 1, 887272],
+        [0, -1, 0, 0, -1],
+    ],
+)
+def test_decode_swap_data_matches_abi_decode(values):
+    data = encode(SWAP_TYPES, values)
+
+    assert UniswapV3Reader._decode_swap_data(data) == decode(SWAP_TYPES, data)
+
+
+def test_decode_liquidity_data_matches_abi_decode():
+    mint_data = encode(MINT_TYPES, [USDC.address, 2**128 - 1, 10**6, 0])
+    burn_data = encode(BURN_TYPES, [2**128 - 1, 10**6, 0])
+
+    assert (
+        UniswapV3Reader._decode_liquidity_data(mint_data, True)
+        == decode(MINT_TYPES, mint_data)[1:]
+    )
+    assert UniswapV3Reader._decode_liquidity_data(burn_data, False) == decode(
+        BURN_TYPES, burn_data
+    )
+
+
+def make_liquidity_log(topic0: str, data: bytes) -> dict:
+    return {
+        "topics": [
+            HexBytes(topic0),
+            HexBytes(encode(["address"], [WETH.address])),
+            HexBytes(encode(["int24"], [-887220])),
+            HexBytes(encode(["int24"], [887220])),
+        ],
+        "data": HexBytes(data),
+        "address": POOL,
+        "transactionHash": HexBytes("0x" + "12" * 32),
+        "blockNumber": 12345,
+        "logIndex": 0,
+    }
+
+
+def test_decode_liquidity_event_uses_event_layouts(reader):
+    mint_log = make_liquidity_log(
+        UniswapV3Reader.MINT_EVENT_SIGNATURE,
+        encode(MINT_TYPES, [USDC.address, 10**18, 3 * 10**6, 2 * 10**18]),
+    )
+    burn_log = make_liquidity_log(
+        UniswapV3Reader.BURN_EVENT_SIGNATURE,
+        encode(BURN_TYPES, [10**18, 3 * 10**6, 2 * 10**18]),
+    )
+
+    mint = reader.decode_liquidity_event(mint_log, USDC, WETH)
+    burn = reader.decode_liquidity_event(burn_log, USDC, WETH)
+
+    assert (mint.event_type, burn.event_type) == ("mint", "burn")
+    assert mint.provider.lower() == USDC.address.lower()
+    assert burn.provider.lower() == WETH.address.lower()
+    for event in (mint, burn):
+        assert event.liquidity_delta == Decimal(1)
+        assert event.token0_amount == Decimal(3)
+        assert event.token1_amount == Decimal(2)
+
+
+def test_calculate_price_impact(reader):
+    pool = LiquidityPool(
+        address=POOL,
+        dex_protocol="uniswap_v3",
+        token0=USDC,
+        token1=WETH,
+        reserve0=Decimal(0),
+        reserve1=Decimal(0),
+        total_supply=Decimal(0),
+        sqrt_price_x96=2**97,
+    )
+    swap = SwapEvent(
+        tx_hash="0x123",
+        block_number=12345,
+        log_index=0,
+        dex_protocol="uniswap_v3",
+        pool_address=POOL,
+        trader="0xTraderAddress",
+        token_in=USDC,
+        token_out=WETH,
+        amount_in=Decimal("10"),
+        amount_out=Decimal("30"),
+    )
+
+    assert reader.calculate_price_impact(swap, pool) == Decimal("0.25")
+    assert reader.calculate_price_impact(replace(swap, amount_in=Decimal(0)), pool) == 0
+
+
+def make_swap_log(amount0: int, amount1: int) -> dict:
+    return {
+        "address": POOL,
+        "topics": [
+            HexBytes(UniswapV3Reader.SWAP_EVENT_SIGNATURE),
+            HexBytes("0x" + "00" * 12 + "11" * 20),
+            HexBytes("0x" + "00" * 12 + "22" * 20),
+        ],
+        "data": HexBytes(
+            encode(
+                ["int256", "int256", "uint160", "uint128", "int24"],
+                [amount0, amount1, 2**96, 10**20, 0],
+            )
+        ),
+        "transactionHash": HexBytes("0x" + "ab" * 32),
+        "blockNumber": 12345,
+        "logIndex": 7,
+    }
+
+
+def test_is_swap_transaction(reader):
+    logs = [
+        make_swap_log(1, -1),
+        {"topics": [HexBytes(UniswapV3Reader.BURN_EVENT_SIGNATURE)]},
+        {"topics": []},
+    ]
+
+    assert reader.is_swap_transaction({}, logs) == (True, 1)
+    assert reader.is_liquidity_transaction({}, logs) == (True, 1)
+
+
+def test_decode_swap_event(reader):
+    reader._pool_immutables[POOL.lower()] = (USDC, WETH, 500)
+
+    swap = reader.decode_swap_event(make_swap_log(-3 * 10**6, 10**18))
+
+    assert swap.token_in == WETH
+    assert swap.token_out == USDC
+    assert swap.amount_in == Decimal("1")
+    assert swap.amount_out == Decimal("3")
+    assert swap.trader == "0x" + "22" * 20
+    assert swap.tx_hash == "0x" + "ab" * 32
+
+
+def test_get_swaps_from_transaction(reader):
+    reader._pool_immutables[POOL.lower()] = (USDC, WETH, 500)
+    other_log = make_swap_log(1, -1)
+    other_log["topics"][0] = HexBytes(UniswapV3Reader.MINT_EVENT_SIGNATURE)
+    reader.w3.eth.get_transaction_receipt.return_value = {
+        "logs": [make_swap_log(2 * 10**6, -(10**18)), other_log]
+    }
+
+    swaps = reader.get_swaps_from_transaction("0x" + "ab" * 32)
+
+    assert len(swaps) == 1
+    assert swaps[0].token_in == USDC
+    assert swaps[0].amount_in == Decimal("2")
+
+
+def test_find_pool_address_is_cached(reader):
+    get_pool = reader.w3.eth.contract.return_value.functions.getPool
+    get_pool.return_value.call.side_effect = lambda: (
+        POOL if get_pool.call_args[0][2] == 3000 else "0x" + "00" * 20
+    )
+
+    assert reader.find_pool_address(WETH.address, USDC.address) == POOL
+    assert get_pool.call_count == 2
+
+    assert reader.find_pool_address(USDC.address.lower(), WETH.address) == POOL
+    # The 500 tier has no pool and is queried again, the 3000 tier is cached
+    assert get_pool.call_count == 3
+
+
+def test_get_swaps_from_block_columnar(reader):
+    reader.w3.eth.get_logs.return_value = [make_swap_log(2 * 10**6, -(10**18))]
+
+    columns = reader.get_swaps_from_block_columnar(12345)
+
+    assert columns.block_number == 12345
+    assert columns.to_rows() == [
+        (POOL, "0x" + "ab" * 32, 7, 2 * 10**6, -(10**18), 2**96, 10**20, 0)
+    ]
+    # Raw values only, no pool token lookups
+    reader.w3.eth.call.assert_not_called()
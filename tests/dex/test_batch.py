@@ -0,0 +1,132 @@
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from mev_tools_py.dex.batch import (
+    SwapBatch,
+    SwapLogColumns,
+    price_impact_batch,
+    extract_price_impact_inputs,
+    calculate_price_impacts,
+)
+from mev_tools_py.dex.models import TokenInfo, SwapEvent, LiquidityPool
+from mev_tools_py.dex.readers.uniswap_v2 import UniswapV2Reader
+
+USDC = TokenInfo("0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48", "USDC", 6)
+WETH = TokenInfo("0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2", "WETH", 18)
+POOL = "0xB4e16d0168e52d35CaCD2c6185b44281Ec28C9Dc"
+
+
+def make_swap(token_in, token_out, amount_in, pool_address=POOL):
+    return SwapEvent(
+        tx_hash="0x123",
+        block_number=12345,
+        log_index=0,
+        dex_protocol="uniswap_v2",
+        pool_address=pool_address,
+        trader="0xTraderAddress",
+        token_in=token_in,
+        token_out=token_out,
+        amount_in=Decimal(amount_in),
+        amount_out=Decimal("0"),
+    )
+
+
+@pytest.fixture
+def pools():
+    return {
+        POOL: LiquidityPool(
+            address=POOL,
+            dex_protocol="uniswap_v2",
+            token0=USDC,
+            token1=WETH,
+            reserve0=Decimal("1000000"),
+            reserve1=Decimal("500"),
+            total_supply=Decimal("10000"),
+        )
+    }
+
+
+def test_price_impact_batch():
+    impacts = price_impact_batch(
+        [100.0, 0.0, 100.0], [50.0, 50.0, 50.0], [100.0, 1.0, 0.0]
+    )
+
+    assert impacts == [0.5, 0.0, 0.0]
+
+
+def test_extract_price_impact_inputs(pools):
+    swaps = [
+        make_swap(USDC, WETH, "10"),
+        make_swap(WETH, USDC, "1"),
+        make_swap(USDC, WETH, "10", pool_address="0xUnknownPool"),
+    ]
+
+    reserve_in, reserve_out, amount_in = extract_price_impact_inputs(swaps, pools)
+
+    assert reserve_in == [1000000.0, 500.0, 0.0]
+    assert reserve_out == [500.0, 1000000.0, 0.0]
+    assert amount_in == [10.0, 1.0, 10.0]
+
+
+def test_calculate_price_impacts_matches_reader(pools):
+    reader = UniswapV2Reader(MagicMock())
+    swaps = [make_swap(USDC, WETH, "10000"), make_swap(WETH, USDC, "5")]
+
+    impacts = calculate_price_impacts(swaps, pools)
+
+    for swap, impact in zip(swaps, impacts):
+        expected = reader.calculate_price_impact(swap, pools[POOL])
+        assert impact == pytest.approx(float(expected))
+
+
+def test_swap_batch_round_trip():
+    swaps = [
+        make_swap(USDC, WETH, "10"),
+        make_swap(WETH, USDC, "1.5", pool_address=POOL.lower()),
+    ]
+
+    batch = SwapBatch.from_events(swaps)
+
+    assert len(batch) == 2
+    assert batch.to_events() == swaps
+    assert list(batch.amount_in) == [10.0, 1.5]
+    assert list(batch.block_number) == [12345, 12345]
+
+
+def test_swap_batch_interns_addresses():
+    batch = SwapBatch.from_events(
+        [
+            make_swap(USDC, WETH, "10"),
+            make_swap(WETH, USDC, "1", pool_address=POOL.lower()),
+        ]
+    )
+
+    assert batch.pool_idx[0] == batch.pool_idx[1]
+    assert batch.token_in_idx[0] == batch.token_out_idx[1]
+    assert batch.token_out_idx[0] == batch.token_in_idx[1]
+    assert batch.address_table[batch.pool_idx[0]] == POOL.lower()
+    assert len(batch.address_table) == 4
+
+
+def test_swap_log_columns():
+    columns = SwapLogColumns(12345)
+    columns.append(POOL, "0xabc", 3, -(2**200), 10**6, 2**96, 10**20, -887272)
+
+    assert len(columns) == 1
+    assert columns.amount0 == [-(2**200)]
+    assert list(columns.tick) == [-887272]
+    assert columns.to_rows() == [
+        (POOL, "0xabc", 3, -(2**200), 10**6, 2**96, 10**20, -887272)
+    ]
+
+
+def test_swap_batch_token_pair():
+    batch = SwapBatch.from_events(
+        [make_swap(USDC, WETH, "10"), make_swap(WETH, USDC, "1")]
+    )
+
+    expected = (USDC.address.lower(), WETH.address.lower())
+    assert batch.token_pair(0) == expected
+    assert batch.token_pair(1) == expected
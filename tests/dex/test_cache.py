@@ -0,0 +1,78 @@
+from mev_tools_py.dex.cache import TokenCache, TwoLevelCache
+from mev_tools_py.dex.models import TokenInfo
+
+USDC = TokenInfo("0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48", "USDC", 6, "USD Coin")
+POOL = "0x88e6A0c2dDD26FEEb64F039a2c41296FcB3f5640"
+
+
+def test_two_level_cache_get_put():
+    cache = TwoLevelCache()
+
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    assert len(cache) == 1
+
+
+def test_two_level_cache_promotes_tip_overflow_to_history():
+    cache = TwoLevelCache(tip_size=2, history_size=2)
+
+    for key in "abcd":
+        cache.put(key, key.upper())
+
+    # "a" and "b" were pushed out of the tip into the history
+    assert [cache.get(key) for key in "abcd"] == ["A", "B", "C", "D"]
+    assert len(cache) == 4
+
+
+def test_two_level_cache_evicts_least_recently_used_history():
+    cache = TwoLevelCache(tip_size=1, history_size=2)
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    cache.get("a")  # "b" is now the least recently used history entry
+    cache.put("d", 4)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.get("d") == 4
+
+
+def test_two_level_cache_clear():
+    cache = TwoLevelCache(tip_size=1)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.get("a") is None
+
+
+def test_token_cache_persists_across_connections(tmp_path):
+    path = str(tmp_path / "metadata.sqlite")
+    cache = TokenCache(path, chain_id=1)
+    cache.put_token(USDC)
+    cache.put_pool(
+        POOL, USDC.address, "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2", 500
+    )
+    cache.close()
+
+    cache = TokenCache(path, chain_id=1)
+
+    assert cache.get_token(USDC.address.lower()) == USDC
+    assert cache.get_pool(POOL) == (
+        USDC.address,
+        "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
+        500,
+    )
+    assert cache.get_token(POOL) is None
+
+
+def test_token_cache_is_scoped_by_chain(tmp_path):
+    path = str(tmp_path / "metadata.sqlite")
+    TokenCache(path, chain_id=1).put_token(USDC)
+
+    assert TokenCache(path, chain_id=10).get_token(USDC.address) is None
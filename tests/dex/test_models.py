@@ -1,5 +1,8 @@
+from dataclasses import FrozenInstanceError
 from decimal import Decimal
 
+import pytest
+
 from mev_tools_py.dex.models import (
     TokenInfo,
     SwapEvent,
@@ -24,6 +27,18 @@ def test_token_info():
     assert token.name == "USD Coin"
 
 
+def test_token_info_is_immutable():
+    token = TokenInfo(
+        address="0xA0b86a33E6441E0079C0b9fea6f4b17cb5F62D9b", symbol="USDC", decimals=6
+    )
+
+    with pytest.raises(FrozenInstanceError):
+        token.decimals = 18
+
+    assert not hasattr(token, "__dict__")
+    assert hash(token) == hash(TokenInfo(token.address, "USDC", 6))
+
+
 def test_swap_event():
     token_in = TokenInfo("0xAddress1", "USDC", 6)
     token_out = TokenInfo("0xAddress2", "WETH", 18)
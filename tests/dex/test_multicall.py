@@ -0,0 +1,77 @@
+from unittest.mock import MagicMock
+
+from eth_abi import decode, encode
+
+from mev_tools_py.dex.multicall import (
+    AGGREGATE3_SELECTOR,
+    MULTICALL3_ADDRESS,
+    TOKEN0_SELECTOR,
+    call,
+    encode_aggregate3,
+    decode_aggregate3,
+    multicall,
+    decode_address_result,
+    decode_uint_result,
+    decode_string_result,
+)
+
+POOL = "0xB4e16d0168e52d35CaCD2c6185b44281Ec28C9Dc"
+TOKEN = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+
+
+def test_encode_aggregate3():
+    data = encode_aggregate3([(POOL, TOKEN0_SELECTOR)])
+
+    assert data[:4] == AGGREGATE3_SELECTOR
+    (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+    assert calls[0][0].lower() == POOL.lower()
+    assert calls[0][1] is True
+    assert calls[0][2] == TOKEN0_SELECTOR
+
+
+def test_decode_aggregate3():
+    raw = encode(["(bool,bytes)[]"], [[(True, b"\x01"), (False, b"")]])
+
+    assert decode_aggregate3(raw) == [(True, b"\x01"), (False, b"")]
+
+
+def test_multicall_batches_calls():
+    w3 = MagicMock()
+    w3.eth.call.side_effect = lambda tx, block: encode(
+        ["(bool,bytes)[]"],
+        [
+            [
+                (True, b"\x00")
+                for _ in decode(["(address,bool,bytes)[]"], tx["data"][4:])[0]
+            ]
+        ],
+    )
+
+    results = multicall(w3, [(POOL, TOKEN0_SELECTOR)] * 5, batch_size=2)
+
+    assert len(results) == 5
+    assert w3.eth.call.call_count == 3
+    assert w3.eth.call.call_args[0][0]["to"] == MULTICALL3_ADDRESS
+    assert w3.eth.call.call_args[0][1] == "latest"
+
+
+def test_call():
+    w3 = MagicMock()
+    w3.eth.call.return_value = b"\x01"
+
+    assert call(w3, POOL, TOKEN0_SELECTOR, 12345) == b"\x01"
+    w3.eth.call.assert_called_once_with({"to": POOL, "data": TOKEN0_SELECTOR}, 12345)
+
+
+def test_decode_address_result():
+    assert decode_address_result(encode(["address"], [TOKEN])) == TOKEN
+
+
+def test_decode_uint_result():
+    assert decode_uint_result(encode(["uint8"], [6])) == 6
+
+
+def test_decode_string_result():
+    assert decode_string_result(encode(["string"], ["USDC"])) == "USDC"
+    # Legacy tokens return bytes32 instead of string
+    assert decode_string_result(b"MKR".ljust(32, b"\x00")) == "MKR"
@@ -0,0 +1,30 @@
+from decimal import Decimal
+
+import pytest
+
+from mev_tools_py.dex._kernels import (
+    price_from_sqrt_x96,
+    price_impact,
+    price_impact_batch,
+)
+
+
+def test_price_from_sqrt_x96():
+    assert price_from_sqrt_x96(2**96) == 1.0
+    assert price_from_sqrt_x96(2**97) == 4.0
+
+    sqrt_price_x96 = 1461446703485210103287273052203988822378723970341
+    exact = Decimal(sqrt_price_x96) ** 2 / Decimal(2) ** 192
+    assert price_from_sqrt_x96(sqrt_price_x96) == pytest.approx(float(exact))
+
+
+def test_price_impact():
+    assert price_impact(2.0, 10.0, 19.0) == pytest.approx(0.05)
+    assert price_impact(0.0, 10.0, 19.0) == 0.0
+    assert price_impact(2.0, 0.0, 19.0) == 0.0
+
+
+def test_price_impact_batch():
+    impacts = price_impact_batch([2**96, 2**97], [10.0, 1.0], [11.0, 0.0])
+
+    assert impacts == [pytest.approx(0.1), 1.0]
@@ -1,12 +1,34 @@
 from decimal import Decimal
+from unittest.mock import MagicMock
 
+import pytest
+from eth_abi import decode, encode
+from hexbytes import HexBytes
+
+from mev_tools_py.dex.cache import TokenCache
+from mev_tools_py.dex.models import LiquidityEvent, TokenInfo
+from mev_tools_py.dex.multicall import (
+    TOKEN0_SELECTOR,
+    TOKEN1_SELECTOR,
+    NAME_SELECTOR,
+    SYMBOL_SELECTOR,
+    DECIMALS_SELECTOR,
+)
 from mev_tools_py.dex.utils import (
+    get_token_info,
+    get_pool_tokens,
+    get_pools_token_infos,
     wei_to_decimal,
+    wei_to_float,
     decimal_to_wei,
     sort_tokens,
     normalize_address,
+    intern_address,
     is_zero_address,
     calculate_price_from_reserves,
+    calculate_sqrt_price,
+    parse_log_data,
+    group_by_transaction,
 )
 
 
@@ -21,6 +43,17 @@ def test_wei_to_decimal():
     assert result == Decimal("0.5")
 
 
+def test_wei_to_decimal_uncommon_decimals():
+    assert wei_to_decimal(10**40, 40) == Decimal("1")
+    assert wei_to_decimal(123, 0) == Decimal("123")
+
+
+def test_wei_to_float():
+    assert wei_to_float(1500000000000000000, 18) == 1.5
+    assert wei_to_float(2500000, 6) == 2.5
+    assert wei_to_float(10**40, 40) == 1.0
+
+
 def test_decimal_to_wei():
     result = decimal_to_wei(Decimal("1"), 18)
     assert result == 1000000000000000000
@@ -32,6 +65,11 @@ def test_decimal_to_wei():
     assert result == 500000000000000000
 
 
+def test_decimal_to_wei_uncommon_decimals():
+    assert decimal_to_wei(Decimal("1"), 40) == 10**40
+    assert decimal_to_wei(Decimal("123"), 0) == 123
+
+
 def test_sort_tokens():
     token1 = "0xB0B86a33E6441E0079C0b9fea6f4b17cb5F62D9b"
     token2 = "0xA0b86a33E6441E0079C0b9fea6f4b17cb5F62D9b"
@@ -49,6 +87,13 @@ def test_normalize_address():
     assert normalized == "0xa0b86a33e6441e0079c0b9fea6f4b17cb5f62d9b"
 
 
+def test_intern_address():
+    address = "".join(["0x", "ab" * 20])
+
+    assert intern_address(address) == address
+    assert intern_address(address) is intern_address("0x" + "ab" * 20)
+
+
 def test_is_zero_address():
     assert is_zero_address("0x0000000000000000000000000000000000000000")
     assert is_zero_address("0X0000000000000000000000000000000000000000")
@@ -66,3 +111,219 @@ def test_calculate_price_from_reserves():
 
     price = calculate_price_from_reserves(Decimal("0"), Decimal("2000000"), 18, 6)
     assert price == Decimal("0")
+
+
+USDC = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+POOL = "0xB4e16d0168e52d35CaCD2c6185b44281Ec28C9Dc"
+
+
+def make_eth_call(responses):
+    """Build an eth.call side effect answering by 4-byte selector."""
+
+    def eth_call(tx, block_identifier):
+        response = responses[bytes(tx["data"][:4])]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return eth_call
+
+
+TOKEN_RESPONSES = {
+    NAME_SELECTOR: encode(["string"], ["USD Coin"]),
+    SYMBOL_SELECTOR: encode(["string"], ["USDC"]),
+    DECIMALS_SELECTOR: encode(["uint8"], [6]),
+}
+
+
+def test_get_token_info_is_cached():
+    w3 = MagicMock()
+    w3.eth.call.side_effect = make_eth_call(TOKEN_RESPONSES)
+
+    first = get_token_info(w3, USDC.lower())
+    second = get_token_info(w3, USDC)
+
+    assert first == second
+    assert first.address == USDC
+    assert first.name == "USD Coin"
+    assert first.symbol == "USDC"
+    assert first.decimals == 6
+    assert w3.eth.call.call_count == 3
+
+
+def test_get_token_info_does_not_cache_failures():
+    w3 = MagicMock()
+    w3.eth.call.side_effect = make_eth_call(
+        {**TOKEN_RESPONSES, NAME_SELECTOR: Exception("rpc error")}
+    )
+
+    token = get_token_info(w3, USDC)
+    assert token.symbol == "UNKNOWN"
+    assert token.decimals == 18
+
+    w3.eth.call.side_effect = make_eth_call(TOKEN_RESPONSES)
+
+    assert get_token_info(w3, USDC).symbol == "USDC"
+
+
+def test_get_token_info_uses_persistent_cache():
+    cache = TokenCache(chain_id=1)
+    w3 = MagicMock()
+    w3.eth.chain_id = 1
+    w3.eth.call.side_effect = make_eth_call(
+        {**TOKEN_RESPONSES, NAME_SELECTOR: Exception("rpc error")}
+    )
+
+    # Failed lookups are not persisted
+    assert get_token_info(w3, USDC, cache).symbol == "UNKNOWN"
+    assert cache.get_token(USDC) is None
+
+    w3.eth.call.side_effect = make_eth_call(TOKEN_RESPONSES)
+    token = get_token_info(w3, USDC, cache)
+
+    assert cache.get_token(USDC) == token
+    # A fresh client is answered from the store without any RPC
+    other_w3 = MagicMock()
+    other_w3.eth.chain_id = 1
+    assert get_token_info(other_w3, USDC, cache) == token
+    other_w3.eth.call.assert_not_called()
+
+
+def test_get_token_info_rejects_cache_of_another_chain():
+    cache = TokenCache(chain_id=10)
+    cache.put_token(TokenInfo(address=USDC, symbol="USDC.e", decimals=6))
+    w3 = MagicMock()
+    w3.eth.chain_id = 1
+
+    with pytest.raises(ValueError):
+        get_token_info(w3, USDC, cache)
+    w3.eth.call.assert_not_called()
+
+
+def test_get_pool_tokens_is_cached():
+    w3 = MagicMock()
+    w3.eth.call.side_effect = make_eth_call(
+        {
+            TOKEN0_SELECTOR: encode(["address"], [USDC]),
+            TOKEN1_SELECTOR: encode(["address"], [WETH]),
+        }
+    )
+
+    assert get_pool_tokens(w3, POOL) == (USDC, WETH)
+    assert get_pool_tokens(w3, POOL.lower()) == (USDC, WETH)
+    assert w3.eth.call.call_count == 2
+
+
+def make_aggregate3_call(responses):
+    """Build an eth.call side effect answering aggregate3 by (target, selector)."""
+
+    def eth_call(tx, block_identifier):
+        (calls,) = decode(["(address,bool,bytes)[]"], tx["data"][4:])
+        results = []
+        for target, _, call_data in calls:
+            data = responses.get((target.lower(), bytes(call_data[:4])))
+            results.append((data is not None, data or b""))
+        return encode(["(bool,bytes)[]"], [results])
+
+    return eth_call
+
+
+def test_get_pools_token_infos():
+    broken_pool = "0x" + "11" * 20
+    responses = {
+        (POOL.lower(), TOKEN0_SELECTOR): encode(["address"], [USDC]),
+        (POOL.lower(), TOKEN1_SELECTOR): encode(["address"], [WETH]),
+    }
+    for token, symbol, decimals in ((USDC, "USDC", 6), (WETH, "WETH", 18)):
+        responses[(token.lower(), NAME_SELECTOR)] = encode(["string"], [symbol])
+        responses[(token.lower(), SYMBOL_SELECTOR)] = encode(["string"], [symbol])
+        responses[(token.lower(), DECIMALS_SELECTOR)] = encode(["uint8"], [decimals])
+    w3 = MagicMock()
+    w3.eth.call.side_effect = make_aggregate3_call(responses)
+
+    pool_tokens = get_pools_token_infos(w3, [POOL, broken_pool, POOL])
+
+    assert list(pool_tokens) == [POOL]
+    token0, token1 = pool_tokens[POOL]
+    assert (token0.symbol, token0.decimals) == ("USDC", 6)
+    assert (token1.symbol, token1.decimals) == ("WETH", 18)
+    assert w3.eth.call.call_count == 2
+
+
+TRANSFER_ABI = [
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "name": "from", "type": "address"},
+            {"indexed": True, "name": "to", "type": "address"},
+            {"indexed": False, "name": "value", "type": "uint256"},
+        ],
+        "name": "Transfer",
+        "type": "event",
+    },
+    {"inputs": [], "name": "decimals", "outputs": [], "type": "function"},
+]
+
+
+def make_transfer_log(topic0: str) -> dict:
+    return {
+        "address": "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+        "topics": [
+            HexBytes(topic0),
+            HexBytes("0x" + "00" * 12 + "11" * 20),
+            HexBytes("0x" + "00" * 12 + "22" * 20),
+        ],
+        "data": HexBytes(encode(["uint256"], [12345])),
+        "transactionHash": HexBytes("0x" + "ab" * 32),
+        "blockHash": HexBytes("0x" + "cd" * 32),
+        "blockNumber": 1,
+        "logIndex": 0,
+        "transactionIndex": 0,
+    }
+
+
+def test_parse_log_data():
+    args = parse_log_data(
+        make_transfer_log(
+            "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+        ),
+        TRANSFER_ABI,
+    )
+
+    assert args["from"].lower() == "0x" + "11" * 20
+    assert args["to"].lower() == "0x" + "22" * 20
+    assert args["value"] == 12345
+
+
+def test_parse_log_data_unknown_event():
+    with pytest.raises(ValueError):
+        parse_log_data(make_transfer_log("0x" + "ff" * 32), TRANSFER_ABI)
+
+
+def test_group_by_transaction():
+    def make_event(tx_hash, log_index):
+        return LiquidityEvent(
+            tx_hash=tx_hash,
+            block_number=1,
+            log_index=log_index,
+            dex_protocol="uniswap_v2",
+            pool_address="0xpool",
+            provider="0xprovider",
+            event_type="mint",
+            token0_amount=Decimal(1),
+            token1_amount=Decimal(1),
+            liquidity_delta=Decimal(1),
+        )
+
+    events = [make_event("0xa", 0), make_event("0xb", 1), make_event("0xa", 2)]
+
+    grouped = group_by_transaction(events)
+
+    assert list(grouped) == ["0xa", "0xb"]
+    assert [event.log_index for event in grouped["0xa"]] == [0, 2]
+
+
+def test_calculate_sqrt_price():
+    assert calculate_sqrt_price(Decimal(1), Decimal(4)) == pytest.approx(2 * 2**96)
+    assert calculate_sqrt_price(Decimal(1), Decimal(0)) == 0
@@ -1,7 +1,7 @@
 from hexbytes import HexBytes
 import pytest
 from unittest.mock import MagicMock
-from mev_tools_py.enrich.transactions import enrich_txs, enrich_tx
+from mev_tools_py.enrich.transactions import clear_tx_cache, enrich_txs, enrich_tx
 
 
 @pytest.fixture
@@ -43,10 +43,29 @@ def mock_web3():
 
     w3.eth.get_transaction.side_effect = get_transaction
     w3.eth.get_transaction_receipt.side_effect = get_receipt
+    # Provider without JSON-RPC batch support
+    w3.batch_requests.side_effect = NotImplementedError
 
     return w3
 
 
+class FakeBatch:
+    def __init__(self):
+        self.requests = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add(self, request):
+        self.requests.append(request)
+
+    def execute(self):
+        return self.requests
+
+
 def test_enrich_tx(mock_web3):
     tx_hash = "0x" + "aa" * 32
     tx = enrich_tx(mock_web3, tx_hash)
@@ -78,3 +97,47 @@ def test_enrich_txs(mock_web3):
         assert len(tx["logs"]) == 1
         assert tx["logs"][0]["address"] == "0xlogsource"
         assert tx["logs"][0]["topics"][0].to_0x_hex() == "0x" + "abcd" * 8
+
+
+def test_enrich_txs_preserves_order(mock_web3):
+    tx_hashes = ["0x" + "%02x" % i * 32 for i in range(10)]
+    result = enrich_txs(mock_web3, tx_hashes)
+
+    assert [tx["hash"] for tx in result] == [h[2:] for h in tx_hashes]
+
+
+def test_enrich_txs_uses_batch_requests(mock_web3):
+    mock_web3.batch_requests.side_effect = None
+    mock_web3.batch_requests.return_value = FakeBatch()
+    tx_hashes = ["0x" + "aa" * 32, "0x" + "bb" * 32]
+
+    result = enrich_txs(mock_web3, tx_hashes)
+
+    assert [tx["hash"] for tx in result] == [h[2:] for h in tx_hashes]
+    assert all(tx["gas_used"] == 21000 for tx in result)
+
+
+def test_enrich_txs_empty(mock_web3):
+    assert enrich_txs(mock_web3, []) == []
+    mock_web3.eth.get_transaction.assert_not_called()
+
+
+def test_enrich_tx_is_cached(mock_web3):
+    tx_hash = "0x" + "aa" * 32
+
+    assert enrich_tx(mock_web3, tx_hash) == enrich_tx(mock_web3, tx_hash.upper())
+    assert mock_web3.eth.get_transaction_receipt.call_count == 1
+
+    clear_tx_cache()
+    enrich_tx(mock_web3, tx_hash)
+    assert mock_web3.eth.get_transaction_receipt.call_count == 2
+
+
+def test_enrich_txs_only_fetches_uncached(mock_web3):
+    enrich_tx(mock_web3, "0x" + "aa" * 32)
+
+    result = enrich_txs(mock_web3, ["0x" + "bb" * 32, "0x" + "aa" * 32])
+
+    assert [tx["hash"] for tx in result] == ["bb" * 32, "aa" * 32]
+    fetched = [c.args[0] for c in mock_web3.eth.get_transaction_receipt.call_args_list]
+    assert fetched == ["0x" + "aa" * 32, "0x" + "bb" * 32]
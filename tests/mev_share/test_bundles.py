@@ -173,3 +173,23 @@ def test_single_bundle(mock_web3):
         "0x" + "bb" * 32,
         "0x" + "cc" * 32,
     ]
+
+
+def test_bundle_shape(mock_web3):
+    bundles = get_mev_bundles(
+        mock_web3, 123, ORIGIN_TOPIC0.removeprefix("0x"), REFUND_ADDRESS.upper()
+    )
+
+    assert len(bundles) == 3
+    for b in bundles:
+        assert set(b) == {"origin_tx_hash", "refund_tx_hashes", "bundle_tx_hashes"}
+        assert b["bundle_tx_hashes"][0] == b["origin_tx_hash"]
+        assert b["bundle_tx_hashes"][-1] == b["refund_tx_hashes"][-1]
+        assert all(h.startswith("0x") for h in b["bundle_tx_hashes"])
+
+
+def test_origin_without_refund_is_ignored(mock_web3):
+    # Keep only the first origin and the normal tx that follows it
+    del mock_web3.eth.get_block.return_value["transactions"][2:]
+
+    assert get_mev_bundles(mock_web3, 123, ORIGIN_TOPIC0, REFUND_ADDRESS) == []
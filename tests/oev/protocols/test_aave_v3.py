@@ -2,9 +2,17 @@ import pytest
 from unittest.mock import patch
 from typing import Any, Dict, List
 
+from eth_abi import encode
 from hexbytes import HexBytes
 
-from mev_tools_py.oev.protocols.aave_v3 import AaveV3ProtocolProcessor
+from mev_tools_py.oev.models import LiquidationEvent
+from mev_tools_py.oev.protocols.aave_v3 import AaveV3ProtocolProcessor, SIZE_SMALL
+
+
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+USDC = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+USER = "0x532925a3b8D8D5C0532925a3B8D8d5C0532925A3"
+LIQUIDATOR = "0x742D35Cc6634C0532925a3B8d8D5C0532925A3b8"
 
 
 class TestAaveV3ProtocolProcessor:
@@ -83,6 +91,15 @@ class TestAaveV3ProtocolProcessor:
         assert processor.liquidation_call_event is not None
         assert processor.reserve_data_updated_event is not None
 
+    def test_instances_share_event_decoders(
+        self, processor: AaveV3ProtocolProcessor
+    ) -> None:
+        """Test event contracts are built once rather than per instance."""
+        other = AaveV3ProtocolProcessor()
+
+        assert other.w3 is processor.w3
+        assert other.liquidation_call_event is processor.liquidation_call_event
+
     def test_contract_addresses(self, processor: AaveV3ProtocolProcessor) -> None:
         """Test that contract addresses are set correctly."""
         assert processor.POOL_ADDRESS == "0x87870Bca3F3fD6335C3F4ce8392D69350B4fA4E2"
@@ -180,6 +197,167 @@ class TestAaveV3ProtocolProcessor:
 
             assert result["liquidation_bonus"] == 0.0
 
+    @pytest.fixture
+    def encoded_liquidation_log(self) -> Dict[str, Any]:
+        """ABI-encoded LiquidationCall log as returned by a node."""
+        return {
+            "topics": [
+                self.liquidation_topic,
+                HexBytes(encode(["address"], [WETH])),
+                HexBytes(encode(["address"], [USDC])),
+                HexBytes(encode(["address"], [USER])),
+            ],
+            "data": HexBytes(
+                encode(
+                    ["uint256", "uint256", "address", "bool"],
+                    [10**9, 10**17, LIQUIDATOR, True],
+                )
+            ),
+            "address": "0x87870Bca3F3fD6335C3F4ce8392D69350B4fA4E2",
+            "transactionHash": HexBytes("0x" + "12" * 32),
+            "transactionIndex": 3,
+            "blockHash": HexBytes("0x" + "34" * 32),
+            "blockNumber": 18500000,
+            "logIndex": 42,
+        }
+
+    def test_decode_liquidation_fast_path(
+        self,
+        processor: AaveV3ProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test well-formed logs are decoded without web3's process_log."""
+        with patch.object(
+            processor.liquidation_call_event, "process_log"
+        ) as mock_process_log:
+            result = processor.decode_liquidation(encoded_liquidation_log)
+
+        mock_process_log.assert_not_called()
+        assert result["liquidator"] == LIQUIDATOR
+        assert result["user"] == USER
+        assert result["collateral_asset"] == WETH
+        assert result["debt_repaid"] == {"token": USDC, "amount": "1000000000"}
+        assert result["collateral_seized"]["amount"] == "100000000000000000"
+        assert result["debt_repaid_wei"] == 10**9
+        assert result["collateral_seized_wei"] == 10**17
+        assert result["receive_atoken"] is True
+
+    def test_decode_liquidation_fast_path_matches_process_log(
+        self,
+        processor: AaveV3ProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test the fixed-layout decoder agrees with web3's ABI decoding."""
+        expected = processor.liquidation_call_event.process_log(
+            encoded_liquidation_log
+        )["args"]
+
+        assert (
+            processor._decode_liquidation_call_fast(encoded_liquidation_log) == expected
+        )
+
+    def test_decode_liquidation_rejects_other_events(
+        self,
+        processor: AaveV3ProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test logs of other events are rejected without calling process_log."""
+        log = dict(encoded_liquidation_log, topics=[HexBytes("0x" + "22" * 32)])
+
+        with patch.object(
+            processor.liquidation_call_event, "process_log"
+        ) as mock_process_log:
+            with pytest.raises(ValueError, match="not a LiquidationCall event"):
+                processor.decode_liquidation(log)
+            with pytest.raises(ValueError, match="not a LiquidationCall event"):
+                processor.decode_liquidations_batch([encoded_liquidation_log, log])
+
+        mock_process_log.assert_not_called()
+
+    def test_decode_liquidation_event(
+        self,
+        processor: AaveV3ProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test decoding into a slotted LiquidationEvent."""
+        event = processor.decode_liquidation_event(encoded_liquidation_log)
+
+        assert isinstance(event, LiquidationEvent)
+        assert not hasattr(event, "__dict__")
+        assert event.debt_token == USDC
+        assert event.debt_amount == 10**9
+        assert event.collateral_amount == 10**17
+        assert event.receive_atoken is True
+        assert event.health_score is None
+        assert event.to_dict() == processor.decode_liquidation(encoded_liquidation_log)
+
+    def test_decode_liquidation_fast_path_hex_strings(
+        self,
+        processor: AaveV3ProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test the fixed-layout decoder accepts hex string topics and data."""
+        log = dict(encoded_liquidation_log)
+        log["topics"] = [topic.to_0x_hex() for topic in log["topics"]]
+        log["data"] = log["data"].to_0x_hex()
+
+        result = processor.decode_liquidation(log)
+
+        assert result["debt_asset"] == USDC
+        assert result["debt_repaid"]["amount"] == "1000000000"
+
+    def test_decode_liquidations_batch(
+        self,
+        processor: AaveV3ProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+        sample_liquidation_log: Dict[str, Any],
+        mock_decoded_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test batch decoding into columns, including the process_log fallback."""
+        with patch.object(
+            processor.liquidation_call_event,
+            "process_log",
+            return_value=mock_decoded_liquidation_log,
+        ) as mock_process_log:
+            columns = processor.decode_liquidations_batch(
+                [encoded_liquidation_log, sample_liquidation_log]
+            )
+
+        mock_process_log.assert_called_once_with(sample_liquidation_log)
+        assert len(columns) == 2
+        assert columns.debt_asset == [USDC, "0xA0b86a33E6441db5dB86DF4D9E5C4e6a05F3a5"]
+        assert columns.debt_to_cover == [10**9, 1000000000]
+        assert columns.tx_hash == [
+            "0x" + "12" * 32,
+            sample_liquidation_log["transactionHash"],
+        ]
+        assert columns.to_rows()[0] == (
+            LIQUIDATOR,
+            USER,
+            USDC,
+            WETH,
+            10**9,
+            10**17,
+            True,
+            "0x" + "12" * 32,
+            18500000,
+            42,
+        )
+
+    def test_decode_liquidations_batch_failure(
+        self, processor: AaveV3ProtocolProcessor, sample_liquidation_log: Dict[str, Any]
+    ) -> None:
+        """Test batch decoding raises on logs that cannot be decoded."""
+        with patch.object(
+            processor.liquidation_call_event,
+            "process_log",
+            side_effect=Exception("Decoding failed"),
+        ):
+            with pytest.raises(
+                ValueError, match="Failed to decode Aave V3 liquidation log"
+            ):
+                processor.decode_liquidations_batch([sample_liquidation_log])
+
     def test_enrich_event_basic(self, processor: AaveV3ProtocolProcessor) -> None:
         """Test basic event enrichment."""
         event = {
@@ -216,6 +394,73 @@ class TestAaveV3ProtocolProcessor:
         assert result["liquidation_method"] == "receive_atoken"
         assert result["liquidator_receives"] == "aToken"
 
+    def test_enrich_events_batch_matches_enrich_event(
+        self,
+        processor: AaveV3ProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test batch enrichment agrees with enrich_event row by row."""
+        logs = []
+        for debt, collateral, receive in [
+            (500, 10**17, True),
+            (5000, 10**18, False),
+            (2 * 10**22, 10**22, True),
+            (0, 10**17, False),
+        ]:
+            log = dict(encoded_liquidation_log)
+            log["data"] = HexBytes(
+                encode(
+                    ["uint256", "uint256", "address", "bool"],
+                    [debt, collateral, LIQUIDATOR, receive],
+                )
+            )
+            logs.append(log)
+
+        enriched = processor.enrich_events_batch(
+            processor.decode_liquidations_batch(logs)
+        )
+
+        for row, log in enumerate(logs):
+            expected = processor.enrich_event(processor.decode_liquidation(log))
+            for name, values in enriched.items():
+                assert values[row] == expected.get(name)
+        assert enriched["liquidation_size_category"] == [
+            "small",
+            "medium",
+            "large",
+            None,
+        ]
+        assert enriched["liquidation_size_category"][0] is SIZE_SMALL
+
+    def test_enrich_event_uses_exact_integer_amounts(
+        self, processor: AaveV3ProtocolProcessor
+    ) -> None:
+        """Test amounts above 2**53 are classified without float rounding."""
+        event = {
+            "debt_repaid": {"amount": str(10**16 - 1)},  # 9999.99... USDC at 18dp
+            "collateral_seized": {"amount": str(10**16)},
+        }
+
+        result = processor.enrich_event(event)
+
+        assert result["liquidation_size_category"] == "medium"
+
+    def test_enrich_event_prefers_raw_amounts(
+        self, processor: AaveV3ProtocolProcessor
+    ) -> None:
+        """Test the integer amounts from decode_liquidation take precedence."""
+        event = {
+            "debt_repaid": {"amount": "0"},
+            "collateral_seized": {"amount": "0"},
+            "debt_repaid_wei": 500,
+            "collateral_seized_wei": 10**15,
+        }
+
+        result = processor.enrich_event(event)
+
+        assert result["liquidation_ratio"] == 2.0
+        assert result["liquidation_size_category"] == "small"
+
     def test_enrich_event_receive_underlying(
         self, processor: AaveV3ProtocolProcessor
     ) -> None:
@@ -274,17 +519,41 @@ class TestAaveV3ProtocolProcessor:
         sample_logs: List[Dict[str, Any]],
     ) -> None:
         """Test liquidation detection with transaction to Aave V3 Pool contract."""
-        with patch.object(processor.w3, "keccak") as mock_keccak:
-            mock_keccak.return_value.to_0x_hex.return_value = (
-                "0xe413a321e8681d831f4dbccbca790d2952b56f977908e45be37335533e005286"
-            )
+        is_liquidation, log_idx = processor.is_liquidation_transaction(
+            sample_transaction, sample_logs
+        )
 
-            is_liquidation, log_idx = processor.is_liquidation_transaction(
-                sample_transaction, sample_logs
-            )
+        assert is_liquidation is True
+        assert log_idx == 0
+
+    def test_liquidation_call_topic0(self) -> None:
+        """Test the precomputed LiquidationCall topic matches the event signature."""
+        assert (
+            AaveV3ProtocolProcessor.LIQUIDATION_CALL_TOPIC0
+            == self.liquidation_topic.to_0x_hex()
+        )
 
-            assert is_liquidation is True
-            assert log_idx == 0
+    def test_is_liquidation_transaction_bloom_rules_out_event(
+        self,
+        processor: AaveV3ProtocolProcessor,
+        sample_transaction: Dict[str, Any],
+        sample_logs: List[Dict[str, Any]],
+    ) -> None:
+        """Test a logs bloom without LiquidationCall skips the log scan."""
+        transaction = dict(sample_transaction, input="0x")
+        empty_bloom = bytes(256)
+
+        assert processor.is_liquidation_transaction(
+            transaction, sample_logs, logs_bloom=empty_bloom
+        ) == (False, -1)
+        # The method selector check still applies
+        assert processor.is_liquidation_transaction(
+            sample_transaction, sample_logs, logs_bloom=empty_bloom
+        ) == (True, -1)
+        # A bloom that may contain the event keeps the log scan
+        assert processor.is_liquidation_transaction(
+            dict(transaction, logsBloom=b"\xff" * 256), sample_logs
+        ) == (True, 0)
 
     def test_is_liquidation_transaction_wrong_contract(
         self, processor: AaveV3ProtocolProcessor, sample_logs: List[Dict[str, Any]]
@@ -476,6 +745,14 @@ class TestAaveV3ProtocolProcessor:
         unknown_bonus = processor.get_liquidation_bonus("0x1234567890")
         assert unknown_bonus == 0.05
 
+    def test_get_liquidation_params(self, processor: AaveV3ProtocolProcessor) -> None:
+        """Test the combined lookup matches the separate getters."""
+        for asset in (WETH, "0x2260FAC5E5542a773Aa44fBCfEDf7C193bc2C599", "0x1234"):
+            assert processor.get_liquidation_params(asset) == (
+                processor.get_liquidation_threshold(asset),
+                processor.get_liquidation_bonus(asset),
+            )
+
     def test_is_liquidation_transaction_empty_input(
         self, processor: AaveV3ProtocolProcessor
     ) -> None:
@@ -2,11 +2,18 @@ import pytest
 from unittest.mock import patch
 from typing import Any, Dict, List
 
+from eth_abi import encode
 from hexbytes import HexBytes
 
 from mev_tools_py.oev.protocols.euler_v1 import EulerProtocolProcessor
 
 
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+USDC = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+VIOLATOR = "0x532925a3b8D8D5C0532925a3B8D8d5C0532925A3"
+LIQUIDATOR = "0x742D35Cc6634C0532925a3B8d8D5C0532925A3b8"
+
+
 class TestEulerProtocolProcessor:
     """Test suite for Euler V1 protocol processor."""
 
@@ -38,6 +45,7 @@ class TestEulerProtocolProcessor:
             "transactionHash": "0x123456789abcdef123456789abcdef123456789abcdef123456789abcdef1234",
             "blockNumber": 18500000,
             "logIndex": 42,
+            "address": "0x27182842E098f60e3D576794A5bFFb0777E025d3",
         }
 
     @pytest.fixture
@@ -146,6 +154,95 @@ class TestEulerProtocolProcessor:
             ):
                 processor.decode_liquidation(sample_liquidation_log)
 
+    @pytest.fixture
+    def encoded_liquidation_log(self) -> Dict[str, Any]:
+        """ABI-encoded Liquidation log as returned by a node."""
+        return {
+            "topics": [
+                self.liquidation_topic,
+                HexBytes(encode(["address"], [LIQUIDATOR])),
+                HexBytes(encode(["address"], [VIOLATOR])),
+                HexBytes(encode(["address"], [USDC])),
+            ],
+            "data": HexBytes(
+                encode(
+                    ["address"] + ["uint256"] * 5,
+                    [WETH, 10**9, 10**17, 9 * 10**17, 2 * 10**16, 5 * 10**16],
+                )
+            ),
+            "address": "0x27182842E098f60e3D576794A5bFFb0777E025d3",
+            "transactionHash": HexBytes("0x" + "12" * 32),
+            "transactionIndex": 3,
+            "blockHash": HexBytes("0x" + "34" * 32),
+            "blockNumber": 16817996,
+            "logIndex": 7,
+        }
+
+    def test_decode_liquidation_fast_path(
+        self,
+        processor: EulerProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test well-formed logs are decoded without web3's process_log."""
+        with patch.object(
+            processor.liquidation_event, "process_log"
+        ) as mock_process_log:
+            result = processor.decode_liquidation(encoded_liquidation_log)
+
+        mock_process_log.assert_not_called()
+        assert result["liquidator"] == LIQUIDATOR
+        assert result["user"] == VIOLATOR
+        assert result["debt_repaid"] == {"token": USDC, "amount": "1000000000"}
+        assert result["collateral_seized"] == {
+            "token": WETH,
+            "amount": "100000000000000000",
+        }
+        assert result["health_score"] == str(9 * 10**17)
+        assert result["liquidation_bonus"] == pytest.approx(0.03)
+
+    def test_decode_liquidation_rejects_other_events(
+        self, processor: EulerProtocolProcessor
+    ) -> None:
+        """Test logs of other events are rejected without calling process_log."""
+        log = {"topics": [HexBytes("0x" + "22" * 32)], "data": "0x"}
+
+        with patch.object(
+            processor.liquidation_event, "process_log"
+        ) as mock_process_log:
+            with pytest.raises(ValueError, match="not a Liquidation event"):
+                processor.decode_liquidation(log)
+            with pytest.raises(ValueError, match="not a Liquidation event"):
+                processor.decode_liquidation({})
+
+        mock_process_log.assert_not_called()
+
+    def test_decode_liquidation_event(
+        self,
+        processor: EulerProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test decoding into a slotted LiquidationEvent."""
+        event = processor.decode_liquidation_event(encoded_liquidation_log)
+
+        assert event.user == VIOLATOR
+        assert event.debt_token == USDC
+        assert event.collateral_amount == 10**17
+        assert event.health_score == 9 * 10**17
+        assert event.discount == 5 * 10**16
+        assert event.receive_atoken is None
+
+    def test_decode_liquidation_fast_path_matches_process_log(
+        self,
+        processor: EulerProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test the fixed-layout decoder agrees with web3's ABI decoding."""
+        expected = processor.liquidation_event.process_log(encoded_liquidation_log)[
+            "args"
+        ]
+
+        assert processor._decode_liquidation_fast(encoded_liquidation_log) == expected
+
     def test_enrich_event_basic(self, processor: EulerProtocolProcessor) -> None:
         """Test basic event enrichment."""
         event = {
@@ -216,6 +313,39 @@ class TestEulerProtocolProcessor:
         assert is_liquidation is True
         assert log_idx == 0
 
+    def test_is_liquidation_transaction_bloom_rules_out_event(
+        self, processor: EulerProtocolProcessor, sample_logs: List[Dict[str, Any]]
+    ) -> None:
+        """Test a logs bloom without the Liquidation event returns early."""
+        transaction = {"to": processor.EULER_MAINNET_ADDRESS}
+
+        assert processor.is_liquidation_transaction(
+            transaction, sample_logs, logs_bloom=bytes(256)
+        ) == (False, -1)
+        assert processor.is_liquidation_transaction(
+            transaction, sample_logs, logs_bloom=b"\xff" * 256
+        ) == (True, 0)
+
+    def test_is_liquidation_transaction_ignores_other_emitters(
+        self,
+        processor: EulerProtocolProcessor,
+        sample_transaction: Dict[str, Any],
+        sample_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test Liquidation logs from non-Euler contracts are not matched."""
+        spoofed = dict(
+            sample_liquidation_log,
+            address="0x1111111111111111111111111111111111111111",
+        )
+
+        assert processor.is_liquidation_transaction(sample_transaction, [spoofed]) == (
+            False,
+            -1,
+        )
+        assert processor.is_liquidation_transaction(
+            sample_transaction, [spoofed, sample_liquidation_log]
+        ) == (True, 1)
+
     def test_is_liquidation_transaction_wrong_contract(
         self, processor: EulerProtocolProcessor, sample_logs: List[Dict[str, Any]]
     ) -> None:
@@ -309,6 +439,7 @@ class TestEulerProtocolProcessor:
         assert (
             processor.EXEC_PROXY_ADDRESS == "0x59828FdF7ee634AaaD3f58B19fDBa3b03E2a9d80"
         )
+        assert processor.LIQUIDATION_TOPIC0 == self.liquidation_topic.to_0x_hex()
 
     def test_liquidation_event_abi_structure(
         self, processor: EulerProtocolProcessor
@@ -360,7 +491,7 @@ class TestEulerProtocolProcessor:
         with patch.object(
             processor.liquidation_event, "process_log", return_value=mock_decoded_log
         ):
-            result = processor.decode_liquidation({})
+            result = processor.decode_liquidation({"topics": [self.liquidation_topic]})
 
             # liquidation_bonus = (1.1 - 1.0) / 1e18 = 0.1
             assert result["liquidation_bonus"] == 0.1
@@ -386,6 +517,6 @@ class TestEulerProtocolProcessor:
         with patch.object(
             processor.liquidation_event, "process_log", return_value=mock_decoded_log
         ):
-            result = processor.decode_liquidation({})
+            result = processor.decode_liquidation({"topics": [self.liquidation_topic]})
 
             assert result["liquidation_bonus"] == 0.0
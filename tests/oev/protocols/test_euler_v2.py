@@ -2,11 +2,18 @@ import pytest
 from unittest.mock import patch
 from typing import Any, Dict, List
 
+from eth_abi import encode
 from hexbytes import HexBytes
 
 from mev_tools_py.oev.protocols.euler_v2 import EulerV2ProtocolProcessor
 
 
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+VAULT = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+VIOLATOR = "0x532925a3b8D8D5C0532925a3B8D8d5C0532925A3"
+LIQUIDATOR = "0x742D35Cc6634C0532925a3B8d8D5C0532925A3b8"
+
+
 class TestEulerV2ProtocolProcessor:
     """Test suite for Euler V2 protocol processor."""
 
@@ -178,44 +185,177 @@ class TestEulerV2ProtocolProcessor:
         self,
         processor: EulerV2ProtocolProcessor,
         sample_batch_liquidation_log: Dict[str, Any],
-        mock_batch_liquidation_decoded_log: Dict[str, Any],
     ) -> None:
         """Test successful batch liquidation log decoding."""
-        # Mock single liquidation to fail, batch to succeed
+        # The sample batch log is well-formed, so web3's process_log is not used
         with patch.object(
-            processor.liquidation_event,
+            processor.batch_liquidation_event, "process_log"
+        ) as mock_batch_process_log:
+            result = processor.decode_liquidation(sample_batch_liquidation_log)
+
+        mock_batch_process_log.assert_not_called()
+
+        # Verify the returned structure for batch liquidation
+        assert result["protocol"] == "euler_v2"
+        assert result["liquidator"] == LIQUIDATOR
+        assert result["user"] == ""  # Not available in batch event
+        assert result["number_of_liquidations"] == "5"
+        assert result["event_type"] == "batch_liquidation"
+        assert (
+            result["transaction_hash"]
+            == sample_batch_liquidation_log["transactionHash"]
+        )
+        assert result["block_number"] == sample_batch_liquidation_log["blockNumber"]
+        assert result["log_index"] == sample_batch_liquidation_log["logIndex"]
+
+    def test_decode_batch_liquidation_process_log_fallback(
+        self,
+        processor: EulerV2ProtocolProcessor,
+        sample_batch_liquidation_log: Dict[str, Any],
+        mock_batch_liquidation_decoded_log: Dict[str, Any],
+    ) -> None:
+        """Test batch logs not matching the fixed layout go through process_log."""
+        log = dict(sample_batch_liquidation_log, data="0x05")
+
+        with patch.object(
+            processor.batch_liquidation_event,
             "process_log",
-            side_effect=Exception("Not single liquidation"),
-        ):
-            with patch.object(
-                processor.batch_liquidation_event,
-                "process_log",
-                return_value=mock_batch_liquidation_decoded_log,
-            ) as mock_batch_process_log:
-                result = processor.decode_liquidation(sample_batch_liquidation_log)
+            return_value=mock_batch_liquidation_decoded_log,
+        ) as mock_batch_process_log:
+            result = processor.decode_liquidation(log)
 
-                # Verify the batch method was called with the correct log
-                mock_batch_process_log.assert_called_once_with(
-                    sample_batch_liquidation_log
-                )
+        mock_batch_process_log.assert_called_once_with(log)
+        assert result["liquidator"] == "0x742d35cc6634c0532925a3b8d8d5c0532925a3b8"
+        assert result["number_of_liquidations"] == "5"
+        assert result["event_type"] == "batch_liquidation"
 
-                # Verify the returned structure for batch liquidation
-                assert result["protocol"] == "euler_v2"
-                assert (
-                    result["liquidator"] == "0x742d35cc6634c0532925a3b8d8d5c0532925a3b8"
-                )
-                assert result["user"] == ""  # Not available in batch event
-                assert result["number_of_liquidations"] == "5"
-                assert result["event_type"] == "batch_liquidation"
-                assert (
-                    result["transaction_hash"]
-                    == sample_batch_liquidation_log["transactionHash"]
-                )
-                assert (
-                    result["block_number"]
-                    == sample_batch_liquidation_log["blockNumber"]
+    @pytest.fixture
+    def encoded_liquidation_log(self) -> Dict[str, Any]:
+        """ABI-encoded Liquidation log as returned by a node."""
+        return {
+            "topics": [
+                self.liquidation_topic,
+                HexBytes(encode(["address"], [LIQUIDATOR])),
+                HexBytes(encode(["address"], [VIOLATOR])),
+                HexBytes(encode(["address"], [VAULT])),
+            ],
+            "data": HexBytes(
+                encode(
+                    ["address"] + ["uint256"] * 4,
+                    [WETH, 10**9, 2 * 10**17, 3 * 10**17, 5 * 10**16],
                 )
-                assert result["log_index"] == sample_batch_liquidation_log["logIndex"]
+            ),
+            "address": VAULT,
+            "transactionHash": HexBytes("0x" + "12" * 32),
+            "transactionIndex": 3,
+            "blockHash": HexBytes("0x" + "34" * 32),
+            "blockNumber": 18500000,
+            "logIndex": 7,
+        }
+
+    def test_decode_liquidation_fast_path(
+        self,
+        processor: EulerV2ProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test well-formed logs are decoded without web3's process_log."""
+        with patch.object(
+            processor.liquidation_event, "process_log"
+        ) as mock_process_log:
+            result = processor.decode_liquidation(encoded_liquidation_log)
+
+        mock_process_log.assert_not_called()
+        assert result["liquidator"] == LIQUIDATOR
+        assert result["user"] == VIOLATOR
+        assert result["debt_repaid"] == {"vault": VAULT, "amount": "1000000000"}
+        assert result["collateral_seized"] == {
+            "vault": WETH,
+            "amount": "300000000000000000",
+        }
+        assert result["yield_balance"] == "200000000000000000"
+        assert result["discount"] == "50000000000000000"
+        assert result["liquidation_bonus"] == 0.05
+        assert result["event_type"] == "single_liquidation"
+        assert result["debt_repaid_wei"] == 10**9
+        assert result["collateral_seized_wei"] == 3 * 10**17
+
+        enriched = processor.enrich_event(result)
+        assert enriched["liquidation_ratio"] == 3 * 10**17 / 10**9
+        assert enriched["is_profitable"] is True
+
+    def test_decode_fast_paths_match_process_log(
+        self,
+        processor: EulerV2ProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+        sample_batch_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test the fixed-layout decoders agree with web3's ABI decoding."""
+        batch_log = dict(
+            sample_batch_liquidation_log,
+            transactionIndex=3,
+            blockHash=HexBytes("0x" + "34" * 32),
+            address=VAULT,
+        )
+
+        assert (
+            processor._decode_liquidation_fast(encoded_liquidation_log)
+            == processor.liquidation_event.process_log(encoded_liquidation_log)["args"]
+        )
+        assert (
+            processor._decode_batch_liquidation_fast(batch_log)
+            == processor.batch_liquidation_event.process_log(batch_log)["args"]
+        )
+
+    def test_decode_liquidation_rejects_other_events(
+        self, processor: EulerV2ProtocolProcessor
+    ) -> None:
+        """Test logs of other events are rejected without calling process_log."""
+        log = {"topics": [HexBytes("0x" + "22" * 32)], "data": "0x"}
+
+        with patch.object(processor.liquidation_event, "process_log") as mock_single:
+            with patch.object(
+                processor.batch_liquidation_event, "process_log"
+            ) as mock_batch:
+                with pytest.raises(
+                    ValueError, match="not a Liquidation or BatchLiquidation event"
+                ):
+                    processor.decode_liquidation(log)
+
+        mock_single.assert_not_called()
+        mock_batch.assert_not_called()
+
+    def test_decode_many(
+        self,
+        processor: EulerV2ProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+        sample_batch_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test decoding a log range skips other events and keeps log order."""
+        other_log = {"topics": [HexBytes("0x" + "22" * 32)], "data": "0x"}
+        logs = [encoded_liquidation_log, other_log, sample_batch_liquidation_log]
+
+        events = processor.decode_many(logs)
+
+        assert events == [
+            processor.decode_liquidation(encoded_liquidation_log),
+            processor.decode_liquidation(sample_batch_liquidation_log),
+        ]
+        assert processor.decode_many([]) == []
+
+    def test_decode_many_invalid_log(
+        self,
+        processor: EulerV2ProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test a liquidation log that cannot be decoded raises ValueError."""
+        log = dict(
+            encoded_liquidation_log, topics=encoded_liquidation_log["topics"][:2]
+        )
+
+        with pytest.raises(
+            ValueError, match="Failed to decode Euler V2 liquidation log"
+        ):
+            processor.decode_many([encoded_liquidation_log, log])
 
     def test_decode_liquidation_failure(
         self,
@@ -340,6 +480,31 @@ class TestEulerV2ProtocolProcessor:
         assert is_liquidation is True
         assert log_idx == 0
 
+    def test_is_liquidation_transaction_known_emitters(
+        self,
+        sample_transaction: Dict[str, Any],
+        sample_single_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test known_emitters restricts detection to logs from those vaults."""
+        processor = EulerV2ProtocolProcessor(known_emitters=[VAULT])
+        spoofed = dict(
+            sample_single_liquidation_log,
+            address="0x1111111111111111111111111111111111111111",
+        )
+        from_vault = dict(sample_single_liquidation_log, address=VAULT.lower())
+
+        assert processor.is_liquidation_transaction(sample_transaction, [spoofed]) == (
+            False,
+            -1,
+        )
+        assert processor.is_liquidation_transaction(
+            sample_transaction, [spoofed, from_vault]
+        ) == (True, 1)
+        # Without known_emitters any emitter is accepted
+        assert EulerV2ProtocolProcessor().is_liquidation_transaction(
+            sample_transaction, [spoofed]
+        ) == (True, 0)
+
     def test_is_liquidation_transaction_no_match(
         self, processor: EulerV2ProtocolProcessor
     ) -> None:
@@ -363,6 +528,11 @@ class TestEulerV2ProtocolProcessor:
             processor.EULER_V2_FACTORY == "0x835482FE0532f169024d5E9410199369aAD5C77E"
         )
         assert processor.EULER_V2_ROUTER == "0x0000000000000000000000000000000000000000"
+        assert processor.LIQUIDATION_TOPIC0 == self.liquidation_topic.to_0x_hex()
+        assert (
+            processor.BATCH_LIQUIDATION_TOPIC0
+            == self.batch_liquidation_topic.to_0x_hex()
+        )
 
     def test_liquidation_event_abi_structure(
         self, processor: EulerV2ProtocolProcessor
@@ -431,7 +601,7 @@ class TestEulerV2ProtocolProcessor:
         with patch.object(
             processor.liquidation_event, "process_log", return_value=mock_decoded_log
         ):
-            result = processor.decode_liquidation({})
+            result = processor.decode_liquidation({"topics": [self.liquidation_topic]})
 
             # liquidation_bonus = 2.0 / 1e18 = 0.000000000000000002 ≈ 0.0
             # Actually: 2000000000000000000 / 1e18 = 2.0
@@ -457,7 +627,7 @@ class TestEulerV2ProtocolProcessor:
         with patch.object(
             processor.liquidation_event, "process_log", return_value=mock_decoded_log
         ):
-            result = processor.decode_liquidation({})
+            result = processor.decode_liquidation({"topics": [self.liquidation_topic]})
 
             assert result["liquidation_bonus"] == 0.0
 
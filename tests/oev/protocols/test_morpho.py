@@ -2,11 +2,21 @@ import pytest
 from unittest.mock import patch
 from typing import Any, Dict, List
 
+from eth_abi import encode
 from hexbytes import HexBytes
 
+from mev_tools_py.oev.models import LiquidationEvent
+from mev_tools_py.oev.protocols._shared import W3
 from mev_tools_py.oev.protocols.morpho import MorphoProtocolProcessor
 
 
+MARKET_ID = bytes.fromhex(
+    "b323495f7e4148be5643a4ea4a8221eef163e4bccfdedc2a6f4696baacbc86cc"
+)
+BORROWER = "0x532925a3b8D8D5C0532925a3B8D8d5C0532925A3"
+LIQUIDATOR = "0x742D35Cc6634C0532925a3B8d8D5C0532925A3b8"
+
+
 class TestMorphoProtocolProcessor:
     """Test suite for Morpho protocol processor."""
 
@@ -101,12 +111,33 @@ class TestMorphoProtocolProcessor:
         assert processor.liquidate_event is not None
         assert processor.accrue_interest_event is not None
 
+    def test_default_processors_share_market_contract(self) -> None:
+        """Test processors without a provider share W3 and one market contract."""
+        MorphoProtocolProcessor._shared_market_contract.cache_clear()
+        try:
+            with patch.object(W3, "is_connected", return_value=True) as mock_connected:
+                first = MorphoProtocolProcessor()
+                second = MorphoProtocolProcessor()
+
+                # The provider is only probed once a contract is needed
+                mock_connected.assert_not_called()
+                first_contract = first.morpho_contract
+                second_contract = second.morpho_contract
+        finally:
+            MorphoProtocolProcessor._shared_market_contract.cache_clear()
+
+        assert first.w3 is W3
+        assert first_contract is not None
+        assert first_contract is second_contract
+        mock_connected.assert_called_once()
+
     def test_contract_addresses(self, processor: MorphoProtocolProcessor) -> None:
         """Test that contract addresses are set correctly."""
         assert (
             processor.MORPHO_BLUE_ADDRESS
             == "0xBBBBBbbBBb9cC5e90e3b3Af64bdAF62C37EEFFCb"
         )
+        assert processor.LIQUIDATE_TOPIC0 == self.liquidation_topic.to_0x_hex()
 
     def test_decode_liquidation_success(
         self,
@@ -155,6 +186,127 @@ class TestMorphoProtocolProcessor:
         # = (100000000000000000 / 1000000000000000000000 - 1.0) = (0.0001 - 1.0) = -0.9999
         assert result["liquidation_bonus"] == -0.9999
 
+    @pytest.fixture
+    def encoded_liquidation_log(self) -> Dict[str, Any]:
+        """ABI-encoded Liquidate log as returned by a node."""
+        return {
+            "topics": [
+                self.liquidation_topic,
+                HexBytes(MARKET_ID),
+                HexBytes(encode(["address"], [LIQUIDATOR])),
+                HexBytes(encode(["address"], [BORROWER])),
+            ],
+            "data": HexBytes(
+                encode(
+                    ["uint256"] * 5,
+                    [10**9, 9 * 10**8, 11 * 10**17, 2 * 10**6, 10**6],
+                )
+            ),
+            "address": "0xBBBBBbbBBb9cC5e90e3b3Af64bdAF62C37EEFFCb",
+            "transactionHash": HexBytes("0x" + "12" * 32),
+            "transactionIndex": 3,
+            "blockHash": HexBytes("0x" + "34" * 32),
+            "blockNumber": 18500000,
+            "logIndex": 7,
+        }
+
+    def test_decode_liquidation_fast_path(
+        self,
+        processor: MorphoProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test well-formed logs are decoded without web3's process_log."""
+        with patch.object(processor.liquidate_event, "process_log") as mock_process_log:
+            result = processor.decode_liquidation(encoded_liquidation_log)
+
+        mock_process_log.assert_not_called()
+        assert result["liquidator"] == LIQUIDATOR
+        assert result["user"] == BORROWER
+        assert result["market_id"] == MARKET_ID.hex()
+        assert result["debt_repaid"]["assets"] == "1000000000"
+        assert result["debt_repaid"]["shares"] == "900000000"
+        assert result["collateral_seized"]["assets"] == "1100000000000000000"
+        assert result["bad_debt_assets"] == "2000000"
+        assert result["bad_debt_shares"] == "1000000"
+        assert result["has_bad_debt"] is True
+        assert result["debt_repaid_wei"] == 10**9
+        assert result["collateral_seized_wei"] == 11 * 10**17
+        assert result["bad_debt_assets_wei"] == 2 * 10**6
+
+    def test_decode_liquidation_event(
+        self,
+        processor: MorphoProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test decoding into the shared LiquidationEvent model."""
+        event = processor.decode_liquidation_event(encoded_liquidation_log)
+
+        assert isinstance(event, LiquidationEvent)
+        assert event.liquidator == LIQUIDATOR
+        assert event.user == BORROWER
+        assert event.market_id == MARKET_ID.hex()
+        assert event.debt_amount == 10**9
+        assert event.debt_shares == 9 * 10**8
+        assert event.collateral_amount == 11 * 10**17
+        assert event.bad_debt_amount == 2 * 10**6
+        assert event.bad_debt_shares == 10**6
+        assert event.to_dict()["has_bad_debt"] is True
+        assert processor._event_dict(event) == processor.decode_liquidation(
+            encoded_liquidation_log
+        )
+
+    def test_enrich_event_uses_raw_amounts(
+        self,
+        processor: MorphoProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test enrichment of decoded events matches parsing the amount strings."""
+        event = processor.decode_liquidation(encoded_liquidation_log)
+        string_only = {
+            key: value for key, value in event.items() if not key.endswith("_wei")
+        }
+
+        enriched = processor.enrich_event(event)
+
+        assert enriched == {
+            **processor.enrich_event(string_only),
+            **{key: event[key] for key in event.keys() - string_only.keys()},
+        }
+        assert enriched["liquidation_ratio"] == 11 * 10**17 / 10**9
+        assert enriched["bad_debt_ratio"] == 2 * 10**6 / 10**9
+
+    def test_decode_liquidation_fast_path_matches_process_log(
+        self,
+        processor: MorphoProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test the fixed-layout decoder agrees with web3's ABI decoding."""
+        expected = processor.liquidate_event.process_log(encoded_liquidation_log)[
+            "args"
+        ]
+
+        assert processor._decode_liquidation_fast(encoded_liquidation_log) == expected
+
+    def test_decode_many(
+        self,
+        processor: MorphoProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test decoding a log range skips other events and keeps log order."""
+        other_log = {"topics": [HexBytes("0x" + "22" * 32)], "data": "0x"}
+        second_log = dict(encoded_liquidation_log, logIndex=8)
+
+        events = processor.decode_many([encoded_liquidation_log, other_log, second_log])
+
+        assert events == [
+            processor.decode_liquidation(encoded_liquidation_log),
+            processor.decode_liquidation(second_log),
+        ]
+
+        invalid_log = dict(encoded_liquidation_log, data="0x00")
+        with pytest.raises(ValueError, match="Failed to decode Morpho liquidation log"):
+            processor.decode_many([invalid_log])
+
     def test_decode_liquidation_with_bad_debt(
         self,
         processor: MorphoProtocolProcessor,
@@ -311,6 +463,49 @@ class TestMorphoProtocolProcessor:
         assert "is_profitable" not in result
         assert "liquidation_incentive" not in result
 
+    def test_enrich_many_matches_enrich_event(
+        self,
+        processor: MorphoProtocolProcessor,
+        encoded_liquidation_log: Dict[str, Any],
+    ) -> None:
+        """Test batch enrichment gives the same results as enrich_event."""
+        events = [
+            processor.decode_liquidation(encoded_liquidation_log),
+            {
+                "debt_repaid": {"assets": "5000000000000000000000"},
+                "collateral_seized": {"assets": "5200000000000000000000"},
+                "bad_debt_assets": "0",
+            },
+            {"debt_repaid": {"assets": "0"}},
+        ]
+
+        assert processor.enrich_many(events) == [
+            processor.enrich_event(event) for event in events
+        ]
+        assert processor.enrich_many([]) == []
+
+    def test_enrich_event_leaves_inputs_unchanged(
+        self, processor: MorphoProtocolProcessor
+    ) -> None:
+        """Test enrichment copies the event and never mutates the shared fields."""
+        event = {
+            "protocol": "morpho",
+            "debt_repaid": {"assets": "1000000000000000000000"},
+            "collateral_seized": {"assets": "1100000000000000000000"},
+            "bad_debt_assets": "0",
+            "has_bad_debt": False,
+        }
+        original = dict(event)
+        static = dict(processor.STATIC_ENRICHMENTS)
+
+        result = processor.enrich_event(event)
+        processor.enrich_event({**event, "has_bad_debt": True})
+
+        assert event == original
+        assert processor.STATIC_ENRICHMENTS == static
+        assert result["liquidation_completeness"] == "full"
+        assert result.items() >= static.items()
+
     def test_is_liquidation_transaction_morpho_contract(
         self,
         processor: MorphoProtocolProcessor,
@@ -376,6 +571,34 @@ class TestMorphoProtocolProcessor:
         assert is_liquidation is False
         assert log_idx == -1
 
+    def test_is_liquidation_transaction_raw_bytes_topic(
+        self, processor: MorphoProtocolProcessor
+    ) -> None:
+        """Test plain bytes topics match as well as HexBytes ones."""
+        transaction = {"to": processor.MORPHO_BLUE_ADDRESS, "input": "0x12345678"}
+        logs = [
+            {
+                "topics": [bytes(self.liquidation_topic)],
+                "address": processor.MORPHO_BLUE_ADDRESS,
+            }
+        ]
+
+        assert processor.is_liquidation_transaction(transaction, logs) == (True, 0)
+
+    def test_is_liquidation_transaction_hex_string_topic(
+        self, processor: MorphoProtocolProcessor
+    ) -> None:
+        """Test hex string topics from raw JSON-RPC logs are matched."""
+        transaction = {"to": processor.MORPHO_BLUE_ADDRESS, "input": "0x12345678"}
+        logs = [
+            {
+                "topics": [processor.LIQUIDATE_TOPIC0],
+                "address": processor.MORPHO_BLUE_ADDRESS,
+            }
+        ]
+
+        assert processor.is_liquidation_transaction(transaction, logs) == (True, 0)
+
     def test_is_liquidation_transaction_event_detection(
         self, processor: MorphoProtocolProcessor
     ) -> None:
@@ -622,13 +845,23 @@ class TestMorphoProtocolProcessor:
             assert threshold == 0.86
             mock_get_market_info.assert_called_once_with(market_id)
 
+        # Fetched thresholds are cached, market parameters being immutable
+        with patch.object(processor, "get_market_info") as mock_get_market_info:
+            assert processor.get_liquidation_threshold(market_id) == 0.86
+            mock_get_market_info.assert_not_called()
+
         # Test fallback when get_market_info fails
+        other_market_id = "0x" + "7c" * 32
         with patch.object(
             processor, "get_market_info", side_effect=Exception("Connection failed")
-        ):
-            threshold = processor.get_liquidation_threshold(market_id)
+        ) as mock_get_market_info:
+            threshold = processor.get_liquidation_threshold(other_market_id)
             assert threshold == 0.80  # Default fallback
 
+            # The fallback is not cached, so the next call retries
+            processor.get_liquidation_threshold(other_market_id)
+            assert mock_get_market_info.call_count == 2
+
     def test_get_market_info_invalid_market_id(
         self, processor: MorphoProtocolProcessor
     ) -> None:
@@ -0,0 +1,200 @@
+import inspect
+from typing import Any, Dict
+
+from eth_abi import encode
+from hexbytes import HexBytes
+
+import pytest
+
+from mev_tools_py.oev.protocols import (
+    AaveV3ProtocolProcessor,
+    EulerProtocolProcessor,
+    EulerV2ProtocolProcessor,
+    MorphoProtocolProcessor,
+)
+from mev_tools_py.oev.protocols.base import BaseProtocolProcessor
+from mev_tools_py.oev.protocols.router import (
+    LOG_ROUTER,
+    decode_liquidations,
+    SELECTOR_ROUTER,
+    route_log,
+    route_method_call,
+    register_protocol,
+    route_transaction,
+)
+
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+USDC = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+USER = "0x532925a3b8D8D5C0532925a3B8D8d5C0532925A3"
+
+
+def make_aave_log(
+    address: str = AaveV3ProtocolProcessor.POOL_ADDRESS,
+) -> Dict[str, Any]:
+    return {
+        "topics": [
+            HexBytes(AaveV3ProtocolProcessor.LIQUIDATION_CALL_TOPIC0),
+            HexBytes(encode(["address"], [WETH])),
+            HexBytes(encode(["address"], [USDC])),
+            HexBytes(encode(["address"], [USER])),
+        ],
+        "data": HexBytes(
+            encode(
+                ["uint256", "uint256", "address", "bool"], [10**9, 10**17, USER, False]
+            )
+        ),
+        "address": address,
+        "transactionHash": HexBytes("0x" + "12" * 32),
+        "blockNumber": 18500000,
+        "logIndex": 1,
+    }
+
+
+def make_morpho_log() -> Dict[str, Any]:
+    return {
+        "topics": [
+            HexBytes(MorphoProtocolProcessor.LIQUIDATE_TOPIC0_BYTES),
+            HexBytes("0x" + "ab" * 32),
+            HexBytes(encode(["address"], [WETH])),
+            HexBytes(encode(["address"], [USER])),
+        ],
+        "data": HexBytes(
+            encode(["uint256"] * 5, [10**9, 9 * 10**8, 11 * 10**17, 0, 0])
+        ),
+        "address": MorphoProtocolProcessor.MORPHO_BLUE_ADDRESS,
+        "transactionHash": HexBytes("0x" + "12" * 32),
+        "blockNumber": 18500000,
+        "logIndex": 2,
+    }
+
+
+def test_processors_are_registered():
+    aave = LOG_ROUTER[AaveV3ProtocolProcessor.LIQUIDATION_CALL_TOPIC0_BYTES]
+    euler = LOG_ROUTER[EulerProtocolProcessor.LIQUIDATION_TOPIC0_BYTES]
+
+    assert isinstance(aave[0], AaveV3ProtocolProcessor)
+    assert aave[1] == "LiquidationCall"
+    assert isinstance(euler[0], EulerProtocolProcessor)
+    assert euler[1] == "Liquidation"
+    morpho = LOG_ROUTER[MorphoProtocolProcessor.LIQUIDATE_TOPIC0_BYTES]
+    assert isinstance(morpho[0], MorphoProtocolProcessor)
+    assert morpho[1] == "Liquidate"
+
+
+def test_register_protocol_rejects_claimed_keys():
+    class SparkProtocolProcessor(AaveV3ProtocolProcessor):
+        protocol = "spark"
+        CONTRACT_ADDRESSES = frozenset({"0x" + "11" * 20})
+        METHOD_SELECTORS: Dict[str, str] = {}
+
+    # Same LiquidationCall topic as Aave V3
+    with pytest.raises(ValueError, match="already routed to AaveV3"):
+        register_protocol(SparkProtocolProcessor)
+    assert isinstance(
+        LOG_ROUTER[AaveV3ProtocolProcessor.LIQUIDATION_CALL_TOPIC0_BYTES][0],
+        AaveV3ProtocolProcessor,
+    )
+    assert route_transaction({"to": "0x" + "11" * 20}) is None
+
+
+def test_route_log_requires_protocol_contract():
+    assert route_log(make_aave_log()) is not None
+    # Same event signature emitted by a fork's pool
+    assert route_log(make_aave_log("0x" + "11" * 20)) is None
+    assert route_log({"topics": [HexBytes("0x" + "22" * 32)]}) is None
+    assert route_log({"topics": []}) is None
+
+
+def test_route_transaction():
+    processor = route_transaction(
+        {"to": EulerProtocolProcessor.EXEC_PROXY_ADDRESS.upper()}
+    )
+
+    assert isinstance(processor, EulerProtocolProcessor)
+    assert route_transaction({"to": None}) is None
+    assert route_transaction({"to": "0x" + "11" * 20}) is None
+
+
+def test_route_method_call():
+    pool = AaveV3ProtocolProcessor.POOL_ADDRESS
+    call = {"to": pool, "input": "0x00a718a9" + "00" * 32}
+
+    processor, method_name = route_method_call(call)
+
+    assert isinstance(processor, AaveV3ProtocolProcessor)
+    assert method_name == "liquidationCall"
+    assert SELECTOR_ROUTER["0x00a718a9"][0] is processor
+    assert route_method_call({**call, "input": bytes.fromhex(call["input"][2:])}) == (
+        processor,
+        "liquidationCall",
+    )
+    # Known selector sent to another contract, and an unknown selector
+    assert route_method_call({**call, "to": "0x" + "11" * 20}) is None
+    assert route_method_call({**call, "input": "0x12345678"}) is None
+    assert route_method_call({"to": pool}) is None
+
+
+def test_route_morpho_liquidate_call():
+    call = {
+        "to": MorphoProtocolProcessor.MORPHO_BLUE_ADDRESS,
+        "input": "0x0748ca67" + "00" * 32,
+    }
+
+    processor, method_name = route_method_call(call)
+
+    assert isinstance(processor, MorphoProtocolProcessor)
+    assert method_name == "liquidate"
+    assert route_transaction(call) is processor
+
+
+def test_decode_liquidations_single_pass():
+    unrelated = {"topics": [HexBytes("0x" + "22" * 32)], "address": USER}
+
+    events = decode_liquidations(
+        [unrelated, make_aave_log(), unrelated, make_morpho_log()]
+    )
+
+    assert len(events) == 2
+    assert events[0]["protocol"] == "aave_v3"
+    assert events[0]["debt_asset"] == USDC
+    assert events[0]["receive_atoken"] is False
+    assert events[1]["protocol"] == "morpho"
+    assert events[1]["liquidator"] == WETH
+    assert events[1]["user"] == USER
+
+
+@pytest.mark.parametrize(
+    "cls",
+    [
+        AaveV3ProtocolProcessor,
+        EulerProtocolProcessor,
+        EulerV2ProtocolProcessor,
+        MorphoProtocolProcessor,
+    ],
+)
+def test_processors_share_detection_signature(cls: Any) -> None:
+    base = inspect.signature(BaseProtocolProcessor.is_liquidation_transaction)
+    signature = inspect.signature(cls.is_liquidation_transaction)
+
+    assert list(signature.parameters) == list(base.parameters)
+    assert signature.return_annotation == base.return_annotation
+
+
+def test_decode_liquidation_or_none() -> None:
+    processor = AaveV3ProtocolProcessor()
+    log = make_aave_log()
+
+    assert processor.decode_liquidation_or_none(log) == processor.decode_liquidation(
+        log
+    )
+    assert processor.decode_liquidation_or_none({"topics": [b"\x22" * 32]}) is None
+    assert processor.decode_liquidation_or_none({"topics": []}) is None
+    with pytest.raises(ValueError, match="Failed to decode Aave V3 liquidation log"):
+        processor.decode_liquidation_or_none(dict(log, topics=log["topics"][:2]))
+
+
+def test_profitability() -> None:
+    assert BaseProtocolProcessor.profitability(100, 105) == (1.05, True)
+    assert BaseProtocolProcessor.profitability(100, 95) == (0.95, False)
+    assert BaseProtocolProcessor.profitability(0, 105) is None
+    assert BaseProtocolProcessor.profitability(100, 0) is None
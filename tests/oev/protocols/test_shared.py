@@ -0,0 +1,113 @@
+import pytest
+from eth_abi import encode
+from eth_hash.auto import keccak
+
+from mev_tools_py.oev.protocols._shared import (
+    LazyEventDecoder,
+    bloom_bits,
+    bloom_may_contain,
+    checksum,
+    has_topic0,
+    indexed_words,
+    log_topic0,
+    split_words,
+    to_bytes,
+    word_to_address,
+    word_to_bool,
+)
+
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+
+
+def test_checksum_is_cached():
+    checksum.cache_clear()
+    raw = bytes.fromhex(WETH[2:])
+
+    assert checksum(raw) == WETH
+    assert checksum(raw) == WETH
+    assert checksum.cache_info().hits == 1
+
+
+def test_word_to_address():
+    assert word_to_address(encode(["address"], [WETH])) == WETH
+
+    with pytest.raises(ValueError):
+        word_to_address(b"\x01" + encode(["address"], [WETH])[1:])
+
+
+def test_word_to_bool_rejects_out_of_range():
+    assert word_to_bool(encode(["bool"], [True])) is True
+
+    with pytest.raises(ValueError):
+        word_to_bool(encode(["uint256"], [2]))
+
+
+def test_split_words_requires_exact_length():
+    assert split_words(bytes(64), 2) == [bytes(32), bytes(32)]
+
+    with pytest.raises(ValueError):
+        split_words(bytes(65), 2)
+
+
+def test_indexed_words_checks_topic0():
+    topic0 = b"\x11" * 32
+    topics = ["0x" + "11" * 32, encode(["address"], [WETH])]
+
+    assert indexed_words(topics, topic0, 1) == [to_bytes(topics[1])]
+
+    with pytest.raises(ValueError):
+        indexed_words(topics, b"\x22" * 32, 1)
+    with pytest.raises(ValueError):
+        indexed_words(topics, topic0, 2)
+
+
+def test_log_topic0_normalizes_hex_strings():
+    topic0 = b"\x11" * 32
+
+    assert log_topic0({"topics": [topic0]}) is topic0
+    assert log_topic0({"topics": ["0x" + "11" * 32]}) == topic0
+    assert log_topic0({"topics": ["0xzz"]}) is None
+    assert log_topic0({"topics": []}) is None
+    assert log_topic0({}) is None
+    assert has_topic0({"topics": ["0x" + "11" * 32]}, topic0)
+
+
+def make_bloom(*values: bytes) -> bytes:
+    """Build a logs bloom the way clients do, as an int with one bit per hash pair."""
+    bloom = 0
+    for value in values:
+        digest = keccak(value)
+        for i in (0, 2, 4):
+            bloom |= 1 << (int.from_bytes(digest[i : i + 2], "big") & 2047)
+    return bloom.to_bytes(256, "big")
+
+
+def test_bloom_may_contain():
+    present = bloom_bits(b"\x11" * 32)
+    absent = bloom_bits(b"\x22" * 32)
+    bloom = make_bloom(b"\x11" * 32, bytes.fromhex(WETH[2:]))
+
+    assert bloom_may_contain(bloom, present) is True
+    assert bloom_may_contain("0x" + bloom.hex(), present) is True
+    assert bloom_may_contain(bloom, absent) is False
+    # Without a usable bloom nothing can be ruled out
+    assert bloom_may_contain(None, absent) is True
+    assert bloom_may_contain(b"\x00" * 10, absent) is True
+
+
+def test_lazy_event_decoder_is_built_once_on_access():
+    abi = {
+        "anonymous": False,
+        "inputs": [{"indexed": False, "name": "value", "type": "uint256"}],
+        "name": "Ping",
+        "type": "event",
+    }
+
+    class Holder:
+        ping_event = LazyEventDecoder(abi)
+
+    assert Holder.__dict__["ping_event"]._decoder is None
+    decoder = Holder().ping_event
+    assert decoder.event_name == "Ping"
+    assert Holder().ping_event is decoder
+    assert Holder.ping_event is decoder
@@ -0,0 +1,139 @@
+from datetime import datetime
+from decimal import Decimal
+
+from mev_tools_py.sandwich.analyzer import SandwichAnalyzer
+from mev_tools_py.sandwich.models import SandwichAttack, SandwichType
+
+
+def create_attack(
+    attacker: str,
+    pool: str,
+    block_number: int,
+    profit: str,
+    victim_loss: str = "0.1",
+    gas_cost: str = "0.01",
+) -> SandwichAttack:
+    return SandwichAttack(
+        attack_id=f"{attacker}-{block_number}",
+        sandwich_type=SandwichType.ATOMIC,
+        block_number=block_number,
+        block_timestamp=datetime(2024, 1, 1),
+        pool_address=pool,
+        token_pair=("0xtoken1", "0xtoken2"),
+        frontrun_txs=[],
+        victim_txs=[],
+        backrun_txs=[],
+        attacker_address=attacker,
+        profit_amount=Decimal(profit),
+        profit_token="0xtoken2",
+        victim_loss_amount=Decimal(victim_loss),
+        gas_cost=Decimal(gas_cost),
+        net_profit=Decimal(profit) - Decimal(gas_cost),
+        detection_confidence=Decimal("0.9"),
+        price_manipulation_pct=Decimal("5"),
+        total_volume_manipulated=Decimal("100"),
+    )
+
+
+def create_attacks() -> list[SandwichAttack]:
+    return [
+        create_attack("0xa", "0xpool1", 105, "1.0"),
+        create_attack("0xb", "0xpool2", 101, "3.0"),
+        create_attack("0xa", "0xpool1", 110, "2.5"),
+        create_attack("0xc", "0xpool1", 103, "3.0"),
+    ]
+
+
+def test_analyze_attacks():
+    attacks = create_attacks()
+
+    stats = SandwichAnalyzer().analyze_attacks(attacks)
+
+    assert stats.from_block == 101
+    assert stats.to_block == 110
+    assert stats.total_attacks == 4
+    assert stats.total_profit == Decimal("9.5")
+    assert stats.total_victim_loss == Decimal("0.4")
+    assert stats.average_profit_per_attack == Decimal("2.375")
+    # Ties keep the first attack, as max() does
+    assert stats.most_profitable_attack is attacks[1]
+    assert stats.top_attackers == [
+        ("0xa", Decimal("3.5")),
+        ("0xb", Decimal("3.0")),
+        ("0xc", Decimal("3.0")),
+    ]
+    assert stats.most_targeted_pools == [("0xpool1", 3), ("0xpool2", 1)]
+
+
+def test_analyze_attacks_empty():
+    stats = SandwichAnalyzer().analyze_attacks([])
+
+    assert stats.total_attacks == 0
+    assert stats.most_profitable_attack is None
+
+
+def test_analyze_attack_patterns_profit_and_gas():
+    attacks = create_attacks() + [
+        create_attack("0xd", "0xpool2", 110, "0.5", gas_cost="0")
+    ]
+
+    patterns = SandwichAnalyzer().analyze_attack_patterns(attacks)
+
+    assert patterns["profit_analysis"] == {
+        "min_profit": 0.5,
+        "max_profit": 3.0,
+        "avg_profit": 2.0,
+        "median_profit": 2.5,
+    }
+    assert patterns["gas_analysis"]["total_gas_spent"] == 0.04
+    assert patterns["temporal_patterns"]["max_attacks_per_block"] == 2
+    assert SandwichAnalyzer().analyze_attack_patterns([]) == {}
+
+
+def test_identify_sophisticated_attackers():
+    attacks = create_attacks() + [
+        create_attack("0xA", "0xpool2", 111, "0.5", gas_cost="0"),
+    ]
+
+    sophisticated = SandwichAnalyzer().identify_sophisticated_attackers(
+        attacks, min_attacks=2, min_total_profit=Decimal("1.0")
+    )
+
+    assert sophisticated == [
+        {
+            "address": "0xa",
+            "attack_count": 3,
+            "total_profit": Decimal("4.0"),
+            "average_profit": Decimal("4.0") / 3,
+            "pools_targeted": 2,
+            "total_victims": 0,
+            "attack_types": {SandwichType.ATOMIC: 3},
+            "average_efficiency": (Decimal("100") + Decimal("250")) / 3,
+            "total_gas_spent": Decimal("0.02"),
+        }
+    ]
+
+
+def test_detect_attack_clusters():
+    attacks = create_attacks() + [
+        create_attack("0xd", "0xpool3", 300, "1.0"),
+        create_attack("0xd", "0xpool3", 500, "1.0"),
+        create_attack("0xe", "0xpool3", 540, "2.0"),
+    ]
+
+    clusters = SandwichAnalyzer().detect_attack_clusters(attacks, block_window=50)
+
+    assert len(clusters) == 2
+    first, second = clusters
+    assert first["attack_count"] == 4
+    assert first["block_range"] == (101, 110)
+    assert first["block_span"] == 10
+    assert first["attack_density"] == 0.4
+    assert first["total_profit"] == Decimal("9.5")
+    assert sorted(first["attackers"]) == ["0xa", "0xb", "0xc"]
+    assert sorted(first["pools"]) == ["0xpool1", "0xpool2"]
+    assert second["block_range"] == (500, 540)
+    assert second["unique_attackers"] == 2
+    assert second["unique_pools"] == 1
+    assert second["total_profit"] == Decimal("3.0")
+    assert SandwichAnalyzer().detect_attack_clusters([]) == []
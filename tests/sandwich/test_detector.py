@@ -0,0 +1,134 @@
+from dataclasses import replace
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from mev_tools_py.dex.batch import SwapBatch
+from mev_tools_py.dex.models import SwapEvent, TokenInfo
+from mev_tools_py.sandwich.detector import SandwichDetector
+from mev_tools_py.sandwich.models import SandwichType
+
+WETH = TokenInfo(address="0xWETH", symbol="WETH", decimals=18)
+USDC = TokenInfo(address="0xUSDC", symbol="USDC", decimals=6)
+
+
+def create_swap(
+    tx_hash: str,
+    trader: str,
+    token_in: TokenInfo,
+    token_out: TokenInfo,
+    amount_in: str,
+    amount_out: str,
+    log_index: int,
+    pool_address: str = "0xPOOL",
+) -> SwapEvent:
+    return SwapEvent(
+        tx_hash=tx_hash,
+        block_number=18000000,
+        log_index=log_index,
+        dex_protocol="uniswap_v2",
+        pool_address=pool_address,
+        trader=trader,
+        token_in=token_in,
+        token_out=token_out,
+        amount_in=Decimal(amount_in),
+        amount_out=Decimal(amount_out),
+        price_impact=Decimal("2.5"),
+        gas_used=150000,
+    )
+
+
+def create_sandwich() -> list[SwapEvent]:
+    # Deliberately out of log order to exercise sorting
+    return [
+        create_swap("0xback", "0xattacker", USDC, WETH, "2200", "1.2", 2),
+        create_swap("0xfront", "0xattacker", WETH, USDC, "1", "2000", 0),
+        create_swap("0xvictim", "0xvictim", WETH, USDC, "0.5", "900", 1),
+        create_swap("0xother", "0xother", WETH, USDC, "1", "1", 3, "0xOTHER"),
+    ]
+
+
+def test_detect_sandwich_attack_in_block():
+    attacks = SandwichDetector().detect_sandwich_attacks_in_block(
+        18000000, create_sandwich()
+    )
+
+    assert len(attacks) == 1
+    attack = attacks[0]
+    assert attack.sandwich_type == SandwichType.ATOMIC
+    assert attack.pool_address == "0xpool"
+    assert attack.attacker_address == "0xattacker"
+    assert attack.frontrun_txs[0].swap_event.tx_hash == "0xfront"
+    assert [tx.swap_event.tx_hash for tx in attack.victim_txs] == ["0xvictim"]
+    assert attack.backrun_txs[0].swap_event.tx_hash == "0xback"
+
+
+def test_detect_sandwich_attacks_in_block_accepts_batch():
+    swaps = create_sandwich()
+    detector = SandwichDetector()
+
+    from_list = detector.detect_sandwich_attacks_in_block(18000000, swaps)
+    from_batch = detector.detect_sandwich_attacks_in_block(
+        18000000, SwapBatch.from_events(swaps)
+    )
+
+    assert [a.profit_amount for a in from_batch] == [a.profit_amount for a in from_list]
+    assert [a.victim_txs for a in from_batch] == [a.victim_txs for a in from_list]
+
+
+def test_detect_sandwich_attacks_requires_victim():
+    swaps = [s for s in create_sandwich() if s.tx_hash != "0xvictim"]
+
+    assert SandwichDetector().detect_sandwich_attacks_in_block(18000000, swaps) == []
+
+
+def test_detect_sandwich_attacks_in_blocks():
+    reader = MagicMock()
+    reader.get_swaps_from_block.side_effect = lambda block: (
+        create_sandwich() if block == 18000000 else []
+    )
+
+    results = SandwichDetector().detect_sandwich_attacks_in_blocks(
+        reader, [17999999, 18000000, 18000001], max_workers=2
+    )
+
+    assert [len(attacks) for attacks in results] == [0, 1, 0]
+    assert reader.get_swaps_from_block.call_count == 3
+
+
+def test_confidence_score():
+    frontrun, victim, backrun = sorted(
+        create_sandwich()[:3], key=lambda swap: swap.log_index
+    )
+    detector = SandwichDetector()
+
+    # Pattern, price impact, profit and same block, but a single victim
+    score = detector._calculate_confidence_score(frontrun, [victim], backrun)
+    assert str(score) == "0.9"
+
+    # Capped at 1.0 with several victims
+    score = detector._calculate_confidence_score(frontrun, [victim, victim], backrun)
+    assert str(score) == "1.0"
+
+    score = SandwichDetector(
+        min_price_impact=Decimal("10"), min_profit_threshold=Decimal("1000")
+    )._calculate_confidence_score(frontrun, [victim], backrun)
+    assert str(score) == "0.6"
+
+
+def test_sandwich_attack_gas_cost_counts_both_transactions():
+    swaps = create_sandwich()
+    swaps[0] = replace(swaps[0], gas_used=120000)  # backrun
+
+    attack = SandwichDetector().detect_sandwich_attacks_in_block(18000000, swaps)[0]
+
+    assert attack.gas_cost == Decimal(270000)
+    assert attack.net_profit == attack.profit_amount - Decimal(270000)
+
+
+def test_sandwich_attack_gas_cost_without_frontrun_gas():
+    swaps = create_sandwich()
+    swaps[1] = replace(swaps[1], gas_used=None)  # frontrun
+
+    attack = SandwichDetector().detect_sandwich_attacks_in_block(18000000, swaps)[0]
+
+    assert attack.gas_cost == Decimal(150000)
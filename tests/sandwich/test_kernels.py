@@ -0,0 +1,28 @@
+from mev_tools_py.sandwich._kernels import find_sandwich_triplets
+
+
+def test_find_sandwich_triplets():
+    # attacker 0 buys token 1 with token 0, victims trade around it, attacker sells
+    senders = [0, 1, 0, 2, 0]
+    token_in = [0, 0, 1, 1, 1]
+    token_out = [1, 1, 0, 0, 0]
+    blocks = [100] * 5
+
+    triplets = find_sandwich_triplets(senders, token_in, token_out, blocks, 1)
+
+    assert triplets == [(0, 2, [1]), (0, 4, [1, 3])]
+
+
+def test_find_sandwich_triplets_requires_victim():
+    assert find_sandwich_triplets([0, 0, 0], [0, 1, 1], [1, 0, 0], [1, 1, 1], 1) == []
+
+
+def test_find_sandwich_triplets_block_distance():
+    senders = [0, 1, 0]
+    token_in = [0, 0, 1]
+    token_out = [1, 1, 0]
+
+    assert find_sandwich_triplets(senders, token_in, token_out, [1, 1, 3], 1) == []
+    assert find_sandwich_triplets(senders, token_in, token_out, [1, 1, 3], 2) == [
+        (0, 2, [1])
+    ]
@@ -0,0 +1,73 @@
+from decimal import Decimal
+
+from mev_tools_py.dex.models import SwapEvent, TokenInfo
+from mev_tools_py.sandwich.utils import (
+    detect_potential_mev_addresses,
+    group_swaps_by_pool,
+    group_swaps_by_token_pair,
+)
+
+WETH = TokenInfo(address="0xWETH", symbol="WETH", decimals=18)
+USDC = TokenInfo(address="0xUSDC", symbol="USDC", decimals=6)
+DAI = TokenInfo(address="0xdai", symbol="DAI", decimals=18)
+
+
+def create_swap(
+    log_index: int,
+    pool_address: str,
+    token_in: TokenInfo = WETH,
+    token_out: TokenInfo = USDC,
+    trader: str = "0xTrader",
+) -> SwapEvent:
+    return SwapEvent(
+        tx_hash=f"0x{log_index}",
+        block_number=18000000,
+        log_index=log_index,
+        dex_protocol="uniswap_v2",
+        pool_address=pool_address,
+        trader=trader,
+        token_in=token_in,
+        token_out=token_out,
+        amount_in=Decimal("1"),
+        amount_out=Decimal("1"),
+    )
+
+
+def test_group_swaps_by_pool_merges_address_case():
+    swaps = [
+        create_swap(0, "0xPoolA"),
+        create_swap(1, "0xpoolb"),
+        create_swap(2, "0xpoola"),
+        create_swap(3, "0xPoolA"),
+    ]
+
+    groups = group_swaps_by_pool(swaps)
+
+    assert list(groups) == ["0xpoola", "0xpoolb"]
+    assert groups["0xpoola"] == [swaps[0], swaps[2], swaps[3]]
+    assert groups["0xpoolb"] == [swaps[1]]
+
+
+def test_group_swaps_by_token_pair_merges_directions():
+    swaps = [
+        create_swap(0, "0xpool", WETH, USDC),
+        create_swap(1, "0xpool", DAI, USDC),
+        create_swap(2, "0xpool", USDC, WETH),
+        create_swap(3, "0xpool", WETH, USDC),
+    ]
+
+    groups = group_swaps_by_token_pair(swaps)
+
+    assert list(groups) == [("0xusdc", "0xweth"), ("0xdai", "0xusdc")]
+    assert groups[("0xusdc", "0xweth")] == [swaps[0], swaps[2], swaps[3]]
+
+
+def test_detect_potential_mev_addresses_ignores_case():
+    swaps = [
+        create_swap(0, "0xpool", trader="0xBot"),
+        create_swap(1, "0xpool", trader="0xbot"),
+        create_swap(2, "0xpool", trader="0xBOT"),
+        create_swap(3, "0xpool", trader="0xuser"),
+    ]
+
+    assert detect_potential_mev_addresses(swaps) == {"0xbot"}